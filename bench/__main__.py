@@ -7,13 +7,121 @@ Usage:
     python -m bench fastapi             # Run specific framework
     python -m bench --test=complex      # Run specific test on all frameworks
     python -m bench fastapi --test=complex  # Run specific test on specific framework
+    python -m bench --parallel=4        # Run all benchmarks, 4 at a time on isolated cores
+    python -m bench --scaling           # Sweep worker counts 1, 2, 4, ... per framework
+    python -m bench --sweep-connections # Sweep wrk connections and find the saturation knee
+    python -m bench --open-loop         # Fixed-rate runs with corrected latency percentiles
+    python -m bench --driver=native     # Use the built-in load generator instead of wrk
+    python -m bench --calibrate         # Check the built-in generator saturates /ping
+    python -m bench --trials=5 --warmup=3s  # Repeated trials with confidence intervals
+    python -m bench --trials=5 --order=interleave  # ABAB... order with drift detection
+    python -m bench fastapi --profile   # Flamegraph + hottest functions under load
+    python -m bench compare             # Latest run vs the previous one, non-zero on regression
+    python -m bench fastapi --versions project fastapi==0.115.0  # Compare package versions
+    python -m bench --stacks            # uvicorn/hypercorn/granian x asyncio/uvloop x httptools/h11
+    python -m bench --scenarios         # Payload size and streaming scenarios (bodies, lists, NDJSON, SSE, files)
+    python -m bench --routing           # Throughput and startup vs number of registered routes
+    python -m bench --di                # Per-request DI overhead vs dependency depth and fan-out
+    python -m bench --middleware        # Cost per middleware layer, native vs pure ASGI
+    python -m bench --inproc            # ns and allocations per request, app called in-process
+    python -m bench --stages            # Time per request stage (routing, decode, DI, ...), in-process
+    python -m bench --coldstart         # Spawn-to-serving time, import breakdown, first requests
+    python -m bench --soak              # Hours below max RPS, flags memory/fd growth and throughput decay
+    python -m bench --gc                # GC freeze/threshold/disabled and mimalloc/jemalloc variants, GC pauses
 """
 
 import argparse
+import os
 import sys
+from pathlib import Path
 
-from bench.auto_bench import BenchmarkRunner, DATA_MANAGER, logger
-from bench.data_manager import FRAMEWORKS
+from msgspec.structs import replace
+
+from bench.auto_bench import BenchmarkRunner, DATA_MANAGER, format_result, logger
+from bench.coldstart import COLDSTART_REPEATS, COLDSTART_TESTS, FIRST_REQUESTS
+from bench.data_manager import (
+    FRAMEWORKS,
+    SERVER_HTTP,
+    BenchmarkConfig,
+    expand_stacks,
+    parse_duration,
+)
+from bench.envs import EnvCache
+from bench.gctune import DEFAULT_GC_VARIANTS, GC_THRESHOLD, GC_VARIANTS, gc_variants
+from bench.di import DI_DEPTHS, DI_VARIANTS, DI_WIDTHS
+from bench.history import compare_main
+from bench.inproc import INPROC_TESTS
+from bench.middleware import MIDDLEWARE_KINDS, MIDDLEWARE_LAYERS
+from bench.routing import ROUTE_COUNTS, ROUTE_KINDS
+from bench.scenarios import with_path
+from bench.scheduler import allocate_slots
+from bench.soak import SOAK_DURATION, SOAK_FRACTION, TRACEMALLOC_INTERVAL
+from bench.stats import find_ties
+
+
+PING_TEST = "ping"  # bare GET /ping, not one of the configured tests
+
+
+def ping_test(base: BenchmarkConfig) -> BenchmarkConfig:
+    """The `ping` test, on `base`'s host and load settings."""
+    return replace(
+        base,
+        bench_name=PING_TEST,
+        method="GET",
+        url=with_path(base.url, "/ping"),
+        data=None,
+        scenario=None,
+        mix=None,
+        workload=None,
+    )
+
+
+def int_list(value: str) -> list[int]:
+    """Parse a comma separated list of positive integers."""
+    try:
+        numbers = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated integers, got {value!r}")
+    if not numbers or any(n <= 0 for n in numbers):
+        raise argparse.ArgumentTypeError(f"expected positive integers, got {value!r}")
+    return numbers
+
+
+def count_list(value: str) -> list[int]:
+    """Parse a comma separated list of non-negative integers."""
+    try:
+        numbers = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated integers, got {value!r}")
+    if not numbers or any(n < 0 for n in numbers):
+        raise argparse.ArgumentTypeError(f"expected non-negative integers, got {value!r}")
+    return numbers
+
+
+def fraction_list(value: str) -> list[float]:
+    """Parse a comma separated list of fractions in (0, 1]."""
+    try:
+        numbers = [float(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma separated numbers, got {value!r}")
+    if not numbers or any(not 0 < n <= 1 for n in numbers):
+        raise argparse.ArgumentTypeError(f"expected fractions in (0, 1], got {value!r}")
+    return numbers
+
+
+def choice_list(choices: list[str]):
+    """Parser for a comma separated subset of `choices`."""
+
+    def parse(value: str) -> list[str]:
+        items = [item.strip() for item in value.split(",") if item.strip()]
+        unknown = [item for item in items if item not in choices]
+        if not items or unknown:
+            raise argparse.ArgumentTypeError(
+                f"expected a comma separated subset of {', '.join(choices)}, got {value!r}"
+            )
+        return items
+
+    return parse
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -28,12 +136,40 @@ Examples:
   python -m bench lihil              Run Lihil with all tests  
   python -m bench --test=complex       Run all frameworks with complex test
   python -m bench lihil --test=complex  Run Lihil with complex test
+  python -m bench --parallel=4         Run all benchmarks 4 at a time on disjoint cores
+  python -m bench lihil --scaling      Sweep Lihil over 1, 2, 4, ... workers
+  python -m bench --sweep-connections  Sweep connections, report RPS/p99 curves and knees
+  python -m bench --open-loop          Drive 25%..100% of max RPS at a constant rate
+  python -m bench --driver=native      Use the built-in asyncio/uvloop generator
+  python -m bench lihil --calibrate    Check the built-in generator saturates Lihil /ping
+  python -m bench --trials=5 --warmup=3s  5 measured trials after a discarded warmup
+  python -m bench --trials=5 --order=random  Shuffle framework x trial runs, report drift
+  python -m bench fastapi --test=complex --profile  Profile FastAPI under the complex test
+  python -m bench compare --baseline=<sha>  Compare the latest run against a commit's run
+  python -m bench fastapi --versions project fastapi==0.115.0,pydantic==2.9.2
+                                       FastAPI from the project env vs pinned versions
+  python -m bench --stacks --servers=uvicorn,granian --pythons=3.12,3.13
+                                       Server stack x interpreter matrix
+  python -m bench --scenarios --test=orders  Throughput vs JSON body size (1KB, 64KB, 1MB)
+  python -m bench --routing --route-kinds=param  RPS at the first/middle/last of 10..10000 routes
+  python -m bench --di --di-variants=sync,async-cached  DI overhead in us/request by depth
+  python -m bench --middleware --layers=0,10  Cost of 10 native/ASGI middleware layers
+  python -m bench --inproc --test=complex  Framework cost per request without network (CI)
+  python -m bench --stages --test=complex  Routing/decode/DI/handler/serialize time per framework
+  python -m bench --coldstart --coldstart-repeats=50  Cold start p50/p95 over 50 fresh processes
+  python -m bench fastapi --soak --test=complex --soak-duration=4h --tracemalloc
+                                       4h at half of max RPS, growth attributed to call sites
+  python -m bench --gc --test=complex --gc-variants=default,freeze --gc-threshold=10000,50,50
+                                       GC pause histograms and RPS/p99 per GC variant
 
 Available frameworks: """
         + ", ".join(sorted(FRAMEWORKS.keys()))
         + """
 Available tests: """
-        + ", ".join([b.bench_name for b in DATA_MANAGER.benchmarks]),
+        + ", ".join([PING_TEST, *(b.bench_name for b in DATA_MANAGER.benchmarks)])
+        + """
+Available scenarios: """
+        + ", ".join([s.bench_name for s in DATA_MANAGER.scenarios]),
     )
 
     # Optional positional argument for framework
@@ -48,8 +184,11 @@ Available tests: """
     # Optional keyword argument for test
     parser.add_argument(
         "--test",
-        choices=[b.bench_name for b in DATA_MANAGER.benchmarks],
-        help="Specific test to run (optional). If not provided, runs all tests.",
+        choices=[
+            PING_TEST,
+            *(b.bench_name for b in DATA_MANAGER.benchmarks + DATA_MANAGER.scenarios),
+        ],
+        help="Specific test or scenario to run (optional). If not provided, runs all tests.",
         metavar="TEST",
     )
 
@@ -64,6 +203,439 @@ Available tests: """
         "--list-tests", action="store_true", help="List all available tests and exit"
     )
 
+    parser.add_argument(
+        "--startup-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait for a server to answer before failing (default: 30)",
+        metavar="SECONDS",
+    )
+
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of framework/test pairs to run concurrently (default: 1)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--server-cores",
+        type=int,
+        default=2,
+        help="Cores pinned to each server in parallel mode (default: 2)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--client-cores",
+        type=int,
+        default=2,
+        help="Cores pinned to each wrk process in parallel mode (default: 2)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--base-port",
+        type=int,
+        default=8000,
+        help="First port handed out to parallel runs (default: 8000)",
+        metavar="PORT",
+    )
+
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="Sweep server worker/process counts and report scaling efficiency",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Largest worker count in --scaling mode (default: number of cores)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--sweep-connections",
+        action="store_true",
+        help="Sweep wrk connection counts and detect each framework's saturation point",
+    )
+
+    parser.add_argument(
+        "--connections",
+        type=int_list,
+        default=[1, 8, 32, 64, 256, 1024],
+        help="Connection counts for --sweep-connections (default: 1,8,32,64,256,1024)",
+        metavar="N,N,...",
+    )
+
+    parser.add_argument(
+        "--open-loop",
+        action="store_true",
+        help="Drive constant request rates (wrk2 or the built-in generator) below max RPS",
+    )
+
+    parser.add_argument(
+        "--rates",
+        type=fraction_list,
+        default=[0.25, 0.5, 0.75, 0.9, 1.0],
+        help="Target rates for --open-loop as fractions of max RPS (default: 0.25,0.5,0.75,0.9,1.0)",
+        metavar="F,F,...",
+    )
+
+    parser.add_argument(
+        "--driver",
+        choices=["auto", "wrk", "native"],
+        default="auto",
+        help="Load generator: wrk, the built-in asyncio/uvloop one, or auto "
+        "(wrk when on PATH, default)",
+    )
+
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="Check that the built-in generator saturates FRAMEWORK (default: lihil) on /ping",
+    )
+
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=None,
+        help="Measured trials per framework/test, reported with mean, stdev, "
+        "median and bootstrap 95%% CI (default: from test.json, 1)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--warmup",
+        default=None,
+        help="Discarded warmup run before the trials, e.g. 3s (default: from test.json, none)",
+        metavar="DURATION",
+    )
+
+    parser.add_argument(
+        "--order",
+        choices=["sequential", "interleave", "random"],
+        default=None,
+        help="Schedule framework x trial runs (fresh server per run) in this order, "
+        "recording CPU frequency/temperature and reporting drift",
+    )
+
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Random seed for --order=random",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Sample server stacks during the measured runs and write collapsed stacks, "
+        "an SVG flamegraph and a hottest-functions table under bench_results/profiles/",
+    )
+
+    parser.add_argument(
+        "--profiler",
+        choices=["auto", "py-spy", "signal"],
+        default="auto",
+        help="Profiling backend: py-spy, the launcher's signal sampler, or auto "
+        "(py-spy when on PATH, default)",
+    )
+
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Hottest functions listed per profile (default: 20)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--versions",
+        nargs="+",
+        default=None,
+        help="Version matrix: one cached uv env per spec of comma separated pins, "
+        "'project' for the project env; deltas are against the first spec",
+        metavar="SPEC",
+    )
+
+    parser.add_argument(
+        "--env-python",
+        default=None,
+        help="Python version for --versions envs, e.g. 3.13 (default: uv's choice)",
+        metavar="VERSION",
+    )
+
+    parser.add_argument(
+        "--wheels",
+        type=Path,
+        default=None,
+        help="Directory of local wheels offered to --versions/--pythons envs",
+        metavar="DIR",
+    )
+
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Build --versions/--pythons envs from --wheels only, without a package index",
+    )
+
+    parser.add_argument(
+        "--scenarios",
+        action="store_true",
+        help="Run the parameterized scenarios of test.json (nested order bodies, "
+        "list responses, invalid payloads, streams, downloads) once per size; "
+        "--test picks one",
+    )
+
+    parser.add_argument(
+        "--routing",
+        action="store_true",
+        help="Build each app with a generated table of --route-counts routes and "
+        "measure startup time and RPS on its first, middle and last route",
+    )
+
+    parser.add_argument(
+        "--route-counts",
+        type=int_list,
+        default=ROUTE_COUNTS,
+        help="Route table sizes for --routing (default: 10,100,1000,10000)",
+        metavar="N,N,...",
+    )
+
+    parser.add_argument(
+        "--route-kinds",
+        type=choice_list(list(ROUTE_KINDS)),
+        default=list(ROUTE_KINDS),
+        help="Route tables for --routing: static paths, {id} parameters or both "
+        "alternating (default: static,param,mixed)",
+        metavar="K,K,...",
+    )
+
+    parser.add_argument(
+        "--di",
+        action="store_true",
+        help="Measure per-request dependency injection overhead as --di-depths "
+        "nested dependencies x --di-widths chains (lihil, fastapi, litestar, blacksheep)",
+    )
+
+    parser.add_argument(
+        "--di-depths",
+        type=count_list,
+        default=DI_DEPTHS,
+        help="Dependency chain lengths for --di, 0 is the baseline (default: 0,1,2,5,10)",
+        metavar="N,N,...",
+    )
+
+    parser.add_argument(
+        "--di-widths",
+        type=int_list,
+        default=DI_WIDTHS,
+        help="Chains the --di handler depends on (default: 1,4)",
+        metavar="N,N,...",
+    )
+
+    parser.add_argument(
+        "--di-variants",
+        type=choice_list(list(DI_VARIANTS)),
+        default=list(DI_VARIANTS),
+        help="Factories for --di: sync or async, built per request or once "
+        "(-cached) (default: sync,async,sync-cached,async-cached)",
+        metavar="V,V,...",
+    )
+
+    parser.add_argument(
+        "--middleware",
+        action="store_true",
+        help="Stack --layers equivalent middleware on each app, natively and as pure "
+        "ASGI, and report the marginal RPS/latency cost per layer",
+    )
+
+    parser.add_argument(
+        "--layers",
+        type=count_list,
+        default=MIDDLEWARE_LAYERS,
+        help="Middleware stack depths for --middleware (default: 0,1,5,10)",
+        metavar="N,N,...",
+    )
+
+    parser.add_argument(
+        "--middleware-kinds",
+        type=choice_list(list(MIDDLEWARE_KINDS)),
+        default=list(MIDDLEWARE_KINDS),
+        help="Middleware for --middleware: the framework's own API and/or pure ASGI "
+        "(default: native,asgi)",
+        metavar="K,K,...",
+    )
+
+    parser.add_argument(
+        "--inproc",
+        action="store_true",
+        help="Call each ASGI app in-process with pre-built requests and report time "
+        "and allocations per request for /ping and complex (or --test); no server, "
+        "ports or load generator, exits non-zero on failure",
+    )
+
+    parser.add_argument(
+        "--stages",
+        action="store_true",
+        help="Like --inproc, with timers on each framework's routing, body decoding, "
+        "DI, handler and serialization: per-stage time per request and the timers' "
+        "measured overhead",
+    )
+
+    parser.add_argument(
+        "--inproc-requests",
+        type=int,
+        default=20_000,
+        help="Requests per timed round for --inproc/--stages (default: 20000)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--inproc-rounds",
+        type=int,
+        default=5,
+        help="Timed rounds for --inproc/--stages, the median is reported (default: 5)",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--coldstart",
+        action="store_true",
+        help="Start each server from scratch repeatedly: spawn-to-first-response time "
+        "(p50/p95), interpreter/import/app construction breakdown, heaviest imports "
+        "and first-request vs steady-state latency for /ping (or --test)",
+    )
+
+    parser.add_argument(
+        "--coldstart-repeats",
+        type=int,
+        default=COLDSTART_REPEATS,
+        help=f"Fresh server processes per framework for --coldstart (default: {COLDSTART_REPEATS})",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--first-requests",
+        type=int,
+        default=FIRST_REQUESTS,
+        help="Requests after startup reported one by one for --coldstart "
+        f"(default: {FIRST_REQUESTS})",
+        metavar="N",
+    )
+
+    parser.add_argument(
+        "--soak",
+        action="store_true",
+        help="Drive each framework for hours at a fraction of its max RPS with the "
+        "built-in generator; per-second RPS/latency, RSS and open fds over time, "
+        "exits non-zero on memory/fd growth or throughput decay",
+    )
+
+    parser.add_argument(
+        "--soak-duration",
+        type=parse_duration,
+        default=SOAK_DURATION,
+        help=f"Length of each --soak run, e.g. 30m, 4h (default: {SOAK_DURATION})",
+        metavar="DURATION",
+    )
+
+    parser.add_argument(
+        "--soak-rate",
+        type=float,
+        default=SOAK_FRACTION,
+        help=f"Load of --soak as a fraction of the closed-loop max RPS (default: {SOAK_FRACTION})",
+        metavar="FRACTION",
+    )
+
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="With --soak, snapshot the server's allocations with tracemalloc and "
+        "report the call sites that grew the most (slows the server down)",
+    )
+
+    parser.add_argument(
+        "--tracemalloc-interval",
+        type=parse_duration,
+        default=TRACEMALLOC_INTERVAL,
+        help="Time between tracemalloc snapshots "
+        f"(default: {TRACEMALLOC_INTERVAL / 60:.0f}m)",
+        metavar="DURATION",
+    )
+
+    parser.add_argument(
+        "--gc",
+        action="store_true",
+        help="Benchmark every framework under bench/launcher.py once per GC/allocator "
+        "variant, with collections and pause histograms per generation",
+    )
+
+    parser.add_argument(
+        "--gc-variants",
+        type=choice_list(list(GC_VARIANTS)),
+        default=DEFAULT_GC_VARIANTS,
+        help="Variants for --gc, the first is the baseline; allocators that are not "
+        "installed are skipped, malloc is glibc malloc instead of pymalloc and the "
+        "baseline of the allocators, added when missing "
+        f"(default: {','.join(DEFAULT_GC_VARIANTS)})",
+        metavar="V,V,...",
+    )
+
+    parser.add_argument(
+        "--gc-threshold",
+        type=count_list,
+        default=GC_THRESHOLD,
+        help="gc.set_threshold() of the threshold variant "
+        f"(default: {','.join(str(n) for n in GC_THRESHOLD)})",
+        metavar="N,N,N",
+    )
+
+    parser.add_argument(
+        "--stacks",
+        action="store_true",
+        help="Serve every app with each server x loop x HTTP parser combination "
+        "(and each --pythons interpreter), results keyed by stack",
+    )
+
+    parser.add_argument(
+        "--servers",
+        type=choice_list(list(SERVER_HTTP)),
+        default=list(SERVER_HTTP),
+        help="ASGI servers for --stacks (default: uvicorn,hypercorn,granian)",
+        metavar="S,S,...",
+    )
+
+    parser.add_argument(
+        "--loops",
+        type=choice_list(["uvloop", "asyncio"]),
+        default=["uvloop", "asyncio"],
+        help="Event loops for --stacks (default: uvloop,asyncio)",
+        metavar="L,L,...",
+    )
+
+    parser.add_argument(
+        "--http",
+        type=choice_list(["httptools", "h11"]),
+        default=["httptools", "h11"],
+        help="uvicorn HTTP parsers for --stacks (default: httptools,h11); hypercorn "
+        "always uses h11 and granian its own parser",
+        metavar="H,H,...",
+    )
+
+    parser.add_argument(
+        "--pythons",
+        type=lambda value: [item.strip() for item in value.split(",") if item.strip()],
+        default=None,
+        help="Interpreters for --stacks, one cached uv env each, e.g. 3.12,3.13,3.13t "
+        "(default: the project env)",
+        metavar="V,V,...",
+    )
+
     parser.add_argument(
         "--verbose", "-v", action="store_true", help="Enable verbose logging"
     )
@@ -73,6 +645,9 @@ Available tests: """
 
 def main():
     """Main CLI entry point."""
+    if sys.argv[1:2] == ["compare"]:
+        sys.exit(compare_main(sys.argv[2:], DATA_MANAGER.history_path))
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -86,29 +661,186 @@ def main():
 
     if args.list_tests:
         print("Available tests:")
+        print(f"  {PING_TEST}")
         for benchmark in DATA_MANAGER.benchmarks:
             print(f"  {benchmark.bench_name}")
+        print("Available scenarios (--scenarios):")
+        for scenario_config in DATA_MANAGER.scenarios:
+            scenario = scenario_config.scenario
+            sizes = ", ".join(str(size) for size in scenario.sizes)
+            print(f"  {scenario_config.bench_name:<16} {scenario.kind} at sizes {sizes}")
         return
 
+    if args.parallel > 1 and (args.framework or args.test):
+        parser.error("--parallel runs the full matrix and cannot be combined with FRAMEWORK or --test")
+    if args.parallel > 1 and (
+        args.scaling
+        or args.sweep_connections
+        or args.open_loop
+        or args.order
+        or args.profile
+        or args.versions
+        or args.stacks
+        or args.scenarios
+        or args.routing
+        or args.di
+        or args.middleware
+        or args.inproc
+        or args.stages
+        or args.coldstart
+        or args.soak
+        or args.gc
+    ):
+        parser.error("sweeps need the whole machine and cannot be combined with --parallel")
+    if args.coldstart and (args.coldstart_repeats < 1 or args.first_requests < 1):
+        parser.error("--coldstart-repeats and --first-requests must be at least 1")
+    if args.soak and not 0 < args.soak_rate <= 1:
+        parser.error("--soak-rate is a fraction of max RPS, in (0, 1]")
+    if args.gc and not 1 <= len(args.gc_threshold) <= 3:
+        parser.error("--gc-threshold takes one to three thresholds")
+
     # Set up logging level
     if args.verbose:
         import logging
 
         logging.getLogger().setLevel(logging.DEBUG)
 
+    # Apply trial settings to every test
+    if args.trials is not None or args.warmup is not None:
+        overrides = {}
+        if args.trials is not None:
+            overrides["trials"] = args.trials
+        if args.warmup is not None:
+            overrides["warmup"] = args.warmup
+        DATA_MANAGER.benchmarks = [replace(b, **overrides) for b in DATA_MANAGER.benchmarks]
+        DATA_MANAGER.scenarios = [replace(s, **overrides) for s in DATA_MANAGER.scenarios]
+
     # Create benchmark runner
-    runner = BenchmarkRunner(DATA_MANAGER)
+    runner = BenchmarkRunner(
+        DATA_MANAGER, startup_timeout=args.startup_timeout, driver=args.driver
+    )
+
+    envs = EnvCache(
+        DATA_MANAGER.project_root.parent / ".bench_envs",
+        DATA_MANAGER.project_root.parent / "pyproject.toml",
+        wheels=args.wheels,
+        offline=args.offline,
+    )
 
     # Determine what to run
-    if args.framework and args.test:
+    framework_keys = [args.framework] if args.framework else list(FRAMEWORKS.keys())
+    # `ping` runs only when asked for, it is the default of the in-process
+    # and cold-start modes
+    ping = ping_test(DATA_MANAGER.benchmarks[0])
+    tests = {b.bench_name: b for b in [ping, *DATA_MANAGER.benchmarks]}
+    if args.test is None:
+        benchmarks = list(DATA_MANAGER.benchmarks)
+    else:
+        benchmarks = [tests[args.test]] if args.test in tests else []
+    scenario_configs = [s for s in DATA_MANAGER.scenarios if args.test in (None, s.bench_name)]
+
+    if args.calibrate:
+        calibration = benchmarks[0] if benchmarks else DATA_MANAGER.benchmarks[0]
+        saturated = runner.calibrate(
+            args.framework or "lihil", calibration.threads, calibration.connections
+        )
+        sys.exit(0 if saturated else 1)
+
+    elif args.routing:
+        routing_base = benchmarks[0] if benchmarks else DATA_MANAGER.benchmarks[0]
+        runner.run_routing_benchmarks(
+            framework_keys, routing_base, sorted(args.route_counts), args.route_kinds
+        )
+
+    elif args.di:
+        di_base = benchmarks[0] if benchmarks else DATA_MANAGER.benchmarks[0]
+        runner.run_di_benchmarks(
+            framework_keys,
+            di_base,
+            sorted(set(args.di_depths)),
+            args.di_widths,
+            args.di_variants,
+        )
+
+    elif args.middleware:
+        middleware_base = benchmarks[0] if benchmarks else DATA_MANAGER.benchmarks[0]
+        runner.run_middleware_benchmarks(
+            framework_keys, middleware_base, sorted(set(args.layers)), args.middleware_kinds
+        )
+
+    elif args.inproc or args.stages:
+        names = [args.test] if args.test else INPROC_TESTS
+        passed = runner.run_inproc_benchmarks(
+            framework_keys,
+            [tests[name] for name in names if name in tests],
+            args.inproc_requests,
+            args.inproc_rounds,
+            stages=args.stages,
+        )
+        sys.exit(0 if passed else 1)
+
+    elif args.coldstart:
+        names = [args.test] if args.test else COLDSTART_TESTS
+        passed = runner.run_coldstart_benchmarks(
+            framework_keys,
+            [tests[name] for name in names if name in tests],
+            args.coldstart_repeats,
+            args.first_requests,
+        )
+        sys.exit(0 if passed else 1)
+
+    elif args.soak:
+        passed = runner.run_soak_benchmarks(
+            framework_keys,
+            benchmarks,
+            args.soak_duration,
+            args.soak_rate,
+            args.tracemalloc_interval if args.tracemalloc else None,
+        )
+        sys.exit(0 if passed else 1)
+
+    elif args.gc:
+        variants = gc_variants(args.gc_variants, args.gc_threshold)
+        if not variants:
+            parser.error("none of --gc-variants can run here")
+        runner.run_gc_matrix(framework_keys, benchmarks, variants)
+
+    elif args.scenarios or (args.test and scenario_configs):
+        runner.run_scenario_benchmarks(framework_keys, scenario_configs)
+
+    elif args.versions:
+        runner.run_version_matrix(
+            framework_keys, benchmarks, args.versions, envs, python=args.env_python
+        )
+
+    elif args.stacks:
+        stacks = expand_stacks(args.servers, args.loops, args.http)
+        runner.run_stack_matrix(framework_keys, benchmarks, stacks, envs, args.pythons)
+
+    elif args.profile:
+        runner.run_profiles(framework_keys, benchmarks, args.profiler, args.profile_top)
+
+    elif args.order:
+        runner.run_scheduled_benchmarks(framework_keys, benchmarks, args.order, args.seed)
+
+    elif args.scaling:
+        runner.run_scaling_benchmarks(framework_keys, benchmarks, args.max_workers)
+
+    elif args.sweep_connections:
+        runner.run_connection_benchmarks(framework_keys, benchmarks, sorted(args.connections))
+
+    elif args.open_loop:
+        runner.run_open_loop_benchmarks(framework_keys, benchmarks, sorted(args.rates))
+
+    elif args.framework and args.test:
         # Run specific framework with specific test
         logger.info(f"Running {args.framework} with {args.test} test")
         # Find the benchmark config
-        benchmark_config = next((b for b in DATA_MANAGER.benchmarks if b.bench_name == args.test), None)
+        benchmark_config = tests.get(args.test)
         if benchmark_config:
-            rps = runner.benchmark_framework(args.framework, benchmark_config)
-            if rps:
-                logger.info(f"Result: {rps:.2f} RPS")
+            result = runner.benchmark_framework(args.framework, benchmark_config)
+            if result:
+                logger.info(f"Result: {format_result(result)}")
             else:
                 logger.error("Benchmark failed")
                 sys.exit(1)
@@ -124,9 +856,9 @@ def main():
             logger.info(f"Running {benchmark_config.bench_name} test on {args.framework}")
             logger.info(f"{'='*50}")
 
-            rps = runner.benchmark_framework(args.framework, benchmark_config)
-            if rps:
-                logger.info(f" {benchmark_config.bench_name}: {rps:.2f} RPS")
+            result = runner.benchmark_framework(args.framework, benchmark_config)
+            if result:
+                logger.info(f" {benchmark_config.bench_name}: {format_result(result)}")
             else:
                 logger.warning(f" {benchmark_config.bench_name}: Failed")
 
@@ -135,27 +867,40 @@ def main():
         logger.info(f"Running all frameworks with {args.test} test")
 
         # Find the benchmark config
-        benchmark_config = next((b for b in DATA_MANAGER.benchmarks if b.bench_name == args.test), None)
+        benchmark_config = tests.get(args.test)
         if not benchmark_config:
             logger.error(f"Test '{args.test}' not found")
             sys.exit(1)
 
         framework_results = []
         for framework_key in FRAMEWORKS.keys():
-            rps = runner.benchmark_framework(framework_key, benchmark_config)
+            result = runner.benchmark_framework(framework_key, benchmark_config)
             framework_config = FRAMEWORKS[framework_key]
-            if rps is not None:
-                framework_results.append((framework_config.name, rps))
-                logger.info(f"✓ {framework_config.name}: {rps:.2f} RPS")
+            if result is not None:
+                framework_results.append(result)
+                logger.info(f"✓ {framework_config.name}: {format_result(result)}")
             else:
                 logger.warning(f"✗ {framework_config.name}: Failed")
 
         # Show sorted results
         if framework_results:
             logger.info(f"\n{args.test.capitalize()} test results (sorted by RPS):")
-            framework_results.sort(key=lambda x: x[1], reverse=True)
-            for framework, rps in framework_results:
-                logger.info(f"  {framework}: {rps:.2f} RPS")
+            framework_results.sort(key=lambda x: x.rps, reverse=True)
+            for result in framework_results:
+                logger.info(f"  {result.framework}: {format_result(result)}")
+            for a, b in find_ties(framework_results):
+                logger.info(f"  ≈ {a} and {b} are statistically tied (overlapping CIs)")
+
+    elif args.parallel > 1:
+        # Run all frameworks with all tests, several at a time on disjoint cores
+        try:
+            slots = allocate_slots(
+                args.parallel, args.server_cores, args.client_cores, args.base_port
+            )
+        except ValueError as e:
+            logger.error(f"Cannot schedule parallel runs: {e}")
+            sys.exit(1)
+        runner.run_parallel_benchmarks(slots)
 
     else:
         # Run all frameworks with all tests (default behavior)
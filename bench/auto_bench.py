@@ -6,27 +6,71 @@ Automated benchmarking script for Python ASGI web frameworks.
 This script:
 1. Starts each web framework server
 2. Runs wrk benchmark against it
-3. Parses the results and extracts RPS
+3. Parses the wrk summary (RPS, latency percentiles, error counters)
 4. Updates the results in make_graph.py
 5. Generates updated graphs
 """
 
 import logging
-import re
+import math
+import os
+import random
+import shutil
+import statistics
 import subprocess
+import tempfile
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Sequence
+from urllib.parse import urlsplit
 
+from msgspec import Struct
+from msgspec.structs import replace
+from msgspec.json import decode, encode
+
+from . import coldstart, di, gctune, loadgen, middleware, routing, scenarios, soak
 from .data_manager import (
     FRAMEWORKS,
     BenchmarkConfig,
     BenchmarkResults,
+    ColdStartStats,
     DataManager,
+    DriftReport,
     FrameWorkConfig,
     FrameworkResult,
+    GcStats,
+    InprocStats,
     NonASGIConfig,
+    ResourceUsage,
+    RunSample,
+    SecondStats,
+    ServerStack,
+    SoakReport,
+    StageBreakdown,
+    SweepPoint,
+    WRK_SUMMARY_MARKER,
+    WrkSummary,
+)
+from .envs import PROJECT_SPEC, EnvCache, EnvSpec
+from .inproc import INPROC_MARKER, INPROC_PATH
+from .procfs import ResourceSampler, ResourceSeries, cpu_seconds, process_tree
+from .profiler import PySpyProfiler, SignalProfiler, pyspy_available, write_profile
+from .readiness import (
+    ServerNotReady,
+    is_port_free,
+    probe_http,
+    wait_for_port_free,
+    wait_until_ready,
+)
+from .scheduler import CoreSlot, ParallelScheduler, pin_command
+from .stats import (
+    detect_drift,
+    find_saturation_point,
+    find_ties,
+    overhead_us,
+    summarize_trials,
 )
+from .sysinfo import read_cpu_freq_mhz, read_cpu_temp_c
 
 # Configure logging
 logging.basicConfig(
@@ -38,13 +82,344 @@ logger = logging.getLogger(__name__)
 # Initialize data manager
 project_root = Path(__file__).parent
 DATA_MANAGER = DataManager(project_root, "tests", "benchmark_results.json", "test.json")
+# profiles and other per-run artifacts
+RESULTS_DIR = project_root.parent / "bench_results"
+
+
+def aggregate_trials(framework: str, summaries: list[WrkSummary]) -> FrameworkResult:
+    """Fold repeated trials into one result, see `combine_results`."""
+    return combine_results(
+        [FrameworkResult.from_summary(framework, summary) for summary in summaries]
+    )
+
+
+def combine_results(results: list[FrameworkResult]) -> FrameworkResult:
+    """Fold repeated single-trial results of one framework into one result.
+
+    `rps` is the mean across trials; latency, errors and transfer rate come
+    from the trial with the median RPS.
+    """
+    ordered = sorted(results, key=lambda result: result.rps)
+    combined = replace(ordered[len(ordered) // 2])
+    if len(results) > 1:
+        combined.trials = summarize_trials([result.rps for result in results])
+        combined.rps = combined.trials.mean
+    return combined
+
+
+def format_drift(drift: DriftReport) -> str:
+    """One-line human readable summary of session drift."""
+    text = f"session drift: normalized RPS {drift.rps_change:+.1%} first -> last run"
+    if drift.cpu_mhz_change is not None:
+        text += f", cpu {drift.cpu_mhz_change:+.0f}MHz"
+    if drift.temp_c_change is not None:
+        text += f", temp {drift.temp_c_change:+.1f}°C"
+    if drift.drifting:
+        text += " (drift detected, compare results with care)"
+    return text
+
+
+def schedule_runs(
+    framework_keys: list[str], trials: int, order: str, seed: Optional[int] = None
+) -> list[tuple[str, int]]:
+    """`(framework_key, trial)` pairs in execution order."""
+    if order == "sequential":
+        return [(key, trial) for key in framework_keys for trial in range(trials)]
+    plan = [(key, trial) for trial in range(trials) for key in framework_keys]
+    if order == "interleave":
+        return plan
+    if order == "random":
+        random.Random(seed).shuffle(plan)
+        return plan
+    raise ValueError(f"unknown run order {order!r}")
+
+
+def format_result(result: FrameworkResult) -> str:
+    """One-line human readable summary of a framework result."""
+    if result.coldstart is not None:
+        return format_coldstart(result.coldstart)
+    text = f"{result.rps:.2f} RPS"
+    if result.trials is not None:
+        trials = result.trials
+        text += (
+            f" (±{trials.stdev:.2f}, median {trials.median:.2f}, "
+            f"{trials.confidence:.0%} CI {trials.ci_low:.2f}-{trials.ci_high:.2f}, "
+            f"n={len(trials.samples)})"
+        )
+    if result.latency is not None:
+        lat = result.latency
+        text += (
+            f" | p50 {lat.p50 / 1000:.2f}ms p90 {lat.p90 / 1000:.2f}ms"
+            f" p99 {lat.p99 / 1000:.2f}ms p99.9 {lat.p999 / 1000:.2f}ms"
+        )
+    if result.errors is not None:
+        text += (
+            f" | socket errors {result.errors.socket_errors}"
+            f" non-2xx {result.errors.status}"
+        )
+    if result.transfer_per_sec is not None:
+        text += f" | {result.transfer_per_sec / 1024 / 1024:.2f}MB/s"
+    if result.ttfb is not None:
+        text += f" | TTFB p50 {result.ttfb.p50 / 1000:.2f}ms p99 {result.ttfb.p99 / 1000:.2f}ms"
+    if result.resources is not None:
+        text += f" | {format_resources(result.resources)}"
+    if result.startup_ms is not None:
+        text += f" | ready in {result.startup_ms:.0f}ms"
+    if result.inproc is not None:
+        text += f" | {format_inproc(result.inproc)}"
+    if result.stages is not None:
+        text += f" | {format_stages(result.stages)}"
+    if result.soak is not None:
+        text += f" | {format_soak(result.soak)}"
+    return text
+
+
+def format_inproc(stats: InprocStats) -> str:
+    """Time and memory per request of an in-process run."""
+    text = (
+        f"{stats.ns_per_request / 1000:.2f}us/request "
+        f"(harness {stats.harness_ns / 1000:.2f}us), "
+        f"{stats.alloc_bytes / 1024:.1f}KB peak alloc, "
+        f"{stats.retained_blocks:.3f} blocks retained/request"
+    )
+    if stats.non_2xx:
+        text += f", {stats.non_2xx} non-2xx"
+    return text
+
+
+def format_stages(breakdown: StageBreakdown) -> str:
+    """Mean time and share of each request stage, and what timing them cost."""
+    total = sum(stage.mean_ns for stage in breakdown.stages) or 1.0
+    text = ", ".join(
+        f"{stage.stage} {stage.mean_ns / 1000:.2f}us ({stage.mean_ns / total:.0%})"
+        for stage in breakdown.stages
+    )
+    if breakdown.overhead_ns is not None:
+        per_call = breakdown.overhead_ns / breakdown.hook_calls if breakdown.hook_calls else 0.0
+        text += (
+            f" | instrumentation {breakdown.overhead_ns / 1000:+.2f}us/request "
+            f"({breakdown.hook_calls:.0f} timer calls, {per_call:+.0f}ns each)"
+        )
+    return text
+
+
+def format_coldstart(stats: ColdStartStats) -> str:
+    """Spawn-to-serving time, where it goes, first vs steady-state latency and
+    the heaviest imports."""
+    app = f", app {stats.app_ms:.0f}ms" if stats.app_ms is not None else ""
+    text = (
+        f"cold start p50 {stats.ready_ms_p50:.0f}ms p95 {stats.ready_ms_p95:.0f}ms "
+        f"(python {stats.interpreter_ms:.0f}ms, imports {stats.import_ms:.0f}ms{app}, "
+        f"n={stats.repeats})"
+    )
+    if stats.first_us:
+        text += f" | 1st request {stats.first_us[0] / 1000:.2f}ms"
+    if len(stats.first_us) > 1:
+        text += (
+            f", 2nd-{len(stats.first_us)}th median "
+            f"{statistics.median(stats.first_us[1:]) / 1000:.2f}ms"
+        )
+    text += f", steady {stats.steady_us / 1000:.2f}ms"
+    if stats.imports:
+        text += " | top imports: " + ", ".join(
+            f"{cost.package} {cost.self_ms:.0f}ms" for cost in stats.imports[:5]
+        )
+    return text
+
+
+def format_soak(report: SoakReport) -> str:
+    """Load, trends and what got flagged over a soak run."""
+    text = (
+        f"soak {report.seconds / 3600:.1f}h at {report.target_rps} req/s "
+        f"({report.target_rps / report.max_rps:.0%} of max)"
+    )
+    if report.resources:
+        # fitted over the steady part, raw samples swing with load and GC
+        text += (
+            f" | RSS {report.rss_mb_start:.0f}->{report.rss_mb_end:.0f}MB "
+            f"({report.rss_mb_per_hour:+.1f}MB/h), "
+            f"fds {report.fds_start:.0f}->{report.fds_end:.0f} ({report.fds_per_hour:+.1f}/h)"
+        )
+    text += f" | RPS {report.rps_change:+.1%}, p99 {report.p99_change:+.1%} over the run"
+    flags = [
+        name
+        for name, flagged in (
+            ("memory growth", report.memory_growth),
+            ("fd growth", report.fd_growth),
+            ("throughput decay", report.throughput_decay),
+        )
+        if flagged
+    ]
+    if flags:
+        text += f" | FLAGGED: {', '.join(flags)}"
+    if report.allocations:
+        top = report.allocations[0]
+        text += f" | top growth {top.size_diff_kb:+.0f}KB at {top.site.split(' <- ')[0]}"
+    return text
+
+
+def format_gc(stats: GcStats) -> str:
+    """Collections and pauses per generation over the measured window."""
+    parts = []
+    for generation in stats.generations:
+        if not generation.collections:
+            parts.append(f"gen{generation.generation} -")
+            continue
+        p99 = gctune.pause_percentile(generation, stats.bounds_us, 99)
+        parts.append(
+            f"gen{generation.generation} {generation.collections}x "
+            f"{generation.pause_ms:.1f}ms (p99 <={p99 / 1000:.2f}ms, "
+            f"max {generation.max_pause_us / 1000:.2f}ms)"
+        )
+    text = f"GC {', '.join(parts)} | {gctune.paused_share(stats):.2%} of the window paused"
+    if stats.frozen:
+        text += f", {stats.frozen} objects frozen"
+    return text
+
+
+def format_gc_histogram(stats: GcStats) -> list[str]:
+    """Collections per pause bucket, one line per generation that collected."""
+    labels = [f"<={bound / 1000:g}ms" for bound in stats.bounds_us]
+    labels.append(f">{stats.bounds_us[-1] / 1000:g}ms")
+    lines = []
+    for generation in stats.generations:
+        if not generation.collections:
+            continue
+        buckets = [
+            f"{label} {count}"
+            for label, count in zip(labels, generation.histogram)
+            if count
+        ]
+        lines.append(f"gen{generation.generation}: {', '.join(buckets)}")
+    return lines
+
+
+def format_resources(usage: ResourceUsage) -> str:
+    """Server CPU and memory footprint, next to RPS in `format_result`."""
+    text = f"cpu user {usage.user_cpu_s:.2f}s sys {usage.sys_cpu_s:.2f}s"
+    if usage.cpu_us_per_request is not None:
+        text += f" ({usage.cpu_us_per_request:.1f}µs/req)"
+    text += f", rss {usage.steady_rss_mb:.1f}MB (peak {usage.peak_rss_mb:.1f}MB"
+    if usage.mb_per_worker is not None:
+        text += f", {usage.mb_per_worker:.1f}MB x {usage.workers} worker(s)"
+    text += (
+        f"), {usage.threads} threads, ctx switches "
+        f"{usage.voluntary_ctx_switches}/{usage.involuntary_ctx_switches}"
+    )
+    return text
+
+
+def format_point(point: SweepPoint, unit: str) -> str:
+    """One-line human readable summary of a sweep point."""
+    text = f"{point.value:>6} {unit}: {point.rps:>10.2f} RPS"
+    if point.latency is not None:
+        text += f" | p99 {point.latency.p99 / 1000:.2f}ms"
+    if point.efficiency is not None:
+        text += f" | efficiency {point.efficiency:.0%}"
+    if point.bytes_per_sec is not None:
+        text += f" | {point.bytes_per_sec / 1024 / 1024:.2f}MB/s"
+    if point.ttfb is not None:
+        text += f" | TTFB p50 {point.ttfb.p50 / 1000:.2f}ms p99 {point.ttfb.p99 / 1000:.2f}ms"
+    if point.resources is not None:
+        usage = point.resources
+        text += f" | peak RSS {usage.peak_rss_mb:.0f}MB"
+        if usage.start_rss_mb is not None:
+            text += f" (+{usage.peak_rss_mb - usage.start_rss_mb:.0f}MB)"
+    if point.overhead_us is not None:
+        text += f" | {point.overhead_us:+.1f}us/request"
+    if point.startup_ms is not None:
+        text += f" | startup {point.startup_ms:.0f}ms"
+    if point.errors is not None and point.errors.status:
+        text += f" | {point.errors.status} non-2xx"
+    return text
+
+
+def format_variant(result: FrameworkResult, baseline: Optional[FrameworkResult]) -> str:
+    """One matrix cell, with RPS and p99 deltas against the baseline variant."""
+    text = f"{result.variant}: {result.rps:.2f} RPS"
+    if baseline is not None and baseline is not result and baseline.rps:
+        text += f" ({(result.rps - baseline.rps) / baseline.rps:+.1%})"
+    if result.latency is not None:
+        text += f" | p99 {result.latency.p99 / 1000:.2f}ms"
+        if (
+            baseline is not None
+            and baseline is not result
+            and baseline.latency is not None
+            and baseline.latency.p99
+        ):
+            change = (result.latency.p99 - baseline.latency.p99) / baseline.latency.p99
+            text += f" ({change:+.1%})"
+    if baseline is result:
+        text += " (baseline)"
+    if result.gc is not None:
+        text += f" | {format_gc(result.gc)}"
+    return text
+
+
+def matrix_baseline(
+    results: list[FrameworkResult],
+    result: FrameworkResult,
+    baselines: Optional[dict[str, str]] = None,
+) -> Optional[FrameworkResult]:
+    """Result `result` is compared against, among one framework's `results`:
+    the variant `baselines` names for it, else the first one. None when the
+    named variant was not measured."""
+    name = (baselines or {}).get(result.variant or "")
+    if name is None:
+        return results[0]
+    return next((other for other in results if other.variant == name), None)
+
+
+def matrix_effects(
+    results: list[FrameworkResult], baselines: Optional[dict[str, str]] = None
+) -> dict[str, float]:
+    """Mean relative RPS change of each variant against its baseline variant
+    (see `matrix_baseline`) per framework, averaged across frameworks
+    (geometric mean of ratios)."""
+    by_framework: dict[str, list[FrameworkResult]] = {}
+    for result in results:
+        by_framework.setdefault(result.framework, []).append(result)
+    ratios: dict[str, list[float]] = {}
+    for result in results:
+        baseline = matrix_baseline(by_framework[result.framework], result, baselines)
+        if baseline is not None and baseline.rps and result.rps and result.variant is not None:
+            ratios.setdefault(result.variant, []).append(result.rps / baseline.rps)
+    return {
+        variant: math.exp(sum(math.log(r) for r in values) / len(values)) - 1
+        for variant, values in ratios.items()
+    }
+
+
+def resolve_driver(driver: str) -> str:
+    """Pick the load driver, falling back to the built-in one without wrk."""
+    if driver not in ("auto", "wrk", "native"):
+        raise ValueError(f"unknown driver {driver!r}")
+    if driver == "auto":
+        driver = "wrk" if shutil.which("wrk") else "native"
+        if driver == "native":
+            logger.info("wrk not found on PATH, using the built-in load generator")
+    return driver
+
+
+class RunningServer(Struct):
+    process: subprocess.Popen
+    startup_time: float  # seconds from spawn until the first HTTP response
 
 
 class BenchmarkRunner:
-    def __init__(self, data_manager: DataManager):
+    def __init__(
+        self,
+        data_manager: DataManager,
+        startup_timeout: float = 30.0,
+        shutdown_timeout: float = 10.0,
+        driver: str = "auto",
+    ):
         self.results: dict[str, BenchmarkResults] = {}
         self.data_manager = data_manager
         self.project_root = data_manager.project_root
+        self.startup_timeout = startup_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.driver = resolve_driver(driver)
     
     @property
     def benchmarks(self) -> list[BenchmarkConfig]:
@@ -56,33 +431,46 @@ class BenchmarkRunner:
         """Get script paths."""
         return self.data_manager.script_paths
 
-    def run_wrk_benchmark(self, benchmark_config: BenchmarkConfig) -> Optional[float]:
-        """Run wrk benchmark and extract RPS."""
+    def run_wrk_benchmark(
+        self, benchmark_config: BenchmarkConfig, cores: Optional[list[int]] = None
+    ) -> Optional[WrkSummary]:
+        """Run wrk benchmark and extract the summary emitted by the `done()` hook."""
         # Get the generated script path for this test
         test_name = benchmark_config.bench_name
+        if test_name not in self.script_paths:
+            script_path = benchmark_config.generate_lua_script(self.data_manager)
+            self.script_paths[test_name] = str(script_path)
         script_path = self.script_paths[test_name]
 
-        cmd = benchmark_config.wrk_command(script_path)
+        cmd = pin_command(benchmark_config.wrk_command(script_path), cores)
 
         try:
             logger.info(f"Running benchmark: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=20)
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=benchmark_config.duration_seconds + 10,
+            )
 
             if result.returncode != 0:
                 logger.error(f"wrk failed: {result.stderr}")
                 return None
 
-            # Parse RPS from output
-            rps_match = re.search(r"Requests/sec:\s+(\d+\.?\d*)", result.stdout)
-            if rps_match:
-                rps = float(rps_match.group(1))
-                logger.info(f"Extracted RPS: {rps}")
-                return rps
-            else:
-                logger.error("Could not extract RPS from wrk output")
+            summary = self.parse_wrk_summary(result.stdout)
+            if summary is None:
+                logger.error("Could not extract summary from wrk output")
                 logger.debug(f"Output: {result.stdout}")
                 return None
 
+            logger.info(
+                f"Extracted RPS: {summary.rps:.2f}, "
+                f"p99: {summary.latency.p99 / 1000:.2f}ms, "
+                f"socket errors: {summary.errors.socket_errors}, "
+                f"non-2xx: {summary.errors.status}"
+            )
+            return summary
+
         except subprocess.TimeoutExpired:
             logger.error("wrk benchmark timed out")
             return None
@@ -90,34 +478,106 @@ class BenchmarkRunner:
             logger.error(f"Error running wrk: {e}")
             return None
 
+    def run_native_benchmark(
+        self, benchmark_config: BenchmarkConfig, cores: Optional[list[int]] = None
+    ) -> Optional[WrkSummary]:
+        """Run the built-in asyncio/uvloop generator, same result schema as wrk."""
+        mode = f"{benchmark_config.rate} req/s" if benchmark_config.rate else "closed-loop"
+        logger.info(
+            f"Running built-in generator ({mode}): {benchmark_config.threads} processes, "
+            f"{benchmark_config.connections} connections, {benchmark_config.duration} "
+            f"@ {benchmark_config.url}"
+        )
+        try:
+            summary = loadgen.run_benchmark(benchmark_config, cores)
+        except Exception as e:
+            logger.error(f"Error running built-in load generator: {e}")
+            return None
+        logger.info(
+            f"Measured RPS: {summary.rps:.2f}, "
+            f"p99: {summary.latency.p99 / 1000:.2f}ms, "
+            f"socket errors: {summary.errors.socket_errors}, "
+            f"non-2xx: {summary.errors.status}"
+        )
+        return summary
+
+    def run_rate_benchmark(
+        self, benchmark_config: BenchmarkConfig, cores: Optional[list[int]] = None
+    ) -> Optional[WrkSummary]:
+        """Run an open-loop benchmark at `benchmark_config.rate` requests/sec.
+
+        Uses wrk2 when installed and the wrk driver is selected, otherwise the
+        built-in generator.
+        """
+        if self.driver == "wrk" and shutil.which("wrk2"):
+            return self.run_wrk_benchmark(benchmark_config, cores)
+        return self.run_native_benchmark(benchmark_config, cores)
+
+    def run_load(
+        self, benchmark_config: BenchmarkConfig, cores: Optional[list[int]] = None
+    ) -> Optional[WrkSummary]:
+        """Drive load with the selected driver."""
+        if benchmark_config.rate:
+            return self.run_rate_benchmark(benchmark_config, cores)
+        if self.driver == "native":
+            return self.run_native_benchmark(benchmark_config, cores)
+        return self.run_wrk_benchmark(benchmark_config, cores)
+
+    @staticmethod
+    def parse_wrk_summary(output: str) -> Optional[WrkSummary]:
+        """Decode the JSON line printed by `WRK_DONE_HOOK`."""
+        for line in output.splitlines():
+            if line.startswith(WRK_SUMMARY_MARKER):
+                payload = line[len(WRK_SUMMARY_MARKER) :].strip()
+                return decode(payload, type=WrkSummary)
+        return None
+
     def start_server(
-        self, config: FrameWorkConfig | NonASGIConfig
-    ) -> Optional[subprocess.Popen]:
-        """Start a web framework server."""
+        self,
+        config: FrameWorkConfig | NonASGIConfig,
+        probe_url: str,
+        cores: Optional[list[int]] = None,
+    ) -> Optional[RunningServer]:
+        """Start a web framework server and wait until it serves `probe_url`."""
+        if not is_port_free(config.port):
+            logger.error(f"Port {config.port} is already in use, cannot start {config.name}")
+            return None
+
+        # server output goes to a file: a pipe nobody reads fills up and
+        # blocks servers that log a lot, e.g. Robyn logging every route
+        output = tempfile.TemporaryFile()
         try:
             logger.info(f"Starting {config.name} server...")
             process = subprocess.Popen(
-                config.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                pin_command(config.launch_command, cores),
+                stdout=output,
+                stderr=subprocess.STDOUT,
                 cwd=self.project_root,
+                env={**os.environ, **config.env},
             )
-            # Give server time to start
-            time.sleep(3)
-
-            # Check if server is running
-            if process.poll() is not None:
-                _, stderr = process.communicate()
-                logger.error(f"Server failed to start: {stderr.decode()}")
-                return None
-
-            return process
         except Exception as e:
             logger.error(f"Error starting server: {e}")
+            output.close()
             return None
 
-    def stop_server(self, process: subprocess.Popen):
-        """Stop a server process."""
+        try:
+            startup_time = wait_until_ready(process, probe_url, self.startup_timeout)
+        except ServerNotReady as e:
+            logger.error(f"{config.name} failed to start: {e}")
+            if process.poll() is None:
+                self.stop_server(process, config.port)
+            else:
+                output.seek(0)
+                logger.error(f"Server output: {output.read().decode(errors='replace')}")
+            return None
+        finally:
+            output.close()
+
+        logger.info(f"{config.name} ready after {startup_time * 1000:.0f}ms")
+        return RunningServer(process=process, startup_time=startup_time)
+
+    def stop_server(self, process: subprocess.Popen, port: int):
+        """Stop a server process and wait for its port to be released."""
         try:
             process.terminate()
             process.wait(timeout=5)
@@ -125,30 +585,144 @@ class BenchmarkRunner:
             process.kill()
             process.wait()
 
+        if not wait_for_port_free(port, self.shutdown_timeout):
+            logger.warning(
+                f"Port {port} still in use {self.shutdown_timeout:.0f}s after shutdown"
+            )
+
     def benchmark_framework(
-        self, framework_key: str, benchmark_config: BenchmarkConfig
-    ) -> Optional[float]:
-        """Benchmark a single framework."""
-        config = FRAMEWORKS[framework_key]
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        slot: Optional[CoreSlot] = None,
+        **overrides: Any,
+    ) -> Optional[FrameworkResult]:
+        """Benchmark a single framework, optionally inside an isolated core slot.
+
+        `overrides` replace fields of the framework config for this run only,
+        e.g. `workers=4`.
+        """
+        config = replace(FRAMEWORKS[framework_key], **overrides)
+        server_cores = client_cores = None
+        if slot is not None:
+            config = replace(config, port=slot.port)
+            benchmark_config = benchmark_config.with_port(slot.port)
+            server_cores, client_cores = slot.server_cores, slot.client_cores
 
         logger.info(f"\n{'='*50}")
         logger.info(f"Benchmarking {config.name} ({framework_key})")
         logger.info(f"{'='*50}")
 
         # Start server
-        server_process = self.start_server(config)
-        if not server_process:
+        server = self.start_server(config, benchmark_config.url, server_cores)
+        if not server:
             return None
 
+        sampler = ResourceSampler(server.process.pid)
         try:
             # Run benchmark
-            rps = self.run_wrk_benchmark(benchmark_config)
-            return rps
+            summaries = self.run_trials(benchmark_config, client_cores, [sampler])
+            if summaries is None:
+                return None
+            result = aggregate_trials(config.name, summaries)
+            result.startup_ms = server.startup_time * 1000
+            result.resources = sampler.stop(sum(s.requests for s in summaries))
+            return result
         finally:
+            sampler.cancel()
             # Always stop server
-            self.stop_server(server_process)
-            time.sleep(2)  # Cool down period
+            self.stop_server(server.process, config.port)
+
+    def run_trials(
+        self,
+        benchmark_config: BenchmarkConfig,
+        cores: Optional[list[int]] = None,
+        watchers: Sequence[ResourceSampler | PySpyProfiler | SignalProfiler | gctune.GcTracker] = (),
+    ) -> Optional[list[WrkSummary]]:
+        """Discarded warmup run followed by `trials` measured runs.
+
+        `watchers` are started after the warmup, so they only see measured load;
+        stopping them is up to the caller.
+        """
+        if benchmark_config.warmup:
+            logger.info(f"Warming up for {benchmark_config.warmup} (discarded)")
+            if self.run_load(benchmark_config.with_duration(benchmark_config.warmup), cores) is None:
+                return None
+
+        for watcher in watchers:
+            watcher.start()
+
+        summaries = []
+        for trial in range(benchmark_config.trials):
+            if benchmark_config.trials > 1:
+                logger.info(f"Trial {trial + 1}/{benchmark_config.trials}")
+            summary = self.run_load(benchmark_config, cores)
+            if summary is None:
+                return None
+            summaries.append(summary)
+        return summaries
+
+    def profile_framework(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        backend: str = "auto",
+        top: int = 20,
+        rate: int = 100,
+    ) -> Optional[Path]:
+        """Profile one framework over the measured trials of a test.
+
+        Writes collapsed stacks, an SVG flamegraph and the top-`top` table to
+        `bench_results/profiles/<test>/<framework>.*`. Numbers measured while
+        profiling are skewed by the sampler and are not recorded.
+        """
+        if backend == "auto":
+            backend = "py-spy" if pyspy_available() else "signal"
+        output = RESULTS_DIR / "profiles" / benchmark_config.bench_name / framework_key
 
+        config = FRAMEWORKS[framework_key]
+        if backend == "signal":
+            config = replace(config, launcher=SignalProfiler.launcher_options(output, rate))
+        logger.info(f"Profiling {config.name} on {benchmark_config.bench_name} with {backend}")
+
+        server = self.start_server(config, benchmark_config.url)
+        if not server:
+            return None
+
+        profiler = (
+            PySpyProfiler(server.process.pid, output, rate)
+            if backend == "py-spy"
+            else SignalProfiler(server.process.pid, output)
+        )
+        try:
+            summaries = self.run_trials(benchmark_config, watchers=[profiler])
+        finally:
+            stacks = profiler.stop()
+            self.stop_server(server.process, config.port)
+        if summaries is None or stacks is None:
+            return None
+
+        title = f"{config.name} - {benchmark_config.bench_name} ({backend})"
+        table = write_profile(stacks, output, title, top)
+        logger.info(f"\n{title}:")
+        for line in table:
+            logger.info(f"  {line}")
+        logger.info(f"Flamegraph: {output.with_suffix('.svg')}")
+        return output.with_suffix(".svg")
+
+    def run_profiles(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        backend: str = "auto",
+        top: int = 20,
+    ):
+        """Profile every framework/test pair."""
+        for benchmark_config in benchmarks:
+            for framework_key in framework_keys:
+                name = FRAMEWORKS[framework_key].name
+                if self.profile_framework(framework_key, benchmark_config, backend, top) is None:
+                    logger.warning(f"✗ {name} [{benchmark_config.bench_name}]: profiling failed")
 
     def generate_graphs(self):
         """Generate updated graphs."""
@@ -162,6 +736,45 @@ class BenchmarkRunner:
         except Exception as e:
             logger.error(f"Error generating graphs: {e}")
 
+    def record_benchmark(
+        self,
+        benchmark_name: str,
+        framework_results: list[FrameworkResult],
+        drift: Optional[DriftReport] = None,
+    ):
+        """Persist and print the results of one benchmark suite."""
+        ties = find_ties(framework_results)
+        if framework_results:
+            benchmark_results = BenchmarkResults(
+                benchmark_name=benchmark_name,
+                results=framework_results,
+                ties=ties or None,
+                drift=drift,
+            )
+            self.results[benchmark_name] = benchmark_results
+            self.data_manager.update_benchmark_results(benchmark_name, benchmark_results)
+
+        logger.info(f"\n{benchmark_name.capitalize()} benchmark results:")
+        # Sort by RPS descending
+        sorted_results = sorted(
+            framework_results, key=lambda x: x.rps, reverse=True
+        )
+        for result in sorted_results:
+            logger.info(f"  {result.framework}: {format_result(result)}")
+        for a, b in ties:
+            logger.info(f"  ≈ {a} and {b} are statistically tied (overlapping CIs)")
+        if drift is not None:
+            log = logger.warning if drift.drifting else logger.info
+            log(f"  {format_drift(drift)}")
+
+    def finish(self):
+        """Generate graphs with all results."""
+        if self.results:
+            self.generate_graphs()
+            logger.info(f"\n{'='*60}")
+            logger.info("✓ Benchmarking complete! Check ./assets/ for updated graphs.")
+            logger.info(f"{'='*60}")
+
     def run_all_benchmarks(self):
         """Run benchmarks for all frameworks."""
         for benchmark_config in self.benchmarks:
@@ -173,38 +786,1361 @@ class BenchmarkRunner:
             framework_results = []
 
             for framework_key in FRAMEWORKS.keys():
-                rps = self.benchmark_framework(framework_key, benchmark_config)
+                result = self.benchmark_framework(framework_key, benchmark_config)
                 framework_config = FRAMEWORKS[framework_key]
-                if rps is not None:
-                    framework_results.append(
-                        FrameworkResult(framework=framework_config.name, rps=rps)
-                    )
-                    logger.info(f"✓ {framework_config.name}: {rps:.2f} RPS")
+                if result is not None:
+                    framework_results.append(result)
+                    logger.info(f"✓ {framework_config.name}: {format_result(result)}")
                 else:
                     logger.warning(f"✗ {framework_config.name}: Failed")
 
+            self.record_benchmark(benchmark_name, framework_results)
+
+        self.finish()
+
+    def run_parallel_benchmarks(self, slots: list[CoreSlot]):
+        """Run the full framework x test matrix concurrently across core slots."""
+        pairs = [
+            (framework_key, benchmark_config)
+            for benchmark_config in self.benchmarks
+            for framework_key in FRAMEWORKS.keys()
+        ]
+        logger.info(f"Running {len(pairs)} benchmarks across {len(slots)} core slots")
+
+        def report(framework_key, benchmark_config, result):
+            name = FRAMEWORKS[framework_key].name
+            if result is not None:
+                logger.info(f"✓ {name} [{benchmark_config.bench_name}]: {format_result(result)}")
+            else:
+                logger.warning(f"✗ {name} [{benchmark_config.bench_name}]: Failed")
+
+        outcomes = ParallelScheduler(self, slots).run(pairs, on_result=report)
+
+        for benchmark_config in self.benchmarks:
+            framework_results = [
+                result
+                for _, config, result in outcomes
+                if result is not None and config is benchmark_config
+            ]
+            self.record_benchmark(benchmark_config.bench_name, framework_results)
+
+        self.finish()
+
+
+    def run_scaling_sweep(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        counts: list[int],
+    ) -> Optional[FrameworkResult]:
+        """Benchmark one framework at each worker count in `counts`."""
+        config = FRAMEWORKS[framework_key]
+        points: list[SweepPoint] = []
+        single_rps: Optional[float] = None
+
+        for workers in counts:
+            logger.info(f"{config.name}: {workers} worker(s)")
+            result = self.benchmark_framework(
+                framework_key, benchmark_config, workers=workers
+            )
+            if result is None:
+                logger.warning(f"✗ {config.name} with {workers} worker(s): Failed")
+                continue
+
+            if workers == 1:
+                single_rps = result.rps
+            efficiency = (
+                result.rps / (workers * single_rps) if single_rps else None
+            )
+            points.append(
+                SweepPoint(
+                    value=workers,
+                    rps=result.rps,
+                    latency=result.latency,
+                    efficiency=efficiency,
+                )
+            )
+
+        if not points:
+            return None
+        return FrameworkResult(
+            framework=config.name,
+            rps=max(point.rps for point in points),
+            curve=points,
+        )
+
+    def run_scaling_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        max_workers: int,
+    ):
+        """Sweep worker counts 1, 2, 4, ... up to `max_workers`."""
+        counts = worker_counts(max_workers)
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:workers"
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Scaling {benchmark_config.bench_name.upper()} over workers {counts}")
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                result = self.run_scaling_sweep(framework_key, benchmark_config, counts)
+                if result is not None:
+                    framework_results.append(result)
+
+            self.record_sweep(benchmark_name, "workers", framework_results)
+
+        self.finish()
+
+    def record_sweep(
+        self, benchmark_name: str, sweep: str, framework_results: list[FrameworkResult]
+    ):
+        """Persist and print per-framework curves of one sweep."""
+        if framework_results:
+            benchmark_results = BenchmarkResults(
+                benchmark_name=benchmark_name,
+                results=framework_results,
+                sweep=sweep,
+            )
+            self.results[benchmark_name] = benchmark_results
+            self.data_manager.update_benchmark_results(benchmark_name, benchmark_results)
+
+        logger.info(f"\n{benchmark_name} results:")
+        for result in framework_results:
+            knee = f" (saturates at {result.knee} {sweep})" if result.knee else ""
+            variant = f" [{result.variant}]" if result.variant else ""
+            logger.info(f"  {result.framework}{variant}{knee}:")
+            for point in result.curve or []:
+                logger.info(f"    {format_point(point, sweep)}")
+
+    def record_matrix(
+        self,
+        benchmark_name: str,
+        matrix: str,
+        framework_results: list[FrameworkResult],
+        baselines: Optional[dict[str, str]] = None,
+    ):
+        """Persist and print results that differ by `variant`, per framework.
+
+        The first variant measured for a framework is its baseline, unless
+        `baselines` names another one for a variant.
+        """
+        if framework_results:
+            benchmark_results = BenchmarkResults(
+                benchmark_name=benchmark_name,
+                results=framework_results,
+                matrix=matrix,
+            )
+            self.results[benchmark_name] = benchmark_results
+            self.data_manager.update_benchmark_results(benchmark_name, benchmark_results)
+
+        logger.info(f"\n{benchmark_name} results:")
+        by_framework: dict[str, list[FrameworkResult]] = {}
+        for result in framework_results:
+            by_framework.setdefault(result.framework, []).append(result)
+        for framework, results in by_framework.items():
+            logger.info(f"  {framework}:")
+            for result in results:
+                baseline = matrix_baseline(results, result, baselines)
+                logger.info(f"    {format_variant(result, baseline)}")
+
+    def run_version_matrix(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        specs: list[str],
+        envs: EnvCache,
+        python: Optional[str] = None,
+    ):
+        """Benchmark every framework once per version spec, each from its own env.
+
+        `specs` are comma separated pins (`fastapi==0.115.0,pydantic==2.9.2`),
+        or `project` for the uv project env. Envs are built before the first
+        benchmark so setup never overlaps a measurement.
+        """
+        variants: list[tuple[str, Optional[str]]] = []
+        for text in specs:
+            if text == PROJECT_SPEC:
+                variants.append((PROJECT_SPEC, None))
+                continue
+            spec = EnvSpec.parse(text, python)
+            env_python = envs.ensure(spec)
+            if env_python is None:
+                logger.warning(f"✗ {spec.label}: no environment, skipped")
+                continue
+            variants.append((spec.label, str(env_python)))
+
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:versions"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Version matrix {benchmark_config.bench_name.upper()}: "
+                f"{', '.join(label for label, _ in variants)}"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                for label, env_python in variants:
+                    result = self.benchmark_framework(
+                        framework_key, benchmark_config, python=env_python
+                    )
+                    if result is None:
+                        logger.warning(f"✗ {FRAMEWORKS[framework_key].name} [{label}]: Failed")
+                        continue
+                    result.variant = label
+                    framework_results.append(result)
+
+            self.record_matrix(benchmark_name, "versions", framework_results)
+
+        self.finish()
+
+    def run_stack_matrix(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        stacks: list[ServerStack],
+        envs: EnvCache,
+        pythons: Optional[list[str]] = None,
+    ):
+        """Serve the same apps with every server stack (and interpreter).
+
+        Without `pythons` servers run from the uv project env, pulling in
+        hypercorn/granian with `uv run --with`; otherwise one cached env per
+        Python version is built with every stack's packages. Robyn serves
+        itself and is skipped.
+        """
+        interpreters: list[tuple[Optional[str], Optional[str]]] = [(None, None)]
+        if pythons:
+            interpreters = []
+            packages = sorted({package for stack in stacks for package in stack.packages})
+            for version in pythons:
+                env_python = envs.ensure(EnvSpec(requirements=packages, python=version))
+                if env_python is None:
+                    logger.warning(f"✗ Python {version}: no environment, skipped")
+                    continue
+                interpreters.append((f"py{version}", str(env_python)))
+
+        variants = [
+            (f"{label} {stack.label}" if label else stack.label, python, stack)
+            for label, python in interpreters
+            for stack in stacks
+        ]
+        asgi_keys = [key for key in framework_keys if not isinstance(FRAMEWORKS[key], NonASGIConfig)]
+        for key in sorted(set(framework_keys) - set(asgi_keys)):
+            logger.warning(f"{FRAMEWORKS[key].name} is not an ASGI app, skipped in the stack matrix")
+
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:stack"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Stack matrix {benchmark_config.bench_name.upper()}: "
+                f"{len(variants)} stacks x {len(asgi_keys)} frameworks"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in asgi_keys:
+                for variant, python, stack in variants:
+                    result = self.benchmark_framework(
+                        framework_key, benchmark_config, python=python, stack=stack
+                    )
+                    if result is None:
+                        logger.warning(f"✗ {FRAMEWORKS[framework_key].name} [{variant}]: Failed")
+                        continue
+                    result.variant = variant
+                    framework_results.append(result)
+
+            self.record_matrix(benchmark_name, "stack", framework_results)
             if framework_results:
-                benchmark_results = BenchmarkResults(
-                    benchmark_name=benchmark_name, results=framework_results
+                baseline = variants[0][0]
+                logger.info(f"  server effect, mean across frameworks vs {baseline}:")
+                for variant, change in matrix_effects(framework_results).items():
+                    logger.info(f"    {variant}: {change:+.1%}")
+
+        self.finish()
+
+    def benchmark_gc_variant(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        variant: gctune.GcVariant,
+    ) -> Optional[FrameworkResult]:
+        """Benchmark one framework under the launcher with a GC/allocator
+        variant, recording its collections over the measured trials."""
+        config = FRAMEWORKS[framework_key]
+        slug = variant.name.split()[0]
+        output = RESULTS_DIR / "gc" / benchmark_config.bench_name / f"{framework_key}-{slug}"
+        config = replace(
+            config,
+            launcher=[
+                *(config.launcher or []),
+                *gctune.GcTracker.launcher_options(output),
+                *variant.launcher,
+            ],
+            app_env={**config.app_env, **variant.env},
+        )
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Benchmarking {config.name} ({framework_key}) [{variant.name}]")
+        logger.info(f"{'='*50}")
+
+        server = self.start_server(config, benchmark_config.url)
+        if not server:
+            return None
+
+        sampler = ResourceSampler(server.process.pid)
+        tracker = gctune.GcTracker(server.process.pid, output)
+        try:
+            summaries = self.run_trials(benchmark_config, watchers=[sampler, tracker])
+            stats = tracker.stop()
+            if summaries is None:
+                return None
+            result = aggregate_trials(config.name, summaries)
+            result.startup_ms = server.startup_time * 1000
+            result.resources = sampler.stop(sum(s.requests for s in summaries))
+            result.variant = variant.name
+            result.gc = stats
+            return result
+        finally:
+            sampler.cancel()
+            self.stop_server(server.process, config.port)
+
+    def run_gc_matrix(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        variants: list[gctune.GcVariant],
+    ):
+        """Benchmark every framework once per GC/allocator variant, with GC
+        pause histograms and RPS/p99 deltas against the first variant."""
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:gc"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"GC matrix {benchmark_config.bench_name.upper()}: "
+                f"{', '.join(variant.name for variant in variants)}"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                for variant in variants:
+                    result = self.benchmark_gc_variant(framework_key, benchmark_config, variant)
+                    if result is None:
+                        logger.warning(f"✗ {FRAMEWORKS[framework_key].name} [{variant.name}]: Failed")
+                        continue
+                    framework_results.append(result)
+
+            baselines = gctune.baselines(variants)
+            self.record_matrix(benchmark_name, "gc", framework_results, baselines)
+            if not framework_results:
+                continue
+            logger.info("  GC pauses, collections per pause bucket:")
+            for result in framework_results:
+                if result.gc is None:
+                    continue
+                rss = f", peak RSS {result.resources.peak_rss_mb:.0f}MB" if result.resources else ""
+                logger.info(f"    {result.framework} [{result.variant}]{rss}")
+                for line in format_gc_histogram(result.gc):
+                    logger.info(f"      {line}")
+            against = f"{variants[0].name}, allocators vs malloc" if baselines else variants[0].name
+            logger.info(f"  variant effect, mean across frameworks vs {against}:")
+            for variant, change in matrix_effects(framework_results, baselines).items():
+                logger.info(f"    {variant}: {change:+.1%}")
+
+        self.finish()
+
+    def run_connection_sweep(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        connections: list[int],
+    ) -> Optional[FrameworkResult]:
+        """Benchmark one server at each connection count and locate its knee."""
+        config = FRAMEWORKS[framework_key]
+        server = self.start_server(config, benchmark_config.url)
+        if not server:
+            return None
+
+        points: list[SweepPoint] = []
+        try:
+            for count in connections:
+                logger.info(f"{config.name}: {count} connection(s)")
+                summary = self.run_load(benchmark_config.with_connections(count))
+                if summary is None:
+                    logger.warning(f"✗ {config.name} with {count} connection(s): Failed")
+                    continue
+                points.append(
+                    SweepPoint(value=count, rps=summary.rps, latency=summary.latency)
                 )
-                self.results[benchmark_name] = benchmark_results
-                self.data_manager.update_benchmark_results(benchmark_name, benchmark_results)
+        finally:
+            self.stop_server(server.process, config.port)
+
+        if not points:
+            return None
+        return FrameworkResult(
+            framework=config.name,
+            rps=max(point.rps for point in points),
+            startup_ms=server.startup_time * 1000,
+            curve=points,
+            knee=find_saturation_point(points),
+        )
 
-            logger.info(f"\n{benchmark_name.capitalize()} benchmark results:")
-            # Sort by RPS descending
-            sorted_results = sorted(
-                framework_results, key=lambda x: x.rps, reverse=True
+    def run_connection_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        connections: list[int],
+    ):
+        """Sweep wrk connection counts to find where each framework saturates."""
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:connections"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Sweeping {benchmark_config.bench_name.upper()} over connections {connections}"
             )
-            for result in sorted_results:
-                logger.info(f"  {result.framework}: {result.rps:.2f} RPS")
+            logger.info(f"{'='*60}")
 
-        # Generate graphs with all results
-        if self.results:
-            self.generate_graphs()
+            framework_results = []
+            for framework_key in framework_keys:
+                result = self.run_connection_sweep(
+                    framework_key, benchmark_config, connections
+                )
+                if result is not None:
+                    framework_results.append(result)
+
+            self.record_sweep(benchmark_name, "connections", framework_results)
+
+        self.finish()
+
+
+    def run_scenario_sweep(
+        self,
+        framework_key: str,
+        scenario_config: BenchmarkConfig,
+    ) -> Optional[FrameworkResult]:
+        """Benchmark one server at every size of a scenario.
+
+        Server CPU and memory are sampled per size: a peak RSS that grows
+        with the response size means the framework buffers it.
+        """
+        config = FRAMEWORKS[framework_key]
+        scenario = scenario_config.scenario
+        assert scenario is not None
+        scenarios.prepare(scenario_config)
+        server = self.start_server(config, scenario_config.url)
+        if not server:
+            return None
+
+        points: list[SweepPoint] = []
+        try:
+            for size in scenario.sizes:
+                sized = scenarios.sized_config(scenario_config, size)
+                logger.info(f"{config.name}: {sized.bench_name}")
+                sampler = ResourceSampler(server.process.pid)
+                try:
+                    summaries = self.run_trials(sized, watchers=[sampler])
+                    if summaries is None:
+                        logger.warning(f"✗ {config.name} at {sized.bench_name}: Failed")
+                        continue
+                    resources = sampler.stop(sum(s.requests for s in summaries))
+                finally:
+                    sampler.cancel()
+                result = aggregate_trials(config.name, summaries)
+                # what the framework had to (de)serialize: request bodies for
+                # orders, response bodies for users
+                if sized.method == "POST":
+                    bytes_per_sec = result.rps * scenarios.request_bytes(sized)
+                else:
+                    bytes_per_sec = result.transfer_per_sec
+                points.append(
+                    SweepPoint(
+                        value=size,
+                        rps=result.rps,
+                        latency=result.latency,
+                        bytes_per_sec=bytes_per_sec,
+                        errors=result.errors,
+                        ttfb=result.ttfb,
+                        resources=resources,
+                    )
+                )
+        finally:
+            self.stop_server(server.process, config.port)
+
+        if not points:
+            return None
+        return FrameworkResult(
+            framework=config.name,
+            rps=max(point.rps for point in points),
+            startup_ms=server.startup_time * 1000,
+            curve=points,
+        )
+
+    def run_scenario_benchmarks(
+        self,
+        framework_keys: list[str],
+        scenario_configs: list[BenchmarkConfig],
+    ):
+        """Run each scenario of test.json over its sizes, e.g. payload bytes."""
+        for scenario_config in scenario_configs:
+            scenario = scenario_config.scenario
+            assert scenario is not None
+            benchmark_name = f"{scenario_config.bench_name}:size"
             logger.info(f"\n{'='*60}")
-            logger.info("✓ Benchmarking complete! Check ./assets/ for updated graphs.")
+            logger.info(
+                f"Scenario {scenario_config.bench_name.upper()} ({scenario.kind}) "
+                f"over sizes {scenario.sizes}"
+                + (f", {scenario.invalid_ratio:.0%} invalid" if scenario.invalid_ratio else "")
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                result = self.run_scenario_sweep(framework_key, scenario_config)
+                if result is not None:
+                    framework_results.append(result)
+
+            self.record_sweep(benchmark_name, "size", framework_results)
+
+        self.finish()
+
+    def run_routing_sweep(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        counts: list[int],
+        kind: str,
+    ) -> list[FrameworkResult]:
+        """Benchmark one framework's generated app at each route count.
+
+        The server is restarted per count, its startup time covers importing
+        the app and registering the table. Returns one curve per position of
+        the requested route (start, middle, end of the table).
+        """
+        base = FRAMEWORKS[framework_key]
+        curves: dict[str, list[SweepPoint]] = {position: [] for position in routing.ROUTE_POSITIONS}
+        for count in counts:
+            config = replace(base, app_env=routing.app_env(count, kind))
+            logger.info(f"{config.name}: {count} {kind} routes")
+            server = self.start_server(config, scenarios.with_path(benchmark_config.url, "/ping"))
+            if not server:
+                logger.warning(f"✗ {config.name} with {count} routes: Failed")
+                continue
+            try:
+                for position in routing.ROUTE_POSITIONS:
+                    target = routing.routing_config(benchmark_config, count, kind, position)
+                    # some routers do one-off work on the first match (FastAPI
+                    # takes seconds at 10k routes), keep it out of the window
+                    probe_http(target.url, timeout=self.startup_timeout)
+                    summaries = self.run_trials(target)
+                    if summaries is None:
+                        logger.warning(f"✗ {config.name} at {target.bench_name}: Failed")
+                        continue
+                    result = aggregate_trials(config.name, summaries)
+                    curves[position].append(
+                        SweepPoint(
+                            value=count,
+                            rps=result.rps,
+                            latency=result.latency,
+                            errors=result.errors,
+                            startup_ms=server.startup_time * 1000,
+                        )
+                    )
+            finally:
+                self.stop_server(server.process, config.port)
+
+        return [
+            FrameworkResult(
+                framework=base.name,
+                rps=max(point.rps for point in points),
+                curve=points,
+                variant=position,
+            )
+            for position, points in curves.items()
+            if points
+        ]
+
+    def run_routing_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmark_config: BenchmarkConfig,
+        counts: list[int],
+        kinds: list[str],
+    ):
+        """Sweep the number of registered routes, once per route kind.
+
+        `benchmark_config` supplies the host and load settings, requests go
+        to the generated routes.
+        """
+        for kind in kinds:
+            benchmark_name = f"routing_{kind}:routes"
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Routing scale ({kind} routes) over route counts {counts}")
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                framework_results.extend(
+                    self.run_routing_sweep(framework_key, benchmark_config, counts, kind)
+                )
+
+            self.record_sweep(benchmark_name, "routes", framework_results)
+
+        self.finish()
+
+    def run_app_sweep(
+        self,
+        framework_key: str,
+        steps: list[tuple[int, dict[str, str], BenchmarkConfig]],
+    ) -> Optional[FrameworkResult]:
+        """Benchmark one framework with the app rebuilt for every step.
+
+        A step is `(value, app_env, benchmark config)`; the server is
+        restarted with each app_env. Overheads are relative to the first
+        step measured.
+        """
+        base = FRAMEWORKS[framework_key]
+        points: list[SweepPoint] = []
+        for value, app_env, target in steps:
+            config = replace(base, app_env=app_env)
+            logger.info(f"{config.name}: {target.bench_name}")
+            server = self.start_server(config, target.url)
+            if not server:
+                logger.warning(f"✗ {config.name} at {target.bench_name}: Failed")
+                continue
+            try:
+                summaries = self.run_trials(target)
+            finally:
+                self.stop_server(server.process, config.port)
+            if summaries is None:
+                logger.warning(f"✗ {config.name} at {target.bench_name}: Failed")
+                continue
+            result = aggregate_trials(config.name, summaries)
+            points.append(
+                SweepPoint(
+                    value=value,
+                    rps=result.rps,
+                    latency=result.latency,
+                    errors=result.errors,
+                    overhead_us=overhead_us(result.rps, points[0].rps) if points else 0.0,
+                )
+            )
+
+        if not points:
+            return None
+        return FrameworkResult(framework=base.name, rps=points[0].rps, curve=points)
+
+    def run_di_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmark_config: BenchmarkConfig,
+        depths: list[int],
+        widths: list[int],
+        variants: list[str],
+    ):
+        """Sweep dependency depth per fan-out width and sync/async, cached/uncached variant."""
+        for key in framework_keys:
+            if key not in di.DI_FRAMEWORKS:
+                logger.warning(f"{FRAMEWORKS[key].name} has no dependency injection, skipped")
+        for variant in variants:
+            for width in widths:
+                benchmark_name = f"di_{variant}_w{width}:depth"
+                logger.info(f"\n{'='*60}")
+                logger.info(f"DI {variant}, {width} chain(s), over depths {depths}")
+                logger.info(f"{'='*60}")
+
+                framework_results = []
+                for framework_key in framework_keys:
+                    if not di.supports(framework_key, variant):
+                        if framework_key in di.DI_FRAMEWORKS:
+                            reason = di.skip_reason(framework_key, variant)
+                            logger.info(
+                                f"{FRAMEWORKS[framework_key].name} {reason}, skipped for {variant}"
+                            )
+                        continue
+                    steps = [
+                        (
+                            depth,
+                            di.app_env(depth, width, variant),
+                            di.di_config(benchmark_config, depth, width, variant),
+                        )
+                        for depth in depths
+                    ]
+                    result = self.run_app_sweep(framework_key, steps)
+                    if result is not None:
+                        framework_results.append(result)
+
+                self.record_sweep(benchmark_name, "depth", framework_results)
+
+        self.finish()
+
+    def run_middleware_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmark_config: BenchmarkConfig,
+        layers: list[int],
+        kinds: list[str],
+    ):
+        """Sweep middleware stack depth, natively and as pure ASGI, and report
+        the fitted cost of one more layer."""
+        costs: dict[str, dict[str, tuple[float, float, float]]] = {}
+        for kind in kinds:
+            benchmark_name = f"middleware_{kind}:layers"
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Middleware ({kind}) over layers {layers}")
             logger.info(f"{'='*60}")
 
+            framework_results = []
+            for framework_key in framework_keys:
+                if not middleware.supports(framework_key, kind):
+                    logger.info(
+                        f"{FRAMEWORKS[framework_key].name} runs its own server, skipped for {kind}"
+                    )
+                    continue
+                steps = [
+                    (
+                        count,
+                        middleware.app_env(count, kind),
+                        middleware.middleware_config(benchmark_config, count, kind),
+                    )
+                    for count in layers
+                ]
+                result = self.run_app_sweep(framework_key, steps)
+                if result is not None:
+                    framework_results.append(result)
+                    costs.setdefault(result.framework, {})[kind] = middleware.per_layer_cost(
+                        result.curve or []
+                    )
+
+            self.record_sweep(benchmark_name, "layers", framework_results)
+
+        logger.info("\nCost of one more middleware layer:")
+        for framework, by_kind in costs.items():
+            logger.info(f"  {framework}:")
+            for kind, (server_us, latency_us, rps_change) in by_kind.items():
+                logger.info(
+                    f"    {kind:<6}: {server_us:+.1f}us server time, "
+                    f"{latency_us:+.1f}us p50 latency, {rps_change:+.1%} RPS"
+                )
+
+        self.finish()
+
+    def run_open_loop_sweep(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        fractions: list[float],
+    ) -> Optional[FrameworkResult]:
+        """Measure max RPS closed-loop, then drive fixed rates below it."""
+        config = FRAMEWORKS[framework_key]
+        server = self.start_server(config, benchmark_config.url)
+        if not server:
+            return None
+
+        points: list[SweepPoint] = []
+        try:
+            peak = self.run_load(benchmark_config)
+            if peak is None:
+                return None
+            logger.info(f"{config.name}: closed-loop max {peak.rps:.2f} RPS")
+
+            for fraction in fractions:
+                rate = max(int(peak.rps * fraction), 1)
+                logger.info(f"{config.name}: {rate} req/s ({fraction:.0%} of max)")
+                summary = self.run_rate_benchmark(benchmark_config.with_rate(rate))
+                if summary is None:
+                    logger.warning(f"✗ {config.name} at {rate} req/s: Failed")
+                    continue
+                points.append(
+                    SweepPoint(value=rate, rps=summary.rps, latency=summary.latency)
+                )
+        finally:
+            self.stop_server(server.process, config.port)
+
+        if not points:
+            return None
+        return FrameworkResult(
+            framework=config.name,
+            rps=peak.rps,
+            latency=peak.latency,
+            errors=peak.errors,
+            transfer_per_sec=peak.transfer_per_sec,
+            startup_ms=server.startup_time * 1000,
+            curve=points,
+        )
+
+    def run_open_loop_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        fractions: list[float],
+    ):
+        """Report coordinated-omission corrected latency at several fixed rates."""
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:rate"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Open-loop {benchmark_config.bench_name.upper()} at "
+                f"{', '.join(f'{f:.0%}' for f in fractions)} of max RPS"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                result = self.run_open_loop_sweep(framework_key, benchmark_config, fractions)
+                if result is not None:
+                    framework_results.append(result)
+
+            self.record_sweep(benchmark_name, "rate", framework_results)
+
+        self.finish()
+
+
+    def run_scheduled_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        order: str,
+        seed: Optional[int] = None,
+    ):
+        """Run framework x trial pairs in a chosen order to cancel drift.
+
+        `sequential` runs AAA BBB, `interleave` runs AB AB AB and `random`
+        shuffles every run. Each run gets a fresh server; CPU frequency and
+        temperature are read before it starts and the session is checked for
+        drift afterwards.
+        """
+        for benchmark_config in benchmarks:
+            benchmark_name = benchmark_config.bench_name
+            plan = schedule_runs(framework_keys, benchmark_config.trials, order, seed)
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Running {benchmark_name.upper()} benchmark suite, {order} order, "
+                f"{len(plan)} runs"
+            )
+            logger.info(f"{'='*60}")
+
+            single_run = replace(benchmark_config, trials=1)
+            per_framework: dict[str, list[FrameworkResult]] = {}
+            runs: list[RunSample] = []
+
+            for position, (framework_key, trial) in enumerate(plan):
+                name = FRAMEWORKS[framework_key].name
+                cpu_mhz, temp_c = read_cpu_freq_mhz(), read_cpu_temp_c()
+                started_at = time.time()
+                logger.info(
+                    f"Run {position + 1}/{len(plan)}: {name} trial {trial + 1} "
+                    f"(cpu {f'{cpu_mhz:.0f}MHz' if cpu_mhz else 'n/a'}, "
+                    f"temp {f'{temp_c:.1f}°C' if temp_c else 'n/a'})"
+                )
+
+                result = self.benchmark_framework(framework_key, single_run)
+                if result is None:
+                    logger.warning(f"✗ {name} trial {trial + 1}: Failed")
+                    continue
+
+                per_framework.setdefault(framework_key, []).append(result)
+                runs.append(
+                    RunSample(
+                        framework=name,
+                        trial=trial,
+                        order=position,
+                        started_at=started_at,
+                        rps=result.rps,
+                        cpu_mhz=cpu_mhz,
+                        temp_c=temp_c,
+                    )
+                )
+
+            framework_results = [
+                combine_results(results) for results in per_framework.values()
+            ]
+            drift = detect_drift(runs) if runs else None
+            self.record_benchmark(benchmark_name, framework_results, drift=drift)
+
+        self.finish()
+
+    def run_inproc_script(
+        self,
+        config: FrameWorkConfig,
+        benchmark_config: BenchmarkConfig,
+        requests: int,
+        rounds: int,
+        *options: str,
+    ) -> Optional[str]:
+        """Run bench/inproc.py on `config`'s app, returns its JSON report."""
+        target = urlsplit(benchmark_config.url)
+        path = target.path + (f"?{target.query}" if target.query else "")
+        cmd = [
+            *config.interpreter,
+            str(INPROC_PATH),
+            f"src.{config.name.lower()}",
+            "--method",
+            benchmark_config.method,
+            "--path",
+            path,
+            "--requests",
+            str(requests),
+            "--rounds",
+            str(rounds),
+            *options,
+        ]
+        if benchmark_config.data is not None:
+            cmd += ["--body", encode(benchmark_config.data).decode()]
+        extra = f" ({' '.join(options)})" if options else ""
+        logger.info(f"{config.name}: {benchmark_config.method} {path} in-process{extra}")
+        try:
+            completed = subprocess.run(
+                cmd,
+                cwd=self.project_root,
+                env={**os.environ, **config.env},
+                capture_output=True,
+                text=True,
+            )
+        except Exception as e:
+            logger.error(f"Error running in-process harness: {e}")
+            return None
+
+        for line in completed.stdout.splitlines():
+            if line.startswith(INPROC_MARKER):
+                return line[len(INPROC_MARKER) :].strip()
+        logger.error(
+            f"In-process harness failed for {config.name} (exit {completed.returncode}): "
+            f"{completed.stderr.strip()[-1000:]}"
+        )
+        return None
+
+    def run_inproc(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        requests: int,
+        rounds: int,
+        stages: bool = False,
+    ) -> Optional[FrameworkResult]:
+        """Drive the framework's ASGI app in-process with bench/inproc.py.
+
+        With `stages` the app is driven a second time with per-stage timers;
+        the difference between the two runs is the timers' overhead.
+        """
+        config = FRAMEWORKS[framework_key]
+        payload = self.run_inproc_script(config, benchmark_config, requests, rounds)
+        if payload is None:
+            return None
+        stats = decode(payload, type=InprocStats)
+        result = FrameworkResult(
+            framework=config.name,
+            rps=1e9 / stats.ns_per_request if stats.ns_per_request > 0 else 0.0,
+            inproc=stats,
+        )
+        if not stages:
+            return result
+
+        payload = self.run_inproc_script(config, benchmark_config, requests, rounds, "--stages")
+        if payload is None:
+            return None
+        breakdown = decode(payload, type=StageBreakdown)
+        overhead = breakdown.ns_per_request - stats.ns_per_request
+        return replace(result, stages=replace(breakdown, overhead_ns=overhead))
+
+    def run_inproc_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        requests: int,
+        rounds: int,
+        stages: bool = False,
+    ) -> bool:
+        """In-process time and allocations (or with `stages`, the per-stage
+        breakdown) per request, no server, ports or load generator involved;
+        False if any framework failed."""
+        ok = True
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:{'stages' if stages else 'inproc'}"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"In-process {benchmark_config.bench_name} ({requests} requests x {rounds} rounds)"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                name = FRAMEWORKS[framework_key].name
+                if isinstance(FRAMEWORKS[framework_key], NonASGIConfig):
+                    logger.info(f"{name} is not an ASGI app, skipped")
+                    continue
+                result = self.run_inproc(
+                    framework_key, benchmark_config, requests, rounds, stages=stages
+                )
+                if result is None:
+                    logger.warning(f"✗ {name}: Failed")
+                    ok = False
+                    continue
+                non_2xx = result.inproc.non_2xx + (result.stages.non_2xx if result.stages else 0)
+                if non_2xx:
+                    logger.warning(f"✗ {name}: {non_2xx} non-2xx responses")
+                    ok = False
+                framework_results.append(result)
+
+            self.record_benchmark(benchmark_name, framework_results)
+
+        self.finish()
+        return ok
+
+    def cold_start_once(
+        self, config: FrameWorkConfig, benchmark_config: BenchmarkConfig, first_requests: int
+    ) -> Optional[coldstart.ColdStartSample]:
+        """Spawn a fresh server, time it until its first response, then the
+        requests that follow on the same connection."""
+        if not is_port_free(config.port):
+            logger.error(f"Port {config.port} is already in use, cannot start {config.name}")
+            return None
+
+        target = urlsplit(benchmark_config.url)
+        path = target.path + (f"?{target.query}" if target.query else "")
+        body = benchmark_config.body
+        # importtime writes to stderr, a pipe nobody reads would fill up
+        output = tempfile.TemporaryFile()
+        error = None
+        started = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                config.launch_command,
+                stdout=subprocess.DEVNULL,
+                stderr=output,
+                cwd=self.project_root,
+                env={**os.environ, **config.env, **coldstart.IMPORTTIME_ENV},
+            )
+        except Exception as e:
+            logger.error(f"Error starting server: {e}")
+            output.close()
+            return None
+
+        try:
+            conn = coldstart.connect_when_listening(
+                process,
+                target.hostname or "localhost",
+                config.port,
+                time.monotonic() + self.startup_timeout,
+            )
+            try:
+                status, first = coldstart.exchange(conn, benchmark_config.method, path, body)
+                ready_ms = (time.perf_counter() - started) * 1000
+                latencies = [first]
+                for _ in range(first_requests - 1 + coldstart.STEADY_REQUESTS):
+                    code, us = coldstart.exchange(conn, benchmark_config.method, path, body)
+                    latencies.append(us)
+                    if not 200 <= code < 300:
+                        status = code
+            finally:
+                conn.close()
+            if not 200 <= status < 300:
+                error = f"{benchmark_config.method} {path} answered {status}"
+        except Exception as e:
+            error = str(e)
+        finally:
+            if process.poll() is None:
+                self.stop_server(process, config.port)
+            output.seek(0)
+            stderr = output.read().decode(errors="replace")
+            output.close()
+
+        if error is not None:
+            server_output = "\n".join(
+                line
+                for line in stderr.splitlines()
+                if not line.startswith(coldstart.IMPORTTIME_PREFIX)
+            )
+            logger.error(f"{config.name} cold start failed: {error}")
+            if server_output:
+                logger.error(f"Server output: {server_output[-2000:]}")
+            return None
+
+        return coldstart.ColdStartSample(
+            ready_ms=ready_ms,
+            first_us=latencies[:first_requests],
+            steady_us=statistics.median(latencies[first_requests:]),
+            imports=coldstart.parse_importtime(stderr),
+        )
+
+    def run_coldstart(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        repeats: int,
+        first_requests: int,
+    ) -> Optional[FrameworkResult]:
+        """Start the framework's server `repeats` times from scratch.
+
+        Each repeat also times a bare `<python> -c pass`, interleaved so both
+        see the same machine state.
+        """
+        config = FRAMEWORKS[framework_key]
+        app_module = f"src.{config.name.lower()}"
+        if not isinstance(config, NonASGIConfig):
+            # imported by the launcher, so importtime reports the app module
+            config = replace(config, launcher=[*(config.launcher or []), "--preload", app_module])
+        bare = [*config.interpreter, "-c", "pass"]
+        env = {**os.environ, **config.env}
+        interpreter_ms, startup_modules, samples = [], set(), []
+        for repeat in range(repeats):
+            elapsed, modules = coldstart.run_bare(bare, self.project_root, env)
+            interpreter_ms.append(elapsed)
+            startup_modules |= modules
+            sample = self.cold_start_once(config, benchmark_config, first_requests)
+            if sample is None:
+                return None
+            logger.info(
+                f"{config.name} cold start {repeat + 1}/{repeats}: "
+                f"ready in {sample.ready_ms:.0f}ms"
+            )
+            samples.append(sample)
+
+        stats = coldstart.summarize(samples, interpreter_ms, startup_modules, app_module)
+        return FrameworkResult(
+            framework=config.name,
+            rps=0.0,  # one connection, one request at a time: no throughput
+            coldstart=stats,
+        )
+
+    def run_coldstart_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        repeats: int,
+        first_requests: int,
+    ) -> bool:
+        """Cold-start time, its breakdown and first-request latency of every
+        framework; False if any framework failed."""
+        ok = True
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:coldstart"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Cold start {benchmark_config.bench_name} ({repeats} fresh processes, "
+                f"first {first_requests} requests)"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                result = self.run_coldstart(
+                    framework_key, benchmark_config, repeats, first_requests
+                )
+                if result is None:
+                    logger.warning(f"✗ {FRAMEWORKS[framework_key].name}: Failed")
+                    ok = False
+                    continue
+                framework_results.append(result)
+
+            self.record_benchmark(benchmark_name, framework_results)
+
+        self.finish()
+        return ok
+
+    def run_soak(
+        self,
+        framework_key: str,
+        benchmark_config: BenchmarkConfig,
+        seconds: float,
+        fraction: float,
+        tracemalloc_interval: Optional[float] = None,
+    ) -> Optional[FrameworkResult]:
+        """Drive `fraction` of the framework's max RPS for `seconds`.
+
+        Load is one open-loop run of the built-in generator on long-lived
+        connections, reporting every second as it completes; the server
+        tree's RSS and open descriptors are sampled while it runs. With
+        `tracemalloc_interval` the server snapshots its allocations, written
+        to `bench_results/soak/<test>/<framework>.<pid>.tracemalloc`.
+        """
+        config = FRAMEWORKS[framework_key]
+        output = RESULTS_DIR / "soak" / benchmark_config.bench_name / framework_key
+        if tracemalloc_interval is not None:
+            config = replace(
+                config,
+                launcher=[
+                    *(config.launcher or []),
+                    *soak.AllocationTracker.launcher_options(output, tracemalloc_interval),
+                ],
+            )
+
+        server = self.start_server(config, benchmark_config.url)
+        if not server:
+            return None
+
+        tracker = (
+            soak.AllocationTracker(server.process.pid, output)
+            if tracemalloc_interval is not None
+            else None
+        )
+        sampler = ResourceSeries(server.process.pid, soak.SOAK_SAMPLE_INTERVAL)
+        throughput: list[SecondStats] = []
+        last_second = max(int(seconds), 1) - 1
+        allocations = None
+
+        def on_second(point: SecondStats):
+            if server.process.poll() is not None:
+                raise RuntimeError(f"{config.name} exited during the soak")
+            if not throughput:
+                # `t` of the samples counts from the generator's start
+                sampler.start(time.monotonic() - point.second - 1)
+                if tracker is not None:
+                    tracker.start()
+            throughput.append(point)
+            if point.second == last_second:
+                sampler.stop()  # before the connections close
+            if (point.second + 1) % soak.PROGRESS_INTERVAL == 0:
+                recent = throughput[-soak.PROGRESS_INTERVAL :]
+                usage = f", RSS {sampler.samples[-1].rss_mb:.0f}MB" if sampler.samples else ""
+                logger.info(
+                    f"{config.name} soak {(point.second + 1) / 60:.0f}/{seconds / 60:.0f}min: "
+                    f"{sum(p.requests for p in recent) / len(recent):.2f} RPS, "
+                    f"p99 {max(p.p99 for p in recent) / 1000:.2f}ms, "
+                    f"errors {sum(p.errors for p in recent)}{usage}"
+                )
+
+        try:
+            # closed-loop, warms the server up as well
+            peak = self.run_load(benchmark_config)
+            if peak is None:
+                return None
+            rate = max(int(peak.rps * fraction), 1)
+            logger.info(
+                f"{config.name}: closed-loop max {peak.rps:.2f} RPS, soaking at {rate} req/s "
+                f"({fraction:.0%}) for {seconds / 3600:.2f}h"
+            )
+            soak_config = benchmark_config.with_rate(rate).with_duration(f"{last_second + 1}s")
+            try:
+                errors = loadgen.run_stream(soak_config, on_second)
+            except Exception as e:
+                logger.error(f"Soak load failed: {e}")
+                return None
+            logger.info(
+                f"{config.name} soak done: socket errors {errors.socket_errors}, "
+                f"non-2xx {errors.status}"
+            )
+        finally:
+            resources = sampler.stop()
+            if tracker is not None:
+                allocations = tracker.stop()
+            self.stop_server(server.process, config.port)
+
+        if not throughput:
+            return None
+        report = soak.analyze(
+            throughput, resources, rate, peak.rps, float(len(throughput)), allocations
+        )
+        return FrameworkResult(
+            framework=config.name,
+            rps=sum(point.requests for point in throughput) / len(throughput),
+            startup_ms=server.startup_time * 1000,
+            errors=errors,
+            soak=report,
+        )
+
+    def run_soak_benchmarks(
+        self,
+        framework_keys: list[str],
+        benchmarks: list[BenchmarkConfig],
+        seconds: float,
+        fraction: float,
+        tracemalloc_interval: Optional[float] = None,
+    ) -> bool:
+        """Soak every framework in turn; False if any failed or was flagged
+        for memory/descriptor growth or throughput decay."""
+        ok = True
+        for benchmark_config in benchmarks:
+            benchmark_name = f"{benchmark_config.bench_name}:soak"
+            logger.info(f"\n{'='*60}")
+            logger.info(
+                f"Soak {benchmark_config.bench_name} at {fraction:.0%} of max RPS, "
+                f"{seconds / 3600:.2f}h per framework"
+            )
+            logger.info(f"{'='*60}")
+
+            framework_results = []
+            for framework_key in framework_keys:
+                name = FRAMEWORKS[framework_key].name
+                result = self.run_soak(
+                    framework_key, benchmark_config, seconds, fraction, tracemalloc_interval
+                )
+                if result is None:
+                    logger.warning(f"✗ {name}: Failed")
+                    ok = False
+                    continue
+                report = result.soak
+                if report.memory_growth or report.fd_growth or report.throughput_decay:
+                    logger.warning(f"✗ {name}: {format_soak(report)}")
+                    ok = False
+                framework_results.append(result)
+
+            self.record_benchmark(benchmark_name, framework_results)
+
+        self.finish()
+        return ok
+
+    def calibrate(self, framework_key: str, threads: int, connections: int) -> bool:
+        """Check the built-in generator can saturate a server on `/ping`.
+
+        A single-worker server is saturated when it burns (close to) a full
+        core while the generator drives it. If wrk is installed the two
+        drivers are also compared head to head.
+        """
+        config = FRAMEWORKS[framework_key]
+        ping = BenchmarkConfig(
+            bench_name="calibrate",
+            method="GET",
+            url=f"http://localhost:{config.port}/ping",
+            threads=threads,
+            connections=connections,
+        )
+        server = self.start_server(config, ping.url)
+        if not server:
+            return False
+
+        try:
+            tree = process_tree(server.process.pid)
+            cpu_before, wall_before = cpu_seconds(tree), time.monotonic()
+            native = self.run_native_benchmark(ping)
+            utilization = (cpu_seconds(tree) - cpu_before) / (time.monotonic() - wall_before)
+            wrk = self.run_wrk_benchmark(ping) if shutil.which("wrk") else None
+        finally:
+            self.stop_server(server.process, config.port)
+
+        if native is None:
+            return False
+        if native.errors.status:
+            logger.error(f"{config.name} answered /ping with {native.errors.status} non-2xx responses")
+            return False
+
+        saturated = utilization >= 0.9
+        logger.info(f"\nCalibration against {config.name} /ping:")
+        logger.info(f"  built-in generator: {native.rps:.2f} RPS")
+        logger.info(f"  server CPU while driven: {utilization:.0%} of one core")
+        if wrk is not None:
+            logger.info(f"  wrk: {wrk.rps:.2f} RPS (built-in reaches {native.rps / wrk.rps:.0%})")
+        if saturated:
+            logger.info("✓ built-in generator saturates the server")
+        else:
+            logger.warning(
+                "✗ server is not saturated, give the generator more processes (-t) "
+                "or cores of its own"
+            )
+        return saturated
+
+
+def worker_counts(max_workers: int) -> list[int]:
+    """Powers of two below `max_workers`, followed by `max_workers` itself."""
+    counts = []
+    workers = 1
+    while workers < max_workers:
+        counts.append(workers)
+        workers *= 2
+    counts.append(max_workers)
+    return counts
+
 
 def main():
     """Main entry point for the benchmark script."""
@@ -0,0 +1,202 @@
+"""
+Cold-start benchmark: how long a fresh server process takes to serve.
+
+Every repeat spawns the server from scratch with `PYTHONPROFILEIMPORTTIME=1`
+in its environment (`-X importtime` for whichever interpreter `uv run`
+starts), connects as soon as the port accepts and sends the test request,
+then keeps the connection for the requests that follow:
+
+- `ready`: spawn until the first response is read, what an autoscaler or a
+  serverless worker waits for before the process is useful.
+- `interpreter`: `<python> -c pass`, spawn until exit, on its own.
+- `imports`: what the server process imports on top of that bare
+  interpreter (server, framework, app dependencies), from importtime's
+  top-level cumulative times.
+- `app`: the app module's own share of its import, i.e. running its body:
+  building the app and registering its routes. Servers import apps through
+  importlib, which importtime does not see, so the launcher imports the app
+  first (`--preload`). Apps started as `__main__` (Robyn) have none.
+- first requests: latency of the first N requests, one at a time, against
+  the steady-state latency of the requests after them.
+
+Import costs are attributed to top-level packages by summing the self time
+of their modules, so nested imports are not counted twice.
+"""
+
+import http.client
+import socket
+import statistics
+import subprocess
+import time
+from typing import Container, Optional, Sequence
+
+from .data_manager import Base, ColdStartStats, ImportCost
+from .readiness import ServerNotReady
+from .stats import percentile
+
+COLDSTART_REPEATS = 20
+COLDSTART_TESTS = ("ping",)
+FIRST_REQUESTS = 10
+STEADY_REQUESTS = 200  # after the first requests, their median is the steady state
+TOP_IMPORTS = 10
+POLL_INTERVAL = 0.001  # a refused connect returns at once, poll tightly
+CONNECT_TIMEOUT = 1.0
+REQUEST_TIMEOUT = 10.0
+
+IMPORTTIME_PREFIX = "import time:"
+IMPORTTIME_ENV = {"PYTHONPROFILEIMPORTTIME": "1"}
+
+
+class ImportTime(Base):
+    """One line of `-X importtime` output, times in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # 0 for imports not nested in another one
+
+
+class ColdStartSample(Base):
+    """One fresh server process."""
+
+    ready_ms: float
+    first_us: list[float]
+    steady_us: float
+    imports: list[ImportTime]
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Import times from a process's stderr, other output is skipped."""
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(IMPORTTIME_PREFIX) :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header
+        name = fields[2].rstrip()
+        imports.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                # nesting is shown as two more spaces per level
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return imports
+
+
+def package_costs(imports: Sequence[ImportTime], exclude: Container[str] = ()) -> dict[str, int]:
+    """Self time in microseconds summed per top-level package."""
+    costs: dict[str, int] = {}
+    for record in imports:
+        if record.module in exclude:
+            continue
+        package = record.module.split(".")[0]
+        costs[package] = costs.get(package, 0) + record.self_us
+    return costs
+
+
+def run_bare(command: list[str], cwd, env: dict[str, str]) -> tuple[float, set[str]]:
+    """Milliseconds `command` takes from spawn to exit, and the modules it
+    imports (those the interpreter imports at startup)."""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        command,
+        cwd=cwd,
+        env={**env, **IMPORTTIME_ENV},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    return elapsed, {record.module for record in parse_importtime(completed.stderr)}
+
+
+def exchange(
+    conn: http.client.HTTPConnection, method: str, path: str, body: Optional[bytes]
+) -> tuple[int, float]:
+    """Send one request on `conn`, returns `(status, microseconds)`."""
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    started = time.perf_counter()
+    conn.request(method, path, body=body, headers=headers)
+    response = conn.getresponse()
+    response.read()
+    return response.status, (time.perf_counter() - started) * 1e6
+
+
+def connect_when_listening(
+    process: subprocess.Popen, host: str, port: int, deadline: float
+) -> http.client.HTTPConnection:
+    """Connection to the server as soon as its port accepts one.
+
+    Raises `ServerNotReady` if the process exits or `deadline` (monotonic)
+    passes.
+    """
+    while True:
+        if process.poll() is not None:
+            raise ServerNotReady(f"server exited with code {process.returncode}")
+        try:
+            sock = socket.create_connection((host, port), timeout=CONNECT_TIMEOUT)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise ServerNotReady(f"server did not listen on {host}:{port} in time")
+            time.sleep(POLL_INTERVAL)
+            continue
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn = http.client.HTTPConnection(host, port, timeout=REQUEST_TIMEOUT)
+        # the short timeout is for polling the connect only, a first request
+        # doing lazy setup may take much longer
+        sock.settimeout(conn.timeout)
+        conn.sock = sock
+        return conn
+
+
+def summarize(
+    samples: Sequence[ColdStartSample],
+    interpreter_ms: Sequence[float],
+    startup_modules: set[str],
+    app_module: str,
+) -> ColdStartStats:
+    """Medians (and the ready time's p95) over fresh processes.
+
+    `startup_modules` are imported by the bare interpreter, their time is
+    part of `interpreter_ms` already.
+    """
+    ready = sorted(sample.ready_ms for sample in samples)
+    app_ms, import_ms, costs = [], [], []
+    for sample in samples:
+        app = next((r.self_us for r in sample.imports if r.module == app_module), None)
+        total = sum(
+            r.cumulative_us
+            for r in sample.imports
+            if r.depth == 0 and r.module not in startup_modules
+        )
+        if app is not None:
+            app_ms.append(app / 1000)
+            total -= app
+        import_ms.append(total / 1000)
+        costs.append(package_costs(sample.imports, exclude={app_module, *startup_modules}))
+
+    # a package missing from a sample (e.g. imported lazily) counts as 0 there
+    packages = {package for cost in costs for package in cost}
+    medians = {
+        package: statistics.median(cost.get(package, 0) for cost in costs) / 1000
+        for package in packages
+    }
+    top = sorted(medians.items(), key=lambda item: item[1], reverse=True)[:TOP_IMPORTS]
+    positions = min(len(sample.first_us) for sample in samples)
+    return ColdStartStats(
+        repeats=len(samples),
+        ready_ms_p50=statistics.median(ready),
+        ready_ms_p95=percentile(ready, 95),
+        interpreter_ms=statistics.median(interpreter_ms),
+        import_ms=statistics.median(import_ms),
+        app_ms=statistics.median(app_ms) if app_ms else None,
+        first_us=[
+            statistics.median(sample.first_us[i] for sample in samples) for i in range(positions)
+        ],
+        steady_us=statistics.median(sample.steady_us for sample in samples),
+        imports=[ImportCost(package=package, self_ms=ms) for package, ms in top],
+    )
@@ -13,11 +13,17 @@ This module handles all file I/O operations including:
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
 
-from msgspec import Struct
+from msgspec import Struct, convert
 from msgspec.json import decode, encode
-from msgspec.structs import asdict
+from msgspec.structs import asdict, replace
+
+from .launcher import wrap_command
+
+if TYPE_CHECKING:
+    from .history import RunContext
 
 logger = logging.getLogger(__name__)
 
@@ -33,16 +39,117 @@ class Base(Struct):
         return asdict(self)
 
 
+class ServerStack(Base):
+    """ASGI server, event loop and HTTP parser an app is served with."""
+
+    server: str = "uvicorn"  # uvicorn | hypercorn | granian
+    loop: str = "uvloop"  # asyncio | uvloop
+    http: str = "httptools"  # uvicorn: httptools | h11; hypercorn: h11; granian: native
+
+    @property
+    def label(self) -> str:
+        return f"{self.server}/{self.loop}/{self.http}"
+
+    @property
+    def packages(self) -> list[str]:
+        """Packages the stack needs on top of the project dependencies."""
+        return [] if self.server == "uvicorn" else [self.server]
+
+    def args(self, app: str, port: int, workers: int | None) -> list[str]:
+        """Arguments after the server's entry point."""
+        if self.server == "uvicorn":
+            args = [
+                app, "--interface", "asgi3", "--loop", self.loop, "--http", self.http,
+                "--no-access-log", "--log-level", "warning", "--port", str(port),
+            ]
+            if workers is not None:
+                args += ["--workers", str(workers)]
+        elif self.server == "hypercorn":
+            args = [
+                app, "--bind", f"127.0.0.1:{port}", "--worker-class", self.loop,
+                "--log-level", "warning",
+            ]
+            if workers is not None:
+                args += ["--workers", str(workers)]
+        elif self.server == "granian":
+            args = [
+                app, "--interface", "asgi", "--host", "127.0.0.1", "--port", str(port),
+                "--loop", self.loop, "--http", "1", "--no-ws", "--no-access-log",
+                "--log-level", "warning",
+            ]
+            if workers is not None:
+                args += ["--workers", str(workers)]
+        else:
+            raise ValueError(f"unknown server {self.server!r}")
+        return args
+
+
+# HTTP implementations each server can run with, the first is its default
+SERVER_HTTP: dict[str, list[str]] = {
+    "uvicorn": ["httptools", "h11"],
+    "hypercorn": ["h11"],
+    "granian": ["native"],
+}
+
+
+def expand_stacks(servers: list[str], loops: list[str], https: list[str]) -> list[ServerStack]:
+    """Cross product of servers, loops and HTTP parsers, minus impossible pairs.
+
+    Servers that only have one HTTP implementation (hypercorn: h11, granian:
+    its own Rust parser) appear once per loop whatever `https` asks for.
+    """
+    stacks = []
+    for server in servers:
+        supported = SERVER_HTTP[server]
+        chosen = [http for http in https if http in supported] or supported[:1]
+        if len(supported) == 1:
+            chosen = supported
+        for loop in loops:
+            for http in chosen:
+                stacks.append(ServerStack(server=server, loop=loop, http=http))
+    return stacks
+
+
 class FrameWorkConfig(Base):
     name: str  # e.g. FastAPI
     port: int = 8000
+    workers: int | None = None  # None: single process, no worker manager
+    launcher: list[str] | None = None  # run under bench/launcher.py with these options
+    python: str | None = None  # interpreter of a separate env, None: the uv project env
+    stack: ServerStack | None = None  # None: the default uvicorn command below
+    app_env: dict[str, str] = {}  # app settings, e.g. BENCH_ROUTES for a generated route table
+
+    @property
+    def launch_command(self) -> list[str]:
+        """`command`, wrapped in the instrumentation launcher if requested."""
+        if self.launcher is None:
+            return self.command
+        return wrap_command(self.command, self.launcher)
+
+    def entry_point(self, script: str, packages: list[str] | None = None) -> list[str]:
+        """Run a console script (uvicorn, sanic, ...) in the server's environment.
+
+        `packages` missing from the project env are added with `uv run --with`;
+        separate envs are expected to have them installed.
+        """
+        if self.python is None:
+            extra = [arg for package in packages or [] for arg in ("--with", package)]
+            return ["uv", "run", *extra, script]
+        return [self.python, "-m", script]
+
+    @property
+    def interpreter(self) -> list[str]:
+        return ["uv", "run", "python"] if self.python is None else [self.python]
 
     @property
     def command(self) -> list[str]:
-        return [
-            "uv",
-            "run",
-            "uvicorn",
+        if self.stack is not None:
+            return [
+                *self.entry_point(self.stack.server, self.stack.packages),
+                *self.stack.args(f"src.{self.name.lower()}:app", self.port, self.workers),
+            ]
+        cmd = [
+            *self.entry_point("uvicorn"),
             f"src.{self.name.lower()}:app",
             "--interface",
             "asgi3",
@@ -54,32 +161,343 @@ class FrameWorkConfig(Base):
             "--port",
             str(self.port),
         ]
+        if self.workers is not None:
+            cmd += ["--workers", str(self.workers)]
+        return cmd
+
+    @property
+    def env(self) -> dict[str, str]:
+        """Extra environment: the port for apps that bind their own (e.g.
+        Robyn) and `app_env`."""
+        return {"BENCH_PORT": str(self.port), **self.app_env}
 
 
 class NonASGIConfig(FrameWorkConfig):
     @property
     def command(self) -> list[str]:
-        return ["uv", "run", "python", "-m", f"src.{self.name.lower()}"]
+        cmd = [*self.interpreter, "-m", f"src.{self.name.lower()}"]
+        if self.workers is not None:
+            cmd += ["--processes", str(self.workers)]
+        return cmd
+
+
+class SanicConfig(FrameWorkConfig):
+    """Sanic runs under uvicorn by default, but scales with its own workers."""
+
+    @property
+    def command(self) -> list[str]:
+        if self.workers is None or self.stack is not None:
+            return super().command
+        return [
+            *self.entry_point("sanic"),
+            f"src.{self.name.lower()}:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(self.port),
+            "--workers",
+            str(self.workers),
+            "--no-access-logs",
+        ]
+
+
+class LatencyStats(Base):
+    """Latency distribution reported by wrk, all values in microseconds."""
+
+    min: float
+    max: float
+    mean: float
+    stdev: float
+    p50: float
+    p75: float
+    p90: float
+    p99: float
+    p999: float
+
+
+class ErrorCounts(Base):
+    connect: int = 0
+    read: int = 0
+    write: int = 0
+    timeout: int = 0
+    status: int = 0  # non-2xx/3xx responses
+
+    @property
+    def socket_errors(self) -> int:
+        return self.connect + self.read + self.write + self.timeout
+
+
+class SecondStats(Base):
+    """Requests completed within one second of a run."""
+
+    second: int  # since the run started
+    requests: int
+    errors: int  # non-2xx/3xx responses
+    p50: float  # latency, microseconds
+    p99: float
+
+
+class WrkSummary(Base):
+    """Structured summary emitted by the generated wrk `done()` hook."""
+
+    requests: int
+    duration_us: int
+    bytes: int
+    latency: LatencyStats
+    errors: ErrorCounts
+    ttfb: LatencyStats | None = None  # time to first byte, built-in driver only
+    series: list[SecondStats] | None = None  # built-in driver, when asked for
+
+    @property
+    def seconds(self) -> float:
+        return self.duration_us / 1_000_000
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.seconds if self.duration_us else 0.0
+
+    @property
+    def transfer_per_sec(self) -> float:
+        """Bytes read per second."""
+        return self.bytes / self.seconds if self.duration_us else 0.0
+
+
+class ResourceUsage(Base):
+    """Server process tree usage over the measured runs, read from /proc."""
+
+    user_cpu_s: float
+    sys_cpu_s: float
+    peak_rss_mb: float  # whole tree, including the launcher and worker manager
+    steady_rss_mb: float  # median over the second half of the window
+    voluntary_ctx_switches: int
+    involuntary_ctx_switches: int
+    threads: int  # peak thread count across the tree
+    workers: int  # processes actually serving requests
+    cpu_us_per_request: float | None = None
+    mb_per_worker: float | None = None  # steady RSS of one serving process
+    start_rss_mb: float | None = None  # whole tree when the window opened
+
+
+class InprocStats(Base):
+    """App driven in-process by bench/inproc.py, without server or sockets."""
+
+    ns_per_request: float  # median over rounds, harness cost subtracted
+    harness_ns: float  # cost of the harness itself, per request
+    rounds_ns: list[float]
+    requests: int
+    non_2xx: int
+    alloc_bytes: float  # median peak traced memory while serving one request
+    retained_blocks: float  # blocks still allocated per request after gc
+
+
+class StageTiming(Base):
+    """Exclusive time of one request stage, see bench/stages.py."""
+
+    stage: str  # receive, routing, decode, di, handler, serialize, send, other
+    mean_ns: float
+    p50_ns: float  # from a log-bucketed histogram, ~9% resolution
+    p99_ns: float
+    calls: float  # timed calls per request
+
+
+class StageBreakdown(Base):
+    """App driven in-process with every stage timed."""
+
+    ns_per_request: float  # instrumented, harness cost subtracted
+    hook_calls: float  # timer calls per request
+    stages: list[StageTiming]
+    non_2xx: int = 0
+    overhead_ns: float | None = None  # instrumented minus uninstrumented time per request
+
+
+class ImportCost(Base):
+    """Import time attributed to one top-level package, see bench/coldstart.py."""
+
+    package: str
+    self_ms: float  # self time of its modules, summed, median over processes
+
+
+class ColdStartStats(Base):
+    """Fresh server processes from spawn to serving, see bench/coldstart.py."""
+
+    repeats: int
+    ready_ms_p50: float  # spawn -> first response read
+    ready_ms_p95: float
+    interpreter_ms: float  # `<python> -c pass`, spawn -> exit
+    import_ms: float  # everything the server imports, the app module's body excluded
+    app_ms: float | None  # app module body: app and routes built; None for `-m` apps
+    first_us: list[float]  # latency of the first requests, median per position
+    steady_us: float  # median latency of the requests after them
+    imports: list[ImportCost]  # heaviest packages first
+
+
+class SoakSample(Base):
+    """Server process tree at one point of a soak run."""
+
+    t: float  # seconds since the soak started
+    rss_mb: float
+    fds: int  # open file descriptors other than sockets
+    sockets: int = 0  # client connections and listeners, not fitted
+
+
+class AllocationSite(Base):
+    """Memory still allocated at a call site, relative to the first
+    tracemalloc snapshot of a soak run."""
+
+    site: str  # innermost frame first
+    size_diff_kb: float
+    count_diff: int
+
+
+class SoakReport(Base):
+    """Hours of constant load below max RPS, see bench/soak.py."""
+
+    target_rps: int
+    max_rps: float  # closed-loop, measured right before
+    seconds: float
+    throughput: list[SecondStats]  # `second` counts from the soak's start
+    resources: list[SoakSample]
+    rss_mb_per_hour: float  # fitted trends, the warmup excluded
+    fds_per_hour: float
+    rss_mb_start: float  # fitted lines at the end of the warmup and at the end of the run
+    rss_mb_end: float
+    fds_start: float
+    fds_end: float
+    rps_change: float  # fitted change over the run, relative to the fitted start
+    p99_change: float
+    memory_growth: bool
+    fd_growth: bool
+    throughput_decay: bool
+    allocations: list[AllocationSite] | None = None  # with tracemalloc, top growth first
+
+
+class GcGeneration(Base):
+    """Collections of one GC generation over the measured window."""
+
+    generation: int
+    collections: int
+    pause_ms: float  # summed over the collections
+    max_pause_us: float
+    collected: int  # unreachable objects freed
+    histogram: list[int]  # collections per `GcStats.bounds_us` bucket, plus one above the last
+
+
+class GcStats(Base):
+    """`gc.callbacks` record of the serving processes, see bench/gctune.py."""
+
+    window_s: float
+    enabled: bool
+    threshold: list[int]
+    frozen: int  # objects in the permanent generation
+    bounds_us: list[float]  # upper bounds of the pause histogram buckets
+    generations: list[GcGeneration]
+
+
+class SweepPoint(Base):
+    """One measurement of a parameter sweep (workers, connections, ...)."""
+
+    value: int
+    rps: float
+    latency: LatencyStats | None = None
+    efficiency: float | None = None  # scaling sweeps: RPS(N) / (N * RPS(1))
+    bytes_per_sec: float | None = None  # scenario sweeps: payload bytes serialized
+    errors: ErrorCounts | None = None
+    ttfb: LatencyStats | None = None  # time to first byte, built-in driver only
+    resources: ResourceUsage | None = None  # scenario sweeps: server usage at this value
+    startup_ms: float | None = None  # routing sweeps: spawn -> ready, app built at this value
+    overhead_us: float | None = None  # DI/middleware sweeps: server time per request added vs. the first value
+
+
+class TrialStats(Base):
+    """RPS across repeated measured trials of one framework/test."""
+
+    samples: list[float]
+    mean: float
+    stdev: float
+    median: float
+    ci_low: float  # bootstrap confidence interval of the mean
+    ci_high: float
+    confidence: float = 0.95
+
+    def overlaps(self, other: "TrialStats") -> bool:
+        return self.ci_low <= other.ci_high and other.ci_low <= self.ci_high
 
 
 class FrameworkResult(Base):
     framework: str
     rps: float
+    latency: LatencyStats | None = None
+    errors: ErrorCounts | None = None
+    transfer_per_sec: float | None = None
+    ttfb: LatencyStats | None = None  # time to first byte, built-in driver only
+    startup_ms: float | None = None  # spawn -> first successful readiness probe
+    curve: list[SweepPoint] | None = None  # set for sweeps, `rps` is then the peak
+    knee: int | None = None  # sweep value where throughput saturates
+    trials: TrialStats | None = None  # set when run with several trials, `rps` is the mean
+    resources: ResourceUsage | None = None  # server CPU/memory over the measured trials
+    variant: str | None = None  # matrix runs: what this result was measured with
+    inproc: InprocStats | None = None  # in-process runs, `rps` is then 1e9 / ns_per_request
+    stages: StageBreakdown | None = None  # in-process runs with per-stage timing
+    coldstart: ColdStartStats | None = None  # cold-start runs, `rps` is then 0
+    soak: SoakReport | None = None  # soak runs, `rps` is then the mean achieved rate
+    gc: GcStats | None = None  # GC matrix runs, collections during the measured trials
+
+    @classmethod
+    def from_summary(cls, framework: str, summary: WrkSummary) -> "FrameworkResult":
+        return cls(
+            framework=framework,
+            rps=summary.rps,
+            latency=summary.latency,
+            errors=summary.errors,
+            transfer_per_sec=summary.transfer_per_sec,
+            ttfb=summary.ttfb,
+        )
+
+
+class RunSample(Base):
+    """One measured run in a scheduled session, with host state at its start."""
+
+    framework: str
+    trial: int
+    order: int  # position in the session
+    started_at: float  # unix timestamp
+    rps: float
+    cpu_mhz: float | None = None
+    temp_c: float | None = None
+
+
+class DriftReport(Base):
+    """Systematic change over a session, fitted linearly against run order."""
+
+    runs: list[RunSample]
+    rps_change: float  # relative change of framework-normalized RPS, first -> last run
+    cpu_mhz_change: float | None = None
+    temp_c_change: float | None = None
+    drifting: bool = False
 
 
 class BenchmarkResults(Base):
     benchmark_name: str
     results: list[FrameworkResult]
+    sweep: str | None = None  # name of the swept parameter, if any
+    ties: list[list[str]] | None = None  # framework pairs with overlapping CIs
+    drift: DriftReport | None = None  # set for scheduled (interleaved/random) runs
+    matrix: str | None = None  # matrix dimension, results then differ by `variant`
 
     def to_dict_by_framework(self) -> dict[str, float]:
         """Convert to dict format for JSON serialization."""
         return {result.framework: result.rps for result in self.results}
 
 
+# Frameworks whose launch command differs from the plain uvicorn one
+FRAMEWORK_CONFIG_TYPES: dict[str, type[FrameWorkConfig]] = {"Sanic": SanicConfig}
+
 # Framework configurations using structured data
 FRAMEWORKS: dict[str, FrameWorkConfig | NonASGIConfig] = {
     **{
-        framework.lower(): FrameWorkConfig(name=framework)
+        framework.lower(): FRAMEWORK_CONFIG_TYPES.get(framework, FrameWorkConfig)(
+            name=framework
+        )
         for framework in ASGI_FRAMEWORKS
     },
     **{
@@ -91,6 +509,92 @@ FRAMEWORKS: dict[str, FrameWorkConfig | NonASGIConfig] = {
 }
 
 
+WRK_SUMMARY_MARKER = "__WRK_SUMMARY__"
+
+
+def lua_string(text: str) -> str:
+    """Lua long-bracket literal, safe for any quotes or backslashes in `text`."""
+    level = 0
+    while f"]{'=' * level}]" in text:
+        level += 1
+    eq = "=" * level
+    return f"[{eq}[{text}]{eq}]"
+
+# wrk calls `done()` once after the run; we print the latency histogram and
+# error counters as a single JSON line so the runner doesn't have to scrape
+# wrk's human readable report.
+WRK_DONE_HOOK = """
+done = function(summary, latency, requests)
+  local e = summary.errors
+  io.write(string.format(
+    '{marker} {"requests":%d,"duration_us":%d,"bytes":%d,'
+    .. '"latency":{"min":%d,"max":%d,"mean":%.2f,"stdev":%.2f,'
+    .. '"p50":%d,"p75":%d,"p90":%d,"p99":%d,"p999":%d},'
+    .. '"errors":{"connect":%d,"read":%d,"write":%d,"timeout":%d,"status":%d}}\\n',
+    summary.requests, summary.duration, summary.bytes,
+    latency.min, latency.max, latency.mean, latency.stdev,
+    latency:percentile(50), latency:percentile(75), latency:percentile(90),
+    latency:percentile(99), latency:percentile(99.9),
+    e.connect, e.read, e.write, e.timeout, e.status
+  ))
+end
+""".replace("{marker}", WRK_SUMMARY_MARKER)
+
+
+class RequestVariant(Base):
+    """One request of a weighted mix, replayed in proportion to `weight`."""
+
+    method: str
+    url: str
+    data: Any = None  # JSON body
+    weight: float = 1.0
+
+    @property
+    def body(self) -> bytes | None:
+        return encode(self.data) if self.data is not None else None
+
+    @property
+    def target(self) -> str:
+        """Path and query, as sent on the request line."""
+        parts = urlsplit(self.url)
+        return (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+
+class Scenario(Base):
+    """A parameterized test, run once per entry of `sizes`."""
+
+    # "orders": POST an order of `size` bytes; "users": GET `size` users;
+    # "ndjson"/"sse": stream `size` users; "download": a `size` MB file
+    kind: str
+    sizes: list[int]
+    invalid_ratio: float = 0.0  # share of requests whose body fails validation
+
+
+def parse_duration(duration: str) -> float:
+    """Seconds in a wrk-style duration: `30`, `30s`, `5m`, `2h`."""
+    units = {"s": 1, "m": 60, "h": 3600}
+    if duration[-1] in units:
+        return float(duration[:-1]) * units[duration[-1]]
+    return float(duration)
+
+
+def weighted_cycle(weights: list[float], length: int = 100) -> list[int]:
+    """Indexes into `weights`, each appearing in proportion to its weight
+    and spread evenly over the cycle (smooth weighted round-robin)."""
+    if len(weights) == 1:
+        return [0]
+    total = sum(weights)
+    current = [0.0] * len(weights)
+    cycle = []
+    for _ in range(length):
+        for idx, weight in enumerate(weights):
+            current[idx] += weight
+        best = max(range(len(weights)), key=current.__getitem__)
+        current[best] -= total
+        cycle.append(best)
+    return cycle
+
+
 class BenchmarkConfig(Base):
     bench_name: str
     method: str
@@ -99,16 +603,70 @@ class BenchmarkConfig(Base):
     threads: int = 4
     connections: int = 64
     duration: str = "10s"
+    rate: int | None = None  # open-loop target requests/sec, None for closed-loop
+    warmup: str | None = None  # discarded run before the measured trials, e.g. "3s"
+    trials: int = 1
+    scenario: Scenario | None = None  # parameterized test, see bench/scenarios.py
+    mix: list[RequestVariant] | None = None  # replay these instead of method/url/data
+    workload: str | None = None  # JSONL file in tests/ expanded into `mix`, see bench/workload.py
+
+    @property
+    def duration_seconds(self) -> float:
+        """`duration` in seconds, accepts wrk's s/m/h suffixes."""
+        return parse_duration(self.duration)
+
+    @property
+    def body(self) -> bytes | None:
+        return encode(self.data) if self.data else None
+
+    @property
+    def requests(self) -> list[RequestVariant]:
+        """What the load generator sends: the mix, or the single request."""
+        if self.mix:
+            return self.mix
+        return [RequestVariant(method=self.method, url=self.url, data=self.data)]
+
+    def request_cycle(self) -> list[int]:
+        """Order in which `requests` are replayed, long enough that every
+        variant of a large mix appears in proportion to its weight."""
+        variants = self.requests
+        return weighted_cycle([v.weight for v in variants], max(100, 10 * len(variants)))
 
     @property
     def script_name(self) -> str:
         """Generate script filename based on test name and method."""
         return f"{self.bench_name}_{self.method.lower()}.lua"
 
+    def with_port(self, port: int) -> "BenchmarkConfig":
+        """Copy of this config targeting the same URL on another port."""
+        parts = urlsplit(self.url)
+        netloc = f"{parts.hostname}:{port}"
+        return replace(self, url=urlunsplit(parts._replace(netloc=netloc)))
+
+    def with_connections(self, connections: int) -> "BenchmarkConfig":
+        """Copy of this config with another connection count.
+
+        wrk refuses fewer connections than threads, so threads are capped.
+        """
+        return replace(
+            self, connections=connections, threads=min(self.threads, connections)
+        )
+
+    def with_duration(self, duration: str) -> "BenchmarkConfig":
+        return replace(self, duration=duration)
+
+    def with_rate(self, rate: int | None) -> "BenchmarkConfig":
+        """Copy of this config driving a constant request rate (open-loop)."""
+        return replace(self, rate=rate)
+
     def wrk_command(self, script_path: str) -> list[str]:
-        """Generate wrk command for this benchmark configuration."""
-        return [
-            "wrk",
+        """Generate wrk command for this benchmark configuration.
+
+        Open-loop runs need wrk2, which keeps the request schedule fixed and
+        measures latency from the intended send time (no coordinated omission).
+        """
+        cmd = [
+            "wrk2" if self.rate else "wrk",
             f"-t{self.threads}",
             f"-c{self.connections}",
             f"-d{self.duration}",
@@ -116,19 +674,27 @@ class BenchmarkConfig(Base):
             "-s",
             script_path,
         ]
+        if self.rate:
+            cmd.append(f"-R{self.rate}")
+        return cmd
 
     def generate_lua_script(self, data_manager: "DataManager") -> Path:
         """Generate wrk Lua script content based on config."""
         script_lines = []
 
-        # Set HTTP method
-        script_lines.append(f'wrk.method = "{self.method}"')
+        if self.mix:
+            script_lines.append(self.lua_mix())
+        else:
+            # Set HTTP method
+            script_lines.append(f'wrk.method = "{self.method}"')
 
-        # Set body data if provided
-        if self.data:
-            body_json = encode(self.data).decode()
-            script_lines.append(f"wrk.body = '{body_json}'")
-            script_lines.append('wrk.headers["Content-Type"] = "application/json"')
+            # Set body data if provided
+            if self.data:
+                body_json = encode(self.data).decode()
+                script_lines.append(f"wrk.body = {lua_string(body_json)}")
+                script_lines.append('wrk.headers["Content-Type"] = "application/json"')
+
+        script_lines.append(WRK_DONE_HOOK)
 
         content = "\n".join(script_lines)
         script_path = data_manager.tests_dir / self.script_name
@@ -137,6 +703,34 @@ class BenchmarkConfig(Base):
             f.write(content)
         return script_path
 
+    def lua_mix(self) -> str:
+        """wrk `request()` hook cycling through the weighted request mix."""
+        lines = ["local requests = {}"]
+        for idx, variant in enumerate(self.requests, 1):
+            body = variant.body
+            headers = '{["Content-Type"] = "application/json"}' if body else "{}"
+            body_arg = lua_string(body.decode()) if body else "nil"
+            lines.append(
+                f'requests[{idx}] = wrk.format("{variant.method}", '
+                f"{lua_string(variant.target)}, {headers}, {body_arg})"
+            )
+        cycle = self.request_cycle()
+        lines += [
+            f"local cycle = {{{', '.join(str(idx + 1) for idx in cycle)}}}",
+            "local position = 0",
+            "",
+            "init = function(args)",
+            "  -- threads start at different offsets of the cycle",
+            "  position = math.random(#cycle) - 1",
+            "end",
+            "",
+            "request = function()",
+            "  position = position % #cycle + 1",
+            "  return requests[cycle[position]]",
+            "end",
+        ]
+        return "\n".join(lines)
+
     @classmethod
     def generate_lua_scripts(
         cls, data_manager: "DataManager", configs: list["BenchmarkConfig"]
@@ -156,15 +750,25 @@ class DataManager:
     """Handles all file I/O operations for benchmarking."""
 
     def __init__(
-        self, project_root: Path, test_dir: str, result_file: str, test_file: str
+        self,
+        project_root: Path,
+        test_dir: str,
+        result_file: str,
+        test_file: str,
+        history_file: str = "benchmark_history.jsonl",
     ):
         self.project_root = project_root
         self.tests_dir = project_root / test_dir
         self.results_path = project_root / result_file
         self.test_file = self.tests_dir / test_file
+        self.history_path = project_root / history_file
+        self._run_context: "RunContext | None" = None
 
         # Load data eagerly during initialization
-        self.benchmarks = self.load_benchmark_configs()
+        configs = [self.expand_workload(c) for c in self.load_benchmark_configs()]
+        self.benchmarks = [c for c in configs if c.scenario is None]
+        # sized at run time, see bench/scenarios.py
+        self.scenarios = [c for c in configs if c.scenario is not None]
         self.script_paths = BenchmarkConfig.generate_lua_scripts(self, self.benchmarks)
 
     def load_benchmark_configs(self, config_file: Path | None = None) -> list[Any]:
@@ -177,23 +781,70 @@ class DataManager:
 
         return decode(test_data, type=list[BenchmarkConfig], strict=False)
 
+    def expand_workload(self, config: BenchmarkConfig) -> BenchmarkConfig:
+        """Replace a config's `workload` file by the request mix it describes."""
+        if config.workload is None:
+            return config
+        from .workload import load_workload, workload_mix
+
+        entries = load_workload(self.tests_dir / config.workload)
+        return replace(config, mix=workload_mix(entries, config.url))
+
+    def load_benchmark_results(self) -> dict[str, BenchmarkResults]:
+        """Load stored results, upgrading the legacy `{framework: rps}` layout."""
+        if not self.results_path.exists():
+            return {}
+
+        with open(self.results_path, "r") as f:
+            raw = decode(f.read(), type=dict[str, dict[str, Any]])
+
+        all_results: dict[str, BenchmarkResults] = {}
+        for benchmark_name, entry in raw.items():
+            if "results" in entry:
+                all_results[benchmark_name] = convert(entry, type=BenchmarkResults)
+            else:
+                all_results[benchmark_name] = BenchmarkResults(
+                    benchmark_name=benchmark_name,
+                    results=[
+                        FrameworkResult(framework=framework, rps=rps)
+                        for framework, rps in entry.items()
+                    ],
+                )
+        return all_results
+
     def update_benchmark_results(
         self, benchmark_name: str, results: "BenchmarkResults"
     ) -> None:
         """Update benchmark results for a specific benchmark."""
         try:
             # Load existing results
-            with open(self.results_path, "r") as f:
-                data = f.read()
-
-            all_results = decode(data, type=dict[str, BenchmarkResults])
+            all_results = self.load_benchmark_results()
             all_results[benchmark_name] = results
 
+            # Save back to file
             with open(self.results_path, "w") as f:
                 f.write(encode(all_results).decode())
 
-            # Save back to file
             logger.info(f"Updated {benchmark_name} results in benchmark_results.json")
 
         except Exception as e:
             logger.error(f"Error updating results file: {e}")
+
+        self.append_history(results)
+
+    def append_history(self, results: "BenchmarkResults") -> None:
+        """Append results to the history, tagged with this session's context."""
+        from .history import HistoryRecord, HistoryStore, RunContext
+
+        try:
+            if self._run_context is None:
+                # collected once: every suite of one session shares a run id
+                self._run_context = RunContext.collect(self.project_root.parent)
+            record = HistoryRecord(context=self._run_context, benchmark=results)
+            HistoryStore(self.history_path).append(record)
+            logger.info(
+                f"Appended {results.benchmark_name} to {self.history_path.name} "
+                f"(run {self._run_context.run_id})"
+            )
+        except Exception as e:
+            logger.error(f"Error appending to history: {e}")
@@ -0,0 +1,70 @@
+"""
+Dependency-injection benchmark: per-request cost of resolving nested dependencies.
+
+With `BENCH_DI_DEPTH`, `BENCH_DI_WIDTH`, `BENCH_DI_ASYNC` and
+`BENCH_DI_CACHED` in its environment, an app's `/di` handler depends on
+`width` chains of `depth` dependencies, each built from the one below it
+(config -> pool -> repo -> service -> ...) through the framework's own DI:
+Lihil's graph, FastAPI's `Depends`, Litestar's `Provide` and Blacksheep's
+rodi container. Cached variants build every dependency once (a singleton
+scope: Lihil's `reuse`, Litestar's `use_cache`, rodi's `add_singleton`;
+FastAPI, which has none, builds them in the lifespan and hands them out
+through a dependency), uncached ones on every request.
+
+The server runs on a single process and the load is closed-loop, so at
+saturation 1/RPS is its time per request; the DI overhead at a depth is that
+time minus the time at depth 0, where the handler has no dependencies.
+"""
+
+from typing import Optional
+
+from msgspec.structs import replace
+
+from .data_manager import BenchmarkConfig
+from .scenarios import with_path
+
+DI_DEPTHS = [0, 1, 2, 5, 10]
+DI_WIDTHS = [1, 4]
+DI_VARIANTS = ("sync", "async", "sync-cached", "async-cached")
+
+# apps with a DI system, by FRAMEWORKS key (src/starlette.py serves the
+# Litestar app); rodi resolves synchronously only
+DI_FRAMEWORKS = ("lihil", "fastapi", "starlette", "blacksheep")
+SYNC_ONLY = ("blacksheep",)
+
+
+def skip_reason(framework_key: str, variant: str) -> Optional[str]:
+    """Why `framework_key` cannot run `variant`, None if it can."""
+    if framework_key not in DI_FRAMEWORKS:
+        return "has no dependency injection"
+    if variant.startswith("async") and framework_key in SYNC_ONLY:
+        return "resolves dependencies synchronously only"
+    return None
+
+
+def supports(framework_key: str, variant: str) -> bool:
+    return skip_reason(framework_key, variant) is None
+
+
+def app_env(depth: int, width: int, variant: str) -> dict[str, str]:
+    """Environment that shapes the app's `/di` dependency graph."""
+    return {
+        "BENCH_DI_DEPTH": str(depth),
+        "BENCH_DI_WIDTH": str(width),
+        "BENCH_DI_ASYNC": "1" if variant.startswith("async") else "0",
+        "BENCH_DI_CACHED": "1" if variant.endswith("cached") else "0",
+    }
+
+
+def di_config(config: BenchmarkConfig, depth: int, width: int, variant: str) -> BenchmarkConfig:
+    """GET `/di` on `config`'s host and load settings."""
+    return replace(
+        config,
+        bench_name=f"di_{variant}_w{width}@{depth}",
+        method="GET",
+        url=with_path(config.url, "/di"),
+        data=None,
+        scenario=None,
+        mix=None,
+        workload=None,
+    )
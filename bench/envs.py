@@ -0,0 +1,146 @@
+"""
+Cached uv virtualenvs for benchmarking other package versions.
+
+Each `EnvSpec` (a list of pinned requirements, optionally a Python version)
+gets its own virtualenv under `.bench_envs/<key>`, holding the project's
+dependencies from pyproject.toml plus the spec's requirements, whose pins
+are forced on top via `uv pip install --override`. The key hashes the spec
+and pyproject.toml, so an env is built once and reused by later runs until
+either changes.
+
+Local wheels can be offered with `wheels` (`--find-links`); `offline`
+restricts installs to them (`--no-index`).
+"""
+
+import hashlib
+import logging
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional
+
+from msgspec.json import decode, encode
+
+from .data_manager import Base
+
+logger = logging.getLogger(__name__)
+
+ENV_MARKER = ".bench-env.json"
+PROJECT_SPEC = "project"  # the uv project env itself, nothing to build
+
+
+class EnvSpec(Base):
+    requirements: list[str]  # e.g. ["fastapi==0.115.0", "pydantic==2.9.2"]
+    python: str | None = None  # `uv venv --python` request, e.g. "3.13"
+
+    @classmethod
+    def parse(cls, text: str, python: Optional[str] = None) -> "EnvSpec":
+        """`fastapi==0.115.0,pydantic==2.9.2` -> EnvSpec."""
+        return cls(
+            requirements=[req.strip() for req in text.split(",") if req.strip()],
+            python=python,
+        )
+
+    @property
+    def label(self) -> str:
+        label = ",".join(self.requirements) or "unpinned"
+        return f"{label} (py{self.python})" if self.python else label
+
+
+class EnvRecord(Base):
+    """Written into a finished env, its presence marks the env as usable."""
+
+    spec: EnvSpec
+    created_at: float
+    build_seconds: float
+    packages: list[str]  # `uv pip freeze` of the env
+
+
+class EnvCache:
+    def __init__(
+        self,
+        root: Path,
+        project_file: Path,
+        wheels: Optional[Path] = None,
+        offline: bool = False,
+    ):
+        self.root = root
+        self.project_file = project_file
+        self.wheels = wheels
+        self.offline = offline
+
+    def key(self, spec: EnvSpec) -> str:
+        digest = hashlib.sha256(encode(spec))
+        digest.update(self.project_file.read_bytes())
+        return digest.hexdigest()[:16]
+
+    def path(self, spec: EnvSpec) -> Path:
+        return self.root / self.key(spec)
+
+    def load(self, spec: EnvSpec) -> Optional[EnvRecord]:
+        marker = self.path(spec) / ENV_MARKER
+        if not marker.exists():
+            return None
+        return decode(marker.read_bytes(), type=EnvRecord)
+
+    def ensure(self, spec: EnvSpec) -> Optional[Path]:
+        """Python executable of the env for `spec`, building it if needed."""
+        env = self.path(spec)
+        python = env / "bin" / "python"
+        if (env / ENV_MARKER).exists():
+            logger.info(f"Reusing env for {spec.label}: {env}")
+            return python
+
+        if shutil.which("uv") is None:
+            logger.error("uv is required to build version matrix environments")
+            return None
+
+        # a previous build died half way
+        shutil.rmtree(env, ignore_errors=True)
+        env.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Building env for {spec.label} in {env} (first run only)")
+        started = time.monotonic()
+
+        venv_cmd = ["uv", "venv", "--quiet"]
+        if spec.python:
+            venv_cmd += ["--python", spec.python]
+        venv_cmd.append(str(env))
+
+        overrides = env / "overrides.txt"
+        install_cmd = [
+            "uv", "pip", "install", "--quiet",
+            "--python", str(python),
+            "-r", str(self.project_file),
+            "--override", str(overrides),
+            # also as plain requirements, so pins of packages the project
+            # does not depend on (e.g. granian) get installed
+            *spec.requirements,
+        ]
+        if self.wheels is not None:
+            install_cmd += ["--find-links", str(self.wheels)]
+        if self.offline:
+            install_cmd.append("--no-index")
+
+        try:
+            subprocess.run(venv_cmd, capture_output=True, text=True, check=True)
+            overrides.write_text("\n".join(spec.requirements) + "\n")
+            subprocess.run(install_cmd, capture_output=True, text=True, check=True)
+            freeze = subprocess.run(
+                ["uv", "pip", "freeze", "--python", str(python)],
+                capture_output=True, text=True, check=True,
+            ).stdout.split()
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Building env for {spec.label} failed: {e.stderr.strip()}")
+            shutil.rmtree(env, ignore_errors=True)
+            return None
+
+        record = EnvRecord(
+            spec=spec,
+            created_at=time.time(),
+            build_seconds=time.monotonic() - started,
+            packages=freeze,
+        )
+        (env / ENV_MARKER).write_bytes(encode(record))
+        logger.info(f"Built env for {spec.label} in {record.build_seconds:.1f}s")
+        return python
@@ -0,0 +1,157 @@
+"""
+GC and allocator variants of a server under load.
+
+Every variant runs the server under bench/launcher.py with `--gc-stats`, so
+each one reports how often every generation was collected during the
+measured trials and how long the pauses were (a histogram of
+`GC_PAUSE_BOUNDS_US` buckets), next to its RPS and p99:
+
+- `default`: the interpreter's own settings.
+- `freeze`: `gc.collect()` + `gc.freeze()` once the server is warmed up, so
+  the objects built at startup (app, routes, models) are never scanned again.
+- `threshold`: `gc.set_threshold(*GC_THRESHOLD)`, far fewer young
+  collections.
+- `disabled`: `gc.disable()`, no cyclic GC at all. Cycles are never freed,
+  watch the RSS.
+- `malloc`: `PYTHONMALLOC=malloc`, glibc malloc instead of pymalloc, the
+  baseline of the allocator variants. Added before them when missing.
+- `mimalloc`, `jemalloc`: the library `LD_PRELOAD`ed with
+  `PYTHONMALLOC=malloc`; without it pymalloc would keep serving every
+  object up to 512 bytes. Skipped when the library is not installed.
+
+Deltas are reported against the first variant, the allocator variants'
+against `malloc`, so the pymalloc -> malloc switch is not counted in them.
+"""
+
+import ctypes.util
+import logging
+from pathlib import Path
+from typing import Optional, Sequence
+
+from msgspec import DecodeError
+from msgspec.json import decode
+
+from .data_manager import Base, GcGeneration, GcStats
+from .profiler import LauncherWindow
+
+logger = logging.getLogger(__name__)
+
+GC_VARIANTS = ("default", "freeze", "threshold", "disabled", "malloc", "mimalloc", "jemalloc")
+DEFAULT_GC_VARIANTS = ["default", "freeze", "threshold", "disabled", "mimalloc", "jemalloc"]
+GC_THRESHOLD = [50_000, 20, 100]  # CPython defaults to 700, 10, 10
+ALLOCATORS = ("mimalloc", "jemalloc")
+
+
+class GcVariant(Base):
+    name: str
+    launcher: list[str]  # GC options of bench/launcher.py
+    env: dict[str, str] = {}
+
+
+def find_allocator(name: str) -> Optional[str]:
+    """Shared library of an allocator, as `LD_PRELOAD` accepts it."""
+    return ctypes.util.find_library(name)
+
+
+def gc_variants(names: Sequence[str], threshold: Sequence[int] = GC_THRESHOLD) -> list[GcVariant]:
+    """Variants in the order of `names`, allocators that are not installed
+    left out and `malloc`, their baseline, added before the first one."""
+    variants = []
+    for name in names:
+        if (
+            name in ALLOCATORS
+            and "malloc" not in names
+            and find_allocator(name) is not None
+            and not any(variant.name == "malloc" for variant in variants)
+        ):
+            variants.append(GcVariant(name="malloc", launcher=[], env={"PYTHONMALLOC": "malloc"}))
+        if name == "freeze":
+            variants.append(GcVariant(name=name, launcher=["--gc-freeze"]))
+        elif name == "threshold":
+            label = f"threshold {','.join(str(n) for n in threshold)}"
+            option = ",".join(str(n) for n in threshold)
+            variants.append(GcVariant(name=label, launcher=["--gc-threshold", option]))
+        elif name == "disabled":
+            variants.append(GcVariant(name=name, launcher=["--gc-disable"]))
+        elif name == "malloc":
+            variants.append(GcVariant(name=name, launcher=[], env={"PYTHONMALLOC": "malloc"}))
+        elif name in ALLOCATORS:
+            library = find_allocator(name)
+            if library is None:
+                logger.info(f"{name} is not installed, its variant is skipped")
+                continue
+            env = {"LD_PRELOAD": library, "PYTHONMALLOC": "malloc"}
+            variants.append(GcVariant(name=name, launcher=[], env=env))
+        else:
+            variants.append(GcVariant(name=name, launcher=[]))
+    return variants
+
+
+def baselines(variants: Sequence[GcVariant]) -> dict[str, str]:
+    """Variant each allocator variant is compared against, see `matrix_baseline`."""
+    if not any(variant.name == "malloc" for variant in variants):
+        return {}
+    return {variant.name: "malloc" for variant in variants if variant.name in ALLOCATORS}
+
+
+def merge(stats: Sequence[GcStats]) -> GcStats:
+    """Collections of several serving processes, summed per generation."""
+    first = stats[0]
+    generations = []
+    for generation in first.generations:
+        same = [g for s in stats for g in s.generations if g.generation == generation.generation]
+        generations.append(
+            GcGeneration(
+                generation=generation.generation,
+                collections=sum(g.collections for g in same),
+                pause_ms=sum(g.pause_ms for g in same),
+                max_pause_us=max(g.max_pause_us for g in same),
+                collected=sum(g.collected for g in same),
+                histogram=[sum(counts) for counts in zip(*(g.histogram for g in same))],
+            )
+        )
+    return GcStats(
+        window_s=max(s.window_s for s in stats),
+        enabled=first.enabled,
+        threshold=first.threshold,
+        frozen=sum(s.frozen for s in stats),
+        bounds_us=first.bounds_us,
+        generations=generations,
+    )
+
+
+def pause_percentile(generation: GcGeneration, bounds_us: Sequence[float], q: float) -> float:
+    """Upper bound of the bucket holding the `q`th percentile pause, the
+    longest pause for the open last bucket."""
+    target = generation.collections * q / 100
+    seen = 0
+    for bound, count in zip(bounds_us, generation.histogram):
+        seen += count
+        if seen >= target:
+            return bound
+    return generation.max_pause_us
+
+
+def paused_share(stats: GcStats) -> float:
+    """Fraction of the window spent collecting, summed over processes."""
+    total_ms = sum(generation.pause_ms for generation in stats.generations)
+    return total_ms / 1000 / stats.window_s if stats.window_s else 0.0
+
+
+class GcTracker(LauncherWindow):
+    """Talks to the launcher's `GcRecorder`; the records of every serving
+    process are summed on stop."""
+
+    option = "--gc-stats"
+    suffix = ".gc"
+    what = "GC stats"
+
+    def merge(self, paths: list[Path]) -> Optional[GcStats]:
+        stats = []
+        for path in paths:
+            try:
+                stats.append(decode(path.read_bytes(), type=GcStats))
+            except DecodeError as e:
+                logger.error(f"unreadable GC stats {path}: {e}")
+            path.unlink()
+        return merge(stats) if stats else None
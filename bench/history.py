@@ -0,0 +1,334 @@
+"""
+Append-only history of benchmark results and regression checks.
+
+Every time a benchmark suite is recorded, one JSON line is appended to
+`benchmark_history.jsonl` with the results and the context needed to explain
+a change later: git commit, package versions from `uv.lock`, Python version
+and a fingerprint of the host. `benchmark_results.json` keeps only the latest
+numbers for the graphs; the history is never rewritten.
+
+`python -m bench compare` diffs the latest run against a baseline run.
+"""
+
+import argparse
+import hashlib
+import logging
+import math
+import os
+import platform
+import socket
+import subprocess
+import time
+import tomllib
+from pathlib import Path
+from typing import Optional
+
+from msgspec import DecodeError, ValidationError
+from msgspec.json import decode, encode
+
+from .data_manager import Base, BenchmarkResults, FrameworkResult
+
+logger = logging.getLogger(__name__)
+
+
+class HostInfo(Base):
+    hostname: str
+    system: str  # e.g. Linux-6.8.0-x86_64
+    cpu_model: str
+    cpu_count: int
+    memory_mb: int
+    fingerprint: str  # hash of the hardware fields, stable across reboots
+
+    @classmethod
+    def collect(cls) -> "HostInfo":
+        cpu_model, memory_mb = platform.processor() or "unknown", 0
+        try:
+            for line in Path("/proc/cpuinfo").read_text().splitlines():
+                if line.startswith("model name"):
+                    cpu_model = line.split(":", 1)[1].strip()
+                    break
+            for line in Path("/proc/meminfo").read_text().splitlines():
+                if line.startswith("MemTotal"):
+                    memory_mb = int(line.split()[1]) // 1024
+                    break
+        except OSError:
+            pass
+        cpu_count = os.cpu_count() or 0
+        hardware = f"{platform.machine()}|{cpu_model}|{cpu_count}|{memory_mb}"
+        return cls(
+            hostname=socket.gethostname(),
+            system=f"{platform.system()}-{platform.release()}-{platform.machine()}",
+            cpu_model=cpu_model,
+            cpu_count=cpu_count,
+            memory_mb=memory_mb,
+            fingerprint=hashlib.sha256(hardware.encode()).hexdigest()[:12],
+        )
+
+
+class RunContext(Base):
+    """What a run was measured with; shared by every record of one session."""
+
+    run_id: str
+    started_at: float  # unix timestamp
+    git_sha: str | None
+    git_dirty: bool
+    python: str
+    host: HostInfo
+    versions: dict[str, str]  # package -> version, from uv.lock
+
+    @classmethod
+    def collect(cls, repo_root: Path) -> "RunContext":
+        started_at = time.time()
+        sha, dirty = read_git_state(repo_root)
+        return cls(
+            run_id=time.strftime("%Y%m%d-%H%M%S", time.localtime(started_at))
+            + (f"-{sha[:8]}" if sha else ""),
+            started_at=started_at,
+            git_sha=sha,
+            git_dirty=dirty,
+            python=f"{platform.python_implementation()} {platform.python_version()}",
+            host=HostInfo.collect(),
+            versions=read_lock_versions(repo_root / "uv.lock"),
+        )
+
+
+class HistoryRecord(Base):
+    context: RunContext
+    benchmark: BenchmarkResults
+
+
+def read_git_state(repo_root: Path) -> tuple[Optional[str], bool]:
+    """`(HEAD sha, has uncommitted changes)`, `(None, False)` outside git."""
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_root, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=repo_root, capture_output=True, text=True, check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return sha, bool(status.strip())
+
+
+def read_lock_versions(lock_path: Path) -> dict[str, str]:
+    """Pinned package versions from uv.lock."""
+    try:
+        with open(lock_path, "rb") as f:
+            lock = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+    return {
+        package["name"]: package["version"]
+        for package in lock.get("package", [])
+        if "version" in package
+    }
+
+
+class HistoryStore:
+    """JSONL file of `HistoryRecord`s, only ever appended to."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def append(self, record: HistoryRecord) -> None:
+        with open(self.path, "ab") as f:
+            f.write(encode(record) + b"\n")
+
+    def load(self) -> list[HistoryRecord]:
+        if not self.path.exists():
+            return []
+        records = []
+        with open(self.path, "rb") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(decode(line, type=HistoryRecord))
+                except (DecodeError, ValidationError) as e:
+                    logger.warning(f"Skipping {self.path.name}:{lineno}: {e}")
+        return records
+
+    def runs(self) -> dict[str, list[HistoryRecord]]:
+        """Records grouped by run id, oldest run first."""
+        grouped: dict[str, list[HistoryRecord]] = {}
+        for record in sorted(self.load(), key=lambda r: r.context.started_at):
+            grouped.setdefault(record.context.run_id, []).append(record)
+        return grouped
+
+
+class Comparison(Base):
+    benchmark: str
+    framework: str
+    baseline_rps: float
+    candidate_rps: float
+    change: float  # relative, candidate vs baseline
+    threshold: float  # relative change treated as noise
+    status: str  # "regression", "improvement" or "ok"
+
+
+def noise_threshold(
+    baseline: FrameworkResult,
+    candidate: FrameworkResult,
+    default: float,
+    z: float = 2.0,
+) -> float:
+    """Relative RPS change below which a difference is considered noise.
+
+    With repeated trials on both sides this is `z` standard errors of the
+    difference of the means (relative to the baseline), but never below
+    `default`; without trials it is `default`.
+    """
+    a, b = baseline.trials, candidate.trials
+    if a is None or b is None or not baseline.rps:
+        return default
+    stderr = math.sqrt(a.stdev**2 / len(a.samples) + b.stdev**2 / len(b.samples))
+    return max(default, z * stderr / baseline.rps)
+
+
+def compare_results(
+    baseline: BenchmarkResults, candidate: BenchmarkResults, default_threshold: float
+) -> list[Comparison]:
+    """Per-framework RPS change of `candidate` against `baseline`."""
+    base_by_name = {result.framework: result for result in baseline.results}
+    comparisons = []
+    for result in candidate.results:
+        base = base_by_name.get(result.framework)
+        if base is None or not base.rps:
+            continue
+        change = (result.rps - base.rps) / base.rps
+        threshold = noise_threshold(base, result, default_threshold)
+        if change < -threshold:
+            status = "regression"
+        elif change > threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(
+            Comparison(
+                benchmark=candidate.benchmark_name,
+                framework=result.framework,
+                baseline_rps=base.rps,
+                candidate_rps=result.rps,
+                change=change,
+                threshold=threshold,
+                status=status,
+            )
+        )
+    return comparisons
+
+
+def find_run(runs: dict[str, list[HistoryRecord]], ref: str) -> Optional[str]:
+    """Run id matching `ref`: a run id or git sha prefix, latest match wins."""
+    for run_id in reversed(list(runs)):
+        context = runs[run_id][0].context
+        if run_id.startswith(ref) or (context.git_sha or "").startswith(ref):
+            return run_id
+    return None
+
+
+def context_changes(baseline: RunContext, candidate: RunContext) -> list[str]:
+    """Human readable differences in what the two runs were measured with."""
+    changes = []
+    if baseline.host.fingerprint != candidate.host.fingerprint:
+        changes.append(
+            f"host: {baseline.host.hostname} ({baseline.host.cpu_model}) -> "
+            f"{candidate.host.hostname} ({candidate.host.cpu_model})"
+        )
+    if baseline.python != candidate.python:
+        changes.append(f"python: {baseline.python} -> {candidate.python}")
+    for name in sorted(baseline.versions.keys() | candidate.versions.keys()):
+        old, new = baseline.versions.get(name), candidate.versions.get(name)
+        if old != new:
+            changes.append(f"{name}: {old or '-'} -> {new or '-'}")
+    return changes
+
+
+def compare_main(argv: list[str], history_path: Path) -> int:
+    """`python -m bench compare`, returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog="bench compare",
+        description="Compare a benchmark run against a baseline from the history "
+        "and exit non-zero on a significant RPS regression",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Run id or git sha prefix of the baseline (default: the run before the candidate)",
+        metavar="REF",
+    )
+    parser.add_argument(
+        "--candidate",
+        default=None,
+        help="Run id or git sha prefix of the run to check (default: the latest run)",
+        metavar="REF",
+    )
+    parser.add_argument("--test", default=None, help="Only compare this test", metavar="TEST")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Minimum relative RPS change that counts, widened by trial variance "
+        "when both runs have trials (default: 0.05)",
+        metavar="FRACTION",
+    )
+    args = parser.parse_args(argv)
+
+    runs = HistoryStore(history_path).runs()
+    run_ids = list(runs)
+    if len(run_ids) < 2 and args.baseline is None:
+        logger.error(f"Need at least two runs in {history_path.name} to compare")
+        return 2
+
+    candidate_id = find_run(runs, args.candidate) if args.candidate else run_ids[-1]
+    if candidate_id is None:
+        logger.error(f"No run matches {args.candidate!r}")
+        return 2
+    if args.baseline:
+        baseline_id = find_run(runs, args.baseline)
+    else:
+        position = run_ids.index(candidate_id)
+        baseline_id = run_ids[position - 1] if position else None
+    if baseline_id is None:
+        logger.error(f"No baseline run for {candidate_id}")
+        return 2
+
+    baseline = {r.benchmark.benchmark_name: r for r in runs[baseline_id]}
+    candidate = {r.benchmark.benchmark_name: r for r in runs[candidate_id]}
+
+    logger.info(f"Baseline:  {baseline_id}")
+    logger.info(f"Candidate: {candidate_id}")
+    for change in context_changes(
+        runs[baseline_id][-1].context, runs[candidate_id][-1].context
+    ):
+        logger.info(f"  changed {change}")
+
+    comparisons: list[Comparison] = []
+    for name, record in candidate.items():
+        if args.test not in (None, name) or record.benchmark.sweep is not None:
+            continue
+        if name not in baseline:
+            logger.info(f"  {name}: not in baseline, skipped")
+            continue
+        comparisons += compare_results(baseline[name].benchmark, record.benchmark, args.threshold)
+
+    if not comparisons:
+        logger.error("Nothing to compare between the two runs")
+        return 2
+
+    marks = {"regression": "✗", "improvement": "↑", "ok": "✓"}
+    for c in comparisons:
+        logger.info(
+            f"  {marks[c.status]} {c.benchmark}/{c.framework}: "
+            f"{c.baseline_rps:.2f} -> {c.candidate_rps:.2f} RPS "
+            f"({c.change:+.1%}, noise ±{c.threshold:.1%}) {c.status}"
+        )
+
+    regressions = [c for c in comparisons if c.status == "regression"]
+    if regressions:
+        logger.error(f"{len(regressions)} significant regression(s)")
+        return 1
+    logger.info("No significant regressions")
+    return 0
@@ -0,0 +1,267 @@
+"""
+In-process ASGI harness: framework dispatch cost without sockets or an HTTP parser.
+
+Started by path (`python /.../bench/inproc.py src.lihil --path /ping`) from
+the directory holding `src/`, so like the launcher it only depends on the
+standard library and runs inside every framework's environment. It imports
+the module's `app`, runs its lifespan startup and then calls it with
+pre-built `scope`/`receive`/`send` callables in a tight loop on one event
+loop, no server and no open ports involved.
+
+Reported on stdout as one JSON line after `INPROC_MARKER`:
+
+- `ns_per_request`: median over rounds of the time per request, minus the
+  harness's own cost (the same loop driving an app that answers at once).
+- `alloc_bytes`: median peak of memory traced by tracemalloc while serving
+  one request, i.e. what a request allocates at once (CPython keeps no
+  cumulative allocation counter).
+- `retained_blocks`: memory blocks still allocated per request after a
+  full collection, non-zero when requests leak.
+
+With `--stages` the app runs with the timers of bench/stages.py instead:
+`ns_per_request` is then the instrumented time and `stages` its breakdown;
+allocations are not measured.
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Optional
+
+if __package__:
+    from . import stages
+else:
+    import stages  # started by path, next to this file
+
+INPROC_PATH = Path(__file__).resolve()
+INPROC_MARKER = "__INPROC__"
+INPROC_TESTS = ("ping", "complex")  # default tests, `ping` is GET /ping
+
+
+class LifespanError(Exception):
+    pass
+
+
+def http_scope(method: str, target: str, body: bytes, state: dict) -> dict[str, Any]:
+    path, _, query = target.partition("?")
+    headers = [(b"host", b"localhost:8000"), (b"user-agent", b"bench-inproc")]
+    if body:
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.3"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+        "state": state,
+    }
+
+
+async def null_app(scope, receive, send):
+    """The cheapest ASGI app, its cost per request is the harness's."""
+    await receive()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+class Channel:
+    """The `receive`/`send` pair of one request at a time: the body once,
+    then a disconnect; the response status is kept."""
+
+    def __init__(self, body: bytes, recorder=None):
+        self.request = {"type": "http.request", "body": body, "more_body": False}
+        self.received = False
+        self.status = 0
+        self.receive, self.send = self._receive, self._send
+        if recorder is not None:
+            # built once, not per request: the timers are part of the overhead
+            self.receive = recorder.timer(stages.RECEIVE, self._receive)
+            self.send = recorder.timer(stages.SEND, self._send)
+
+    async def _receive(self):
+        if self.received:
+            return {"type": "http.disconnect"}
+        self.received = True
+        return self.request
+
+    async def _send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+
+
+async def call(app, scope: dict, channel: Channel, recorder=None) -> int:
+    """Serve one request, returns the response status. With a
+    `stages.StageRecorder` the request's stages are recorded."""
+    channel.received, channel.status = False, 0
+    # frameworks store routing results in the scope, every request gets its own
+    scope = dict(scope, state=dict(scope["state"]))
+    if recorder is None:
+        await app(scope, channel.receive, channel.send)
+        return channel.status
+
+    started = time.perf_counter_ns()
+    await app(scope, channel.receive, channel.send)
+    recorder.record(time.perf_counter_ns() - started)
+    return channel.status
+
+
+class Lifespan:
+    """Drives the ASGI lifespan protocol of an app, if it speaks it."""
+
+    def __init__(self, app):
+        self.app = app
+        self.state: dict = {}
+        self.inbox: asyncio.Queue = asyncio.Queue()
+        self.outbox: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+
+    async def _send(self, message):
+        await self.outbox.put(message)
+
+    async def _reply(self, event: str) -> None:
+        await self.inbox.put({"type": f"lifespan.{event}"})
+        get = asyncio.ensure_future(self.outbox.get())
+        done, _ = await asyncio.wait({get, self.task}, return_when=asyncio.FIRST_COMPLETED)
+        if get not in done:
+            get.cancel()
+            # returned or raised without answering: no lifespan support
+            return
+        message = get.result()
+        if message["type"].endswith(".failed"):
+            raise LifespanError(message.get("message", f"lifespan {event} failed"))
+
+    async def startup(self):
+        scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": self.state}
+        self.task = asyncio.ensure_future(self.app(scope, self.inbox.get, self._send))
+        await self._reply("startup")
+
+    async def shutdown(self):
+        if self.task is not None and not self.task.done():
+            await self._reply("shutdown")
+
+
+async def time_requests(
+    app, scope: dict, channel: Channel, requests: int, recorder=None
+) -> tuple[float, int]:
+    """`(ns per request, non-2xx responses)` of `requests` back to back requests."""
+    failures = 0
+    started = time.perf_counter_ns()
+    for _ in range(requests):
+        if not 200 <= await call(app, scope, channel, recorder) < 300:
+            failures += 1
+    return (time.perf_counter_ns() - started) / requests, failures
+
+
+async def measure(app, args, recorder=None) -> dict[str, Any]:
+    body = args.body.encode() if args.body else b""
+    lifespan = Lifespan(app)
+    await lifespan.startup()
+    if recorder is not None:
+        # after startup: some frameworks finish building their routes there
+        stages.hook_app(recorder, app)
+    scope = http_scope(args.method, args.path, body, lifespan.state)
+    null_scope = http_scope(args.method, args.path, body, {})
+    channel, null_channel = Channel(body, recorder), Channel(body)
+    try:
+        status = await call(app, scope, channel, recorder)
+        if not 200 <= status < 300:
+            raise SystemExit(f"inproc: {args.method} {args.path} answered {status}")
+
+        await time_requests(app, scope, channel, args.warmup, recorder)
+        await time_requests(null_app, null_scope, null_channel, args.warmup)
+        if recorder is not None:
+            recorder.reset()
+        rounds, harness, failures = [], [], 0
+        for _ in range(args.rounds):
+            ns, failed = await time_requests(app, scope, channel, args.requests, recorder)
+            rounds.append(ns)
+            failures += failed
+            null_ns, _ = await time_requests(null_app, null_scope, null_channel, args.requests)
+            harness.append(null_ns)
+
+        if recorder is not None:
+            harness_ns = statistics.median(harness)
+            return {
+                "ns_per_request": statistics.median(rounds) - harness_ns,
+                "harness_ns": harness_ns,
+                "requests": args.requests * args.rounds,
+                "non_2xx": failures,
+                "hook_calls": sum(recorder.calls) / recorder.requests,
+                "stages": recorder.summary(),
+            }
+
+        tracemalloc.start()
+        peaks = []
+        for _ in range(args.alloc_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await call(app, scope, channel)
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        tracemalloc.stop()
+
+        gc.collect()
+        blocks = sys.getallocatedblocks()
+        await time_requests(app, scope, channel, args.requests)
+        gc.collect()
+        retained = (sys.getallocatedblocks() - blocks) / args.requests
+    finally:
+        await lifespan.shutdown()
+
+    harness_ns = statistics.median(harness)
+    return {
+        "ns_per_request": statistics.median(rounds) - harness_ns,
+        "harness_ns": harness_ns,
+        "rounds_ns": rounds,
+        "requests": args.requests * args.rounds,
+        "non_2xx": failures,
+        "alloc_bytes": statistics.median(peaks),
+        "retained_blocks": retained,
+    }
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(prog="inproc.py")
+    parser.add_argument("module", help="module holding `app`, e.g. src.lihil")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--path", default="/ping", help="path and query, e.g. /profile/p?q=5")
+    parser.add_argument("--body", default=None, help="JSON request body")
+    parser.add_argument("--requests", type=int, default=20_000, help="requests per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=2_000)
+    parser.add_argument("--alloc-samples", type=int, default=200)
+    parser.add_argument("--stages", action="store_true", help="per-stage breakdown, see stages.py")
+    args = parser.parse_args(argv)
+
+    # the app module must resolve from the working directory, not from the
+    # directory this file lives in
+    sys.path[0] = os.getcwd()
+    recorder = None
+    if args.stages:
+        recorder = stages.StageRecorder()
+        package = args.module.rpartition(".")[0]
+        stages.hook_shared(recorder, importlib.import_module(f"{package}.shared"))
+    app = importlib.import_module(args.module).app
+    result = asyncio.run(measure(app, args, recorder))
+    sys.stdout.write(f"{INPROC_MARKER} {json.dumps(result)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+Wrapper that runs a benchmark server with in-process instrumentation.
+
+Started by path (`python /.../bench/launcher.py [options] -- <command>`) in
+place of the server executable, so it only depends on the standard library
+and works inside every framework's environment. `<command>` is what would
+normally follow `uv run`: `uvicorn src.lihil:app ...`, `-m src.robyn`, ...
+
+The instrumentation is idle until the benchmark runner opens the measured
+window with SIGUSR1 and closes it with SIGUSR2, at which point results are
+written out.
+
+    --profile PATH   sample the main thread's stack on SIGPROF (CPU time)
+                     and write collapsed stacks to PATH, `{pid}` in PATH is
+                     replaced by the writing process id
+    --preload MODULE import MODULE (the app) before the server does: servers
+                     load apps through importlib, which `-X importtime`
+                     does not report
+    --tracemalloc PATH  trace allocations and append the call sites holding
+                     the most memory since the first snapshot to PATH
+                     (JSON lines) every --tracemalloc-interval seconds,
+                     `{pid}` as for --profile
+    --gc-stats PATH  count collections and pause times per generation with
+                     `gc.callbacks` and write them to PATH (JSON), `{pid}`
+                     as for --profile
+    --gc-freeze      `gc.collect()` then `gc.freeze()` when the window
+                     opens: whatever startup and warmup left alive is never
+                     scanned again
+    --gc-threshold N[,N[,N]]  `gc.set_threshold()` before the server starts
+    --gc-disable     `gc.disable()` before the server starts
+"""
+
+import argparse
+import bisect
+import gc
+import json
+import os
+import runpy
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+LAUNCHER_PATH = Path(__file__).resolve()
+
+START_SIGNAL = signal.SIGUSR1
+STOP_SIGNAL = signal.SIGUSR2
+
+# upper bounds of the GC pause histogram buckets, the last bucket is open
+GC_PAUSE_BOUNDS_US = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000]
+
+
+def write_output(path_template: Path, text: str):
+    """Write `text` to `path_template` with `{pid}` filled in.
+
+    Written then renamed: the runner polls for the final path, which must
+    only appear complete.
+    """
+    output = Path(str(path_template).replace("{pid}", str(os.getpid())))
+    tmp = output.with_name(output.name + ".tmp")
+    tmp.write_text(text)
+    tmp.replace(output)
+
+
+def wrap_command(command: list[str], options: list[str]) -> list[str]:
+    """Rewrite a server command to run under the launcher with `options`.
+
+    `uv run uvicorn src.x:app ...` becomes
+    `uv run python .../launcher.py <options> -- uvicorn src.x:app ...`.
+    """
+    prefix, rest = [], list(command)
+    if rest[:2] == ["uv", "run"]:
+        prefix, rest = rest[:2], rest[2:]
+        # keep `uv run` options such as `--with granian`
+        while len(rest) > 1 and rest[0].startswith("--"):
+            prefix, rest = prefix + rest[:2], rest[2:]
+    python = "python"
+    if rest and Path(rest[0]).name.startswith("python"):
+        python, rest = rest[0], rest[1:]
+    return [*prefix, python, str(LAUNCHER_PATH), *options, "--", *rest]
+
+
+class StackSampler:
+    """Counts main-thread stacks at a fixed rate of consumed CPU time.
+
+    Uses ITIMER_PROF, so an idle event loop is not sampled: the profile
+    shows where CPU goes, not where the server waits.
+    """
+
+    def __init__(self, output: Path, rate: int = 100):
+        self.output = output
+        self.interval = 1 / rate
+        self.counts: dict[tuple[str, ...], int] = {}
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_qualname} ({code.co_filename})")
+            frame = frame.f_back
+        key = tuple(reversed(stack))
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def start(self, *_):
+        self.counts = {}
+        signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self, *_):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, signal.SIG_IGN)
+        write_output(
+            self.output,
+            "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.counts.items()),
+        )
+
+
+class AllocationTracer:
+    """Periodic tracemalloc snapshots, diffed against the first one.
+
+    The first snapshot is taken one interval into the window, once caches
+    and connection buffers have filled up, so later ones show what keeps
+    growing. Snapshots run on a thread but hold the GIL, the server stalls
+    while one is taken.
+    """
+
+    def __init__(self, output: Path, interval: float = 300.0, frames: int = 5, top: int = 20):
+        self.output = output
+        self.interval = interval
+        self.frames = frames
+        self.top = top
+        self.baseline: Optional[tracemalloc.Snapshot] = None
+        self.started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lines: list[str] = []
+
+    def snapshot(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        if self.baseline is None:
+            self.baseline = snapshot
+            stats = snapshot.statistics("traceback")
+        else:
+            stats = snapshot.compare_to(self.baseline, "traceback")
+        sites = [
+            {
+                # frames come oldest first
+                "site": " <- ".join(
+                    f"{frame.filename}:{frame.lineno}" for frame in reversed(stat.traceback)
+                ),
+                "size_diff_kb": getattr(stat, "size_diff", stat.size) / 1024,
+                "count_diff": getattr(stat, "count_diff", stat.count),
+            }
+            for stat in stats[: self.top]
+        ]
+        traced, _ = tracemalloc.get_traced_memory()
+        self._lines.append(
+            json.dumps(
+                {"t": time.monotonic() - self.started, "traced_mb": traced / 2**20, "sites": sites}
+            )
+        )
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.snapshot()
+
+    def start(self, *_):
+        self.baseline, self._lines = None, []
+        self.started = time.monotonic()
+        self._stop.clear()
+        tracemalloc.start(self.frames)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self, *_):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.snapshot()
+        tracemalloc.stop()
+        write_output(self.output, "\n".join(self._lines) + "\n")
+
+
+class GcRecorder:
+    """Collections and pause times per generation, from `gc.callbacks`.
+
+    Pauses are counted into the `GC_PAUSE_BOUNDS_US` buckets, so a long
+    window costs no memory; the callback adds two clock reads per collection.
+    """
+
+    def __init__(self, output: Path):
+        self.output = output
+        self.started = 0.0
+        self._collecting = 0
+        self.generations: list[dict] = []
+
+    def _callback(self, phase: str, info: dict):
+        if phase == "start":
+            self._collecting = time.perf_counter_ns()
+            return
+        pause_us = (time.perf_counter_ns() - self._collecting) / 1000
+        generation = self.generations[info["generation"]]
+        generation["collections"] += 1
+        generation["pause_ms"] += pause_us / 1000
+        generation["max_pause_us"] = max(generation["max_pause_us"], pause_us)
+        generation["collected"] += info["collected"]
+        generation["histogram"][bisect.bisect_left(GC_PAUSE_BOUNDS_US, pause_us)] += 1
+
+    def start(self, *_):
+        self.generations = [
+            {
+                "generation": generation,
+                "collections": 0,
+                "pause_ms": 0.0,
+                "max_pause_us": 0.0,
+                "collected": 0,
+                "histogram": [0] * (len(GC_PAUSE_BOUNDS_US) + 1),
+            }
+            for generation in range(len(gc.get_count()))
+        ]
+        self.started = time.monotonic()
+        gc.callbacks.append(self._callback)
+
+    def stop(self, *_):
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+        stats = {
+            "window_s": time.monotonic() - self.started,
+            "enabled": gc.isenabled(),
+            "threshold": list(gc.get_threshold()),
+            "frozen": gc.get_freeze_count(),
+            "bounds_us": GC_PAUSE_BOUNDS_US,
+            "generations": self.generations,
+        }
+        write_output(self.output, json.dumps(stats))
+
+
+class GcFreezer:
+    """Moves everything alive when the window opens into the permanent
+    generation, after collecting what is already garbage."""
+
+    def start(self, *_):
+        gc.collect()
+        gc.freeze()
+
+    def stop(self, *_):
+        pass
+
+
+def run_target(target: list[str]):
+    """Run `uvicorn ...`, `sanic ...` or `-m module ...` in this interpreter."""
+    if target and target[0] == "-m":
+        target = target[1:]
+    if not target:
+        raise SystemExit("launcher: no command given after --")
+    # console scripts of the servers we launch share their module's name
+    module, args = target[0], target[1:]
+    sys.argv = [module, *args]
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+
+
+def main(argv: Optional[list[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--" in argv:
+        split = argv.index("--")
+        options, target = argv[:split], argv[split + 1 :]
+    else:
+        options, target = [], argv
+
+    parser = argparse.ArgumentParser(prog="launcher.py")
+    parser.add_argument("--profile", type=Path, default=None, metavar="PATH")
+    parser.add_argument("--profile-rate", type=int, default=100, metavar="HZ")
+    parser.add_argument("--preload", default=None, metavar="MODULE")
+    parser.add_argument("--tracemalloc", type=Path, default=None, metavar="PATH")
+    parser.add_argument("--tracemalloc-interval", type=float, default=300.0, metavar="SECONDS")
+    parser.add_argument("--gc-stats", type=Path, default=None, metavar="PATH")
+    parser.add_argument("--gc-freeze", action="store_true")
+    parser.add_argument(
+        "--gc-threshold",
+        type=lambda value: [int(item) for item in value.split(",")],
+        default=None,
+        metavar="N[,N[,N]]",
+    )
+    parser.add_argument("--gc-disable", action="store_true")
+    args = parser.parse_args(options)
+
+    if args.gc_threshold is not None:
+        gc.set_threshold(*args.gc_threshold)
+    if args.gc_disable:
+        gc.disable()
+
+    instruments: list[StackSampler | AllocationTracer | GcFreezer | GcRecorder] = []
+    # first, so the freezing collection is not recorded
+    if args.gc_freeze:
+        instruments.append(GcFreezer())
+    if args.gc_stats is not None:
+        instruments.append(GcRecorder(args.gc_stats))
+    if args.profile is not None:
+        instruments.append(StackSampler(args.profile, args.profile_rate))
+    if args.tracemalloc is not None:
+        instruments.append(AllocationTracer(args.tracemalloc, args.tracemalloc_interval))
+    if instruments:
+        signal.signal(START_SIGNAL, lambda *_: [i.start() for i in instruments])
+        signal.signal(STOP_SIGNAL, lambda *_: [i.stop() for i in instruments])
+
+    # the server module must resolve from the working directory, not from
+    # the directory this file lives in
+    sys.path[0] = os.getcwd()
+    if args.preload is not None:
+        __import__(args.preload)
+    run_target(target)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,581 @@
+"""
+Built-in asyncio/uvloop load generator, a drop-in replacement for wrk.
+
+Mirrors wrk's model: `threads` worker processes, each running one uvloop
+event loop that owns its share of `connections` raw keep-alive sockets.
+Requests are serialized once up front and responses are parsed with
+httptools, so the per-request cost on the client side stays small.
+
+Closed-loop (default) each connection sends its next request as soon as the
+previous response arrives. Open-loop (`rate` set) each connection owns a fixed
+schedule of send times and latency is measured from the *intended* send time,
+so a stalled server is charged for the requests that queued up behind it (no
+coordinated omission).
+
+`run_stream` keeps one set of generator processes and connections for the
+whole duration and hands every completed second to a callback as it ends,
+without keeping per-request results, for runs of hours.
+
+Usage:
+    python -m bench.loadgen -t4 -c64 -d10s http://localhost:8000/ping
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import queue
+import sys
+from array import array
+from time import perf_counter
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlsplit
+
+import httptools
+from msgspec.json import decode, encode
+
+from .data_manager import Base, BenchmarkConfig, ErrorCounts, SecondStats, WrkSummary
+from .stats import latency_stats, percentile
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is a project dependency
+    uvloop = None
+
+
+def build_request(
+    method: str, url: str, body: Optional[bytes] = None, headers: Optional[dict[str, str]] = None
+) -> bytes:
+    """Serialize a keep-alive HTTP/1.1 request once, reused for every send."""
+    parts = urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+
+    lines = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    if body:
+        lines.append(f"Content-Length: {len(body)}")
+    raw = ("\r\n".join(lines) + "\r\n\r\n").encode()
+    return raw + (body or b"")
+
+
+class Recorder:
+    """Accumulates per-request results for one process.
+
+    With `series` latencies and errors are also kept per second since
+    `start`, by completion time. Without `totals` only those are kept, and
+    `pop_seconds` hands them off as seconds complete.
+    """
+
+    def __init__(self, series: bool = False, totals: bool = True):
+        self.latencies = array("d")  # microseconds
+        self.ttfb = array("d")  # microseconds until the first response byte
+        self.bytes = 0
+        self.errors = ErrorCounts()
+        self.elapsed = 0.0
+        self.start = 0.0
+        self.totals = totals
+        self.seconds: Optional[dict[int, array]] = {} if series else None
+        self.second_errors: dict[int, int] = {}
+        self.popped = 0  # seconds before this one were handed off
+
+    def merge(self, other: "Recorder"):
+        self.latencies.extend(other.latencies)
+        self.ttfb.extend(other.ttfb)
+        self.bytes += other.bytes
+        for field in ErrorCounts.__struct_fields__:
+            setattr(
+                self.errors,
+                field,
+                getattr(self.errors, field) + getattr(other.errors, field),
+            )
+        self.elapsed = max(self.elapsed, other.elapsed)
+        if self.seconds is not None and other.seconds is not None:
+            for second, latencies in other.seconds.items():
+                self.seconds.setdefault(second, array("d")).extend(latencies)
+            for second, errors in other.second_errors.items():
+                self.second_errors[second] = self.second_errors.get(second, 0) + errors
+
+    def record(self, latency: float, status: int, nbytes: int, ttfb: float):
+        if self.totals:
+            self.latencies.append(latency * 1_000_000)
+            self.ttfb.append(ttfb * 1_000_000)
+        self.bytes += nbytes
+        if status > 399:
+            self.errors.status += 1
+        if self.seconds is not None:
+            second = int(perf_counter() - self.start)
+            self.seconds.setdefault(second, array("d")).append(latency * 1_000_000)
+            if status > 399:
+                self.second_errors[second] = self.second_errors.get(second, 0) + 1
+
+    def pop_seconds(self, until: int) -> list[tuple[int, bytes, int]]:
+        """`(second, latencies, errors)` of the seconds before `until` not
+        handed off yet, empty ones included. Results are binned by completion
+        time, so a second is complete once the clock has passed it."""
+        assert self.seconds is not None
+        popped = []
+        for second in range(self.popped, until):
+            latencies = self.seconds.pop(second, array("d"))
+            popped.append((second, latencies.tobytes(), self.second_errors.pop(second, 0)))
+        self.popped = max(self.popped, until)
+        return popped
+
+
+class HttpClientProtocol(asyncio.Protocol):
+    """One keep-alive connection with at most one request in flight."""
+
+    def __init__(self):
+        self.transport: Optional[asyncio.Transport] = None
+        self.parser = httptools.HttpResponseParser(self)
+        self.waiter: Optional[asyncio.Future] = None
+        self.received = 0
+        self.first_byte = 0.0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        if not self.received:
+            self.first_byte = perf_counter()
+        self.received += len(data)
+        try:
+            self.parser.feed_data(data)
+        except httptools.HttpParserError as e:
+            self._finish(exc=e)
+
+    def connection_lost(self, exc):
+        self._finish(exc=exc or ConnectionResetError("connection closed"))
+
+    def on_message_complete(self):
+        self._finish(result=self.parser.get_status_code())
+
+    def _finish(self, result: int = 0, exc: Optional[BaseException] = None):
+        if self.waiter is None or self.waiter.done():
+            return
+        if exc is not None:
+            self.waiter.set_exception(exc)
+        else:
+            self.waiter.set_result(result)
+
+    async def send(self, payload: bytes) -> tuple[int, int]:
+        """Write `payload`, wait for the full response, return (status, bytes).
+
+        `first_byte` holds when the response started arriving.
+        """
+        self.waiter = asyncio.get_running_loop().create_future()
+        self.received = 0
+        assert self.transport is not None
+        self.transport.write(payload)
+        status = await self.waiter
+        return status, self.received
+
+
+async def drive_connection(
+    conn: HttpClientProtocol,
+    payloads: list[bytes],
+    deadline: float,
+    recorder: Recorder,
+    first_send: Optional[float] = None,
+    interval: Optional[float] = None,
+    offset: int = 0,
+    reconnect: Optional[Callable[[], Awaitable[Optional[HttpClientProtocol]]]] = None,
+):
+    """Keep one connection busy until `deadline`.
+
+    Closed-loop when `interval` is None, otherwise send on a fixed schedule
+    (`first_send`, then every `interval` seconds). Times are
+    `time.perf_counter()` values: uvloop's `loop.time()` only has millisecond
+    resolution.
+
+    `payloads` are sent in turn, starting at `offset`, so connections of a
+    request mix do not move through it in lockstep.
+
+    Without `reconnect` the connection stops at its first error; with it a
+    new connection replaces a failed one, for runs that outlive keep-alive
+    timeouts. Sends due while there is no connection are skipped.
+    """
+    intended = first_send
+    position = offset
+    connection: Optional[HttpClientProtocol] = conn
+    while True:
+        if interval is None:
+            started = perf_counter()
+            if started >= deadline:
+                return
+        else:
+            assert intended is not None
+            if intended >= deadline:
+                return
+            delay = intended - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # timers may fire slightly early; a late send is charged from
+            # the intended time, an early one from when it actually went out
+            started = min(intended, perf_counter())
+            intended += interval
+        if connection is None:
+            assert reconnect is not None
+            connection = await reconnect()
+            if connection is None:
+                if interval is None:
+                    await asyncio.sleep(RECONNECT_DELAY)
+                continue
+        payload = payloads[position % len(payloads)]
+        position += 1
+        try:
+            status, nbytes = await connection.send(payload)
+        except (OSError, httptools.HttpParserError):
+            recorder.errors.read += 1
+            if reconnect is None:
+                return
+            if connection.transport is not None:
+                connection.transport.close()
+            connection = None
+            continue
+        recorder.record(
+            perf_counter() - started, status, nbytes, connection.first_byte - started
+        )
+
+
+RECONNECT_DELAY = 0.1  # closed-loop, between failed reconnects
+RESULT_POLL = 1.0  # seconds between checks that the generator processes are alive
+
+
+class WorkerSpec(Base):
+    """Work assigned to one generator process."""
+
+    host: str
+    port: int
+    payloads: list[bytes]  # sent in turn, usually just one
+    duration: float
+    connection_ids: list[int]  # global indexes, used to stagger open-loop sends
+    total_connections: int
+    rate: float | None = None
+    timeout: float = 10.0
+    cores: list[int] | None = None
+    series: bool = False  # also record per-second results
+    stream: bool = False  # hand seconds off as they complete, reconnect failed connections
+
+
+async def run_worker(spec: WorkerSpec, barrier, seconds=None) -> Recorder:
+    """Drive the spec's connections. When streaming, completed seconds go to
+    the `seconds` queue as `("second", second, latencies, errors)`."""
+    loop = asyncio.get_running_loop()
+    recorder = Recorder(spec.series or spec.stream, totals=not spec.stream)
+    opened: list[HttpClientProtocol] = []
+
+    async def connect() -> Optional[HttpClientProtocol]:
+        try:
+            _, conn = await loop.create_connection(HttpClientProtocol, spec.host, spec.port)
+        except OSError:
+            recorder.errors.connect += 1
+            return None
+        opened.append(conn)
+        return conn
+
+    conns: list[tuple[int, HttpClientProtocol]] = []
+    for idx in spec.connection_ids:
+        conn = await connect()
+        if conn is not None:
+            conns.append((idx, conn))
+
+    # every process connects first, then all start together
+    if barrier is not None:
+        barrier.wait()
+
+    start = recorder.start = perf_counter()
+    deadline = start + spec.duration
+    interval = spec.total_connections / spec.rate if spec.rate else None
+    tasks = [
+        asyncio.ensure_future(
+            drive_connection(
+                conn,
+                spec.payloads,
+                deadline,
+                recorder,
+                first_send=start + idx / spec.rate if spec.rate else None,
+                interval=interval,
+                offset=idx * len(spec.payloads) // spec.total_connections,
+                reconnect=connect if spec.stream else None,
+            )
+        )
+        for idx, conn in conns
+    ]
+
+    async def hand_off():
+        while True:
+            await asyncio.sleep(1.0)
+            now = min(int(perf_counter() - start), int(spec.duration))
+            for item in recorder.pop_seconds(now):
+                seconds.put(("second", *item))
+
+    streamer = asyncio.ensure_future(hand_off()) if spec.stream else None
+    if tasks:
+        _, pending = await asyncio.wait(tasks, timeout=spec.duration + spec.timeout)
+        # requests still in flight long after the deadline count as timeouts
+        for task in pending:
+            task.cancel()
+            recorder.errors.timeout += 1
+    recorder.elapsed = perf_counter() - start
+    if streamer is not None:
+        streamer.cancel()
+        # whole seconds only, as in `second_stats`
+        for item in recorder.pop_seconds(int(spec.duration)):
+            seconds.put(("second", *item))
+
+    for conn in opened:
+        if conn.transport is not None:
+            conn.transport.close()
+    return recorder
+
+
+def run_loop(spec: WorkerSpec, barrier=None, seconds=None) -> Recorder:
+    """Run one worker on a fresh (uv)loop in the current process."""
+    if spec.cores:
+        os.sched_setaffinity(0, spec.cores)
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    return runner(run_worker(spec, barrier, seconds))
+
+
+def _process_main(spec: WorkerSpec, barrier, results):
+    try:
+        results.put(run_loop(spec, barrier))
+    except BaseException:
+        barrier.abort()
+        results.put(None)
+        raise
+
+
+def _stream_main(spec: WorkerSpec, barrier, results):
+    """Streaming worker: seconds and the final recorder share `results`."""
+    try:
+        results.put(("done", run_loop(spec, barrier, results)))
+    except BaseException:
+        barrier.abort()
+        results.put(("done", None))
+        raise
+
+
+def receive(results, procs: list) -> object:
+    """Next message of the generator processes.
+
+    Polls, so a process killed without reporting (e.g. by the OOM killer)
+    raises instead of leaving the runner waiting forever.
+    """
+    while True:
+        try:
+            return results.get(timeout=RESULT_POLL)
+        except queue.Empty:
+            pass
+        for proc in procs:
+            if proc.exitcode not in (None, 0):
+                raise RuntimeError(f"load generator process exited with code {proc.exitcode}")
+        if all(proc.exitcode is not None for proc in procs):
+            raise RuntimeError("load generator processes exited without reporting")
+
+
+def stats_of(second: int, latencies: array, errors: int) -> SecondStats:
+    ordered = sorted(latencies)
+    return SecondStats(
+        second=second,
+        requests=len(ordered),
+        errors=errors,
+        p50=percentile(ordered, 50),
+        p99=percentile(ordered, 99),
+    )
+
+
+def second_stats(recorder: Recorder) -> list[SecondStats]:
+    """Per-second results of whole seconds, the tail after the deadline
+    (requests still in flight) dropped."""
+    assert recorder.seconds is not None
+    return [
+        stats_of(
+            second,
+            recorder.seconds.get(second, array("d")),
+            recorder.second_errors.get(second, 0),
+        )
+        for second in range(int(recorder.elapsed))
+    ]
+
+
+def summarize(recorder: Recorder) -> WrkSummary:
+    """Convert raw samples into the wrk summary schema."""
+    return WrkSummary(
+        requests=len(recorder.latencies),
+        duration_us=int(recorder.elapsed * 1_000_000),
+        bytes=recorder.bytes,
+        latency=latency_stats(recorder.latencies),
+        errors=recorder.errors,
+        ttfb=latency_stats(recorder.ttfb),
+        series=second_stats(recorder) if recorder.seconds is not None else None,
+    )
+
+
+def split_workers(
+    benchmark_config: BenchmarkConfig,
+    cores: Optional[list[int]] = None,
+    timeout: float = 10.0,
+    series: bool = False,
+    stream: bool = False,
+) -> list[WorkerSpec]:
+    """Split connections round-robin over `threads` processes, like wrk."""
+    parts = urlsplit(benchmark_config.url)
+    variants = benchmark_config.requests
+    requests = [
+        build_request(
+            variant.method,
+            variant.url,
+            variant.body,
+            {"Content-Type": "application/json"} if variant.data is not None else None,
+        )
+        for variant in variants
+    ]
+    # the same weighted order the wrk script replays
+    payloads = [requests[idx] for idx in benchmark_config.request_cycle()]
+    connections = benchmark_config.connections
+    processes = max(min(benchmark_config.threads, connections), 1)
+
+    return [
+        WorkerSpec(
+            host=parts.hostname or "localhost",
+            port=parts.port or 80,
+            payloads=payloads,
+            duration=benchmark_config.duration_seconds,
+            connection_ids=list(range(worker, connections, processes)),
+            total_connections=connections,
+            rate=benchmark_config.rate,
+            timeout=timeout,
+            cores=cores,
+            series=series,
+            stream=stream,
+        )
+        for worker in range(processes)
+    ]
+
+
+def run_benchmark(
+    benchmark_config: BenchmarkConfig, cores: Optional[list[int]] = None, series: bool = False
+) -> WrkSummary:
+    """Benchmark `benchmark_config` with `threads` generator processes.
+
+    Closed-loop unless `benchmark_config.rate` is set. With `series` the
+    summary holds per-second results as well.
+    """
+    specs = split_workers(benchmark_config, cores, series=series)
+    if len(specs) == 1:
+        return summarize(run_loop(specs[0]))
+
+    # spawn: the runner may have threads alive (parallel scheduler)
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(len(specs))
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_process_main, args=(spec, barrier, results), daemon=True)
+        for spec in specs
+    ]
+    for proc in procs:
+        proc.start()
+
+    total = Recorder(series)
+    try:
+        for _ in procs:
+            recorder = receive(results, procs)
+            if recorder is None:
+                raise RuntimeError("load generator process failed")
+            total.merge(recorder)
+    finally:
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.kill()
+    return summarize(total)
+
+
+def run_stream(
+    benchmark_config: BenchmarkConfig,
+    on_second: Callable[[SecondStats], None],
+    cores: Optional[list[int]] = None,
+) -> ErrorCounts:
+    """Drive `benchmark_config` on one set of connections for its whole
+    duration, calling `on_second` with every completed second, in order.
+
+    Failed connections are replaced, so keep-alive timeouts and server-side
+    closes do not wear the load down over hours. Exceptions raised by
+    `on_second` stop the run. Returns the error counters of the whole run.
+    """
+    specs = split_workers(benchmark_config, cores, stream=True)
+    # processes even for one worker, this one merges the seconds meanwhile
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(len(specs))
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_stream_main, args=(spec, barrier, results), daemon=True)
+        for spec in specs
+    ]
+    for proc in procs:
+        proc.start()
+
+    # a second is complete once every worker has handed it off
+    pending: dict[int, tuple[array, list[int]]] = {}
+    total = Recorder()
+    done = 0
+    try:
+        while done < len(procs):
+            message = receive(results, procs)
+            if message[0] == "done":
+                if message[1] is None:
+                    raise RuntimeError("load generator process failed")
+                total.merge(message[1])
+                done += 1
+                continue
+            _, second, raw, errors = message
+            latencies, counts = pending.setdefault(second, (array("d"), [0, 0]))
+            latencies.frombytes(raw)
+            counts[0] += 1
+            counts[1] += errors
+            if counts[0] == len(procs):
+                del pending[second]
+                on_second(stats_of(second, latencies, counts[1]))
+    finally:
+        for proc in procs:
+            if done < len(procs):
+                proc.kill()
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.kill()
+    return total.errors
+
+
+def main():
+    """Minimal wrk-compatible CLI, prints the summary as JSON."""
+    parser = argparse.ArgumentParser(
+        prog="bench.loadgen", description="asyncio/uvloop HTTP load generator"
+    )
+    parser.add_argument("url")
+    parser.add_argument("-t", "--threads", type=int, default=4, help="Generator processes")
+    parser.add_argument("-c", "--connections", type=int, default=64)
+    parser.add_argument("-d", "--duration", default="10s")
+    parser.add_argument("-R", "--rate", type=int, default=None, help="Open-loop requests/sec")
+    parser.add_argument("-m", "--method", default="GET")
+    parser.add_argument("--body", default=None, help="JSON request body")
+    args = parser.parse_args()
+
+    config = BenchmarkConfig(
+        bench_name="cli",
+        method=args.method,
+        url=args.url,
+        data=decode(args.body) if args.body else None,
+        threads=args.threads,
+        connections=args.connections,
+        duration=args.duration,
+        rate=args.rate,
+    )
+    sys.stdout.write(encode(run_benchmark(config)).decode() + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Middleware-stack benchmark: marginal cost of each middleware layer.
+
+With `BENCH_MIDDLEWARE=<layers>` and `BENCH_MIDDLEWARE_KIND` in its
+environment, an app stacks that many equivalent layers, each adding an
+`x-layer-<i>` response header:
+
+- `native`: the framework's own middleware API (Starlette/FastAPI
+  `BaseHTTPMiddleware`, Litestar `ASGIMiddleware`, Blacksheep and Sanic
+  middleware functions, Robyn `after_request`; Lihil's middleware are ASGI
+  factories registered on the app).
+- `asgi`: pure ASGI middleware wrapped around the whole app, for the apps
+  served through an ASGI server (Sanic runs under uvicorn unless it is given
+  workers, which the sweep never does).
+
+Requests go to `/ping`, so the handler adds as little as possible on top
+of the stack.
+"""
+
+from typing import Sequence
+
+from msgspec.structs import replace
+
+from .data_manager import BenchmarkConfig, SweepPoint
+from .scenarios import with_path
+from .stats import linear_fit
+
+MIDDLEWARE_LAYERS = [0, 1, 5, 10]
+MIDDLEWARE_KINDS = ("native", "asgi")
+
+# served by its own server, nothing to wrap in ASGI middleware
+NATIVE_ONLY = ("robyn",)
+
+
+def supports(framework_key: str, kind: str) -> bool:
+    return kind == "native" or framework_key not in NATIVE_ONLY
+
+
+def app_env(layers: int, kind: str) -> dict[str, str]:
+    """Environment that stacks `layers` middleware of `kind` on the app."""
+    return {"BENCH_MIDDLEWARE": str(layers), "BENCH_MIDDLEWARE_KIND": kind}
+
+
+def middleware_config(config: BenchmarkConfig, layers: int, kind: str) -> BenchmarkConfig:
+    """GET `/ping` on `config`'s host and load settings."""
+    return replace(
+        config,
+        bench_name=f"middleware_{kind}@{layers}",
+        method="GET",
+        url=with_path(config.url, "/ping"),
+        data=None,
+        scenario=None,
+        mix=None,
+        workload=None,
+    )
+
+
+def per_layer_cost(points: Sequence[SweepPoint]) -> tuple[float, float, float]:
+    """Fitted cost of one more layer.
+
+    Returns `(server us, p50 latency us, RPS change)` per layer, the RPS
+    change relative to the fitted throughput without middleware.
+    """
+    layers = [point.value for point in points]
+    server_us, _ = linear_fit(layers, [1e6 / point.rps for point in points])
+    with_latency = [point for point in points if point.latency is not None]
+    latency_us, _ = linear_fit(
+        [point.value for point in with_latency], [point.latency.p50 for point in with_latency]
+    )
+    rps_slope, rps_base = linear_fit(layers, [point.rps for point in points])
+    return server_us, latency_us, rps_slope / rps_base if rps_base else 0.0
@@ -0,0 +1,278 @@
+"""
+Minimal /proc readers for the benchmark server process tree.
+
+Servers are launched through `uv run`, so the process we spawn is usually
+not the one serving requests; everything here works on the whole tree.
+"""
+
+import os
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .data_manager import Base, ResourceUsage, SoakSample
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PROC = Path("/proc")
+
+
+def read_stat(pid: int) -> list[str]:
+    """Fields of /proc/<pid>/stat, with the command name collapsed.
+
+    The command name may contain spaces and parentheses, so split after the
+    last ')'. Index i holds field i + 1 of `man 5 proc`: pid, comm, state,
+    ppid, ...
+    """
+    raw = (PROC / str(pid) / "stat").read_text()
+    head, _, tail = raw.rpartition(")")
+    pid_str, _, comm = head.partition(" (")
+    return [pid_str, comm, *tail.split()]
+
+
+def process_tree(root: int) -> list[int]:
+    """`root` and all its live descendants."""
+    children: dict[int, list[int]] = {}
+    for entry in PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            ppid = int(read_stat(int(entry.name))[3])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    tree, stack = [], [root]
+    while stack:
+        pid = stack.pop()
+        tree.append(pid)
+        stack.extend(children.get(pid, []))
+    return tree
+
+
+def cpu_seconds(pids: list[int]) -> float:
+    """Total user + system CPU time consumed by `pids`."""
+    total = 0
+    for pid in pids:
+        try:
+            fields = read_stat(pid)
+        except OSError:
+            continue
+        # utime, stime are fields 14 and 15
+        total += int(fields[13]) + int(fields[14])
+    return total / CLOCK_TICKS
+
+
+def read_status(pid: int) -> dict[str, str]:
+    """Key/value pairs of /proc/<pid>/status, e.g. `VmRSS: 51200 kB`."""
+    status = {}
+    for line in (PROC / str(pid) / "status").read_text().splitlines():
+        key, _, value = line.partition(":")
+        status[key] = value.strip()
+    return status
+
+
+def count_fds(pid: int) -> tuple[int, int]:
+    """Open file descriptors of `pid`: `(sockets, everything else)`.
+
+    Sockets come and go with client connections, files, pipes and the like
+    are what a leak shows up in.
+    """
+    fd_dir = PROC / str(pid) / "fd"
+    sockets = others = 0
+    for fd in os.listdir(fd_dir):
+        try:
+            target = os.readlink(fd_dir / fd)
+        except OSError:
+            continue  # closed meanwhile
+        if target.startswith("socket:"):
+            sockets += 1
+        else:
+            others += 1
+    return sockets, others
+
+
+class ProcessReading(Base):
+    """Counters of one process at one point in time."""
+
+    utime: float  # seconds
+    stime: float
+    rss_mb: float
+    threads: int
+    voluntary_ctx: int
+    involuntary_ctx: int
+
+
+def read_process(pid: int) -> ProcessReading:
+    stat, status = read_stat(pid), read_status(pid)
+    return ProcessReading(
+        utime=int(stat[13]) / CLOCK_TICKS,
+        stime=int(stat[14]) / CLOCK_TICKS,
+        rss_mb=int(status["VmRSS"].split()[0]) / 1024,  # kB
+        threads=int(status["Threads"]),
+        voluntary_ctx=int(status["voluntary_ctxt_switches"]),
+        involuntary_ctx=int(status["nonvoluntary_ctxt_switches"]),
+    )
+
+
+def leaf_processes(tree: list[int]) -> list[int]:
+    """Processes of `tree` without children: the ones serving requests.
+
+    Strips the `uv run` launcher, worker managers (uvicorn/sanic master) and
+    multiprocessing helpers such as the resource tracker.
+    """
+    parents = set()
+    for pid in tree:
+        try:
+            parents.add(int(read_stat(pid)[3]))
+        except (OSError, IndexError, ValueError):
+            continue
+    return [pid for pid in tree if pid not in parents and not is_helper(pid)]
+
+
+def is_helper(pid: int) -> bool:
+    try:
+        cmdline = (PROC / str(pid) / "cmdline").read_bytes()
+    except OSError:
+        return False
+    return b"multiprocessing.resource_tracker" in cmdline or b"multiprocessing.forkserver" in cmdline
+
+
+class ResourceSampler:
+    """Samples a server process tree from a background thread.
+
+    CPU time and context switches are cumulative counters, so only their
+    first and last readings per process matter; RSS and thread count are
+    gauges and are sampled every `interval` seconds. Processes that appear
+    during the window (workers being respawned) are counted from zero.
+    """
+
+    def __init__(self, root: int, interval: float = 0.2):
+        self.root = root
+        self.interval = interval
+        self.first: dict[int, ProcessReading] = {}
+        self.last: dict[int, ProcessReading] = {}
+        self.rss: list[float] = []  # whole tree, per sample
+        self.worker_rss: list[float] = []  # mean over leaf processes, per sample
+        self.threads: list[int] = []
+        self.workers = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self, baseline: bool = False):
+        tree = process_tree(self.root)
+        readings = {}
+        for pid in tree:
+            try:
+                readings[pid] = read_process(pid)
+            except (OSError, IndexError, KeyError, ValueError):
+                continue  # exited between the tree scan and the read
+        if not readings:
+            return
+
+        for pid, reading in readings.items():
+            if pid not in self.first:
+                self.first[pid] = reading if baseline else ProcessReading(0, 0, 0, 0, 0, 0)
+            self.last[pid] = reading
+
+        leaves = [pid for pid in leaf_processes(list(readings)) if pid in readings]
+        self.workers = max(self.workers, len(leaves))
+        self.rss.append(sum(r.rss_mb for r in readings.values()))
+        self.worker_rss.append(sum(readings[pid].rss_mb for pid in leaves) / max(len(leaves), 1))
+        self.threads.append(sum(r.threads for r in readings.values()))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.sample(baseline=True)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop the sampling thread without summarizing."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stop(self, requests: int = 0) -> Optional[ResourceUsage]:
+        """Stop sampling and summarize the window, None if nothing was read."""
+        self.cancel()
+        self.sample()
+        if not self.rss:
+            return None
+
+        def delta(field: str) -> float:
+            return sum(
+                getattr(self.last[pid], field) - getattr(self.first[pid], field)
+                for pid in self.last
+            )
+
+        user, system = delta("utime"), delta("stime")
+        # the first half covers ramp-up (imports, caches, connection buffers)
+        steady = self.rss[len(self.rss) // 2 :]
+        steady_worker = self.worker_rss[len(self.worker_rss) // 2 :]
+        return ResourceUsage(
+            user_cpu_s=user,
+            sys_cpu_s=system,
+            peak_rss_mb=max(self.rss),
+            steady_rss_mb=statistics.median(steady),
+            voluntary_ctx_switches=int(delta("voluntary_ctx")),
+            involuntary_ctx_switches=int(delta("involuntary_ctx")),
+            threads=max(self.threads),
+            workers=self.workers,
+            cpu_us_per_request=(user + system) * 1_000_000 / requests if requests else None,
+            mb_per_worker=statistics.median(steady_worker) if self.workers else None,
+            start_rss_mb=self.rss[0],
+        )
+
+
+class ResourceSeries:
+    """RSS and open file descriptors of a server process tree over time,
+    sampled from a background thread every `interval` seconds."""
+
+    def __init__(self, root: int, interval: float = 5.0):
+        self.root = root
+        self.interval = interval
+        self.samples: list[SoakSample] = []
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self):
+        rss, fds, sockets, read = 0.0, 0, 0, False
+        for pid in process_tree(self.root):
+            try:
+                rss += int(read_status(pid)["VmRSS"].split()[0]) / 1024  # kB
+                pid_sockets, pid_fds = count_fds(pid)
+            except (OSError, KeyError, ValueError):
+                continue  # exited, or a kernel thread without VmRSS
+            fds += pid_fds
+            sockets += pid_sockets
+            read = True
+        if read:
+            t = time.monotonic() - self._started
+            self.samples.append(SoakSample(t=t, rss_mb=rss, fds=fds, sockets=sockets))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self, started: Optional[float] = None):
+        """Sample from now on, `t` counting from `started` (monotonic)."""
+        self._started = time.monotonic() if started is None else started
+        self.sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> list[SoakSample]:
+        """Stop sampling after a last sample, again is a no-op."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self.sample()
+        return self.samples
@@ -0,0 +1,309 @@
+"""
+Sampling profiles of a server under load, written as collapsed stacks and
+SVG flamegraphs.
+
+Two backends share the same start/stop interface:
+
+- `PySpyProfiler` attaches py-spy to the server process tree (no changes to
+  the server, needs ptrace permission).
+- `SignalProfiler` talks to the `StackSampler` of `bench/launcher.py`, which
+  the server must have been started under (`FrameWorkConfig.launcher`).
+
+Collapsed stacks use the flamegraph.pl format: one `frame;frame;frame count`
+line per unique stack, root first, frames formatted `function (file)`.
+"""
+
+import html
+import logging
+import os
+import shutil
+import signal
+import subprocess
+import time
+from pathlib import Path
+from typing import Optional
+
+from .launcher import START_SIGNAL, STOP_SIGNAL
+from .procfs import leaf_processes, process_tree
+
+logger = logging.getLogger(__name__)
+
+Stacks = dict[tuple[str, ...], int]
+
+# (category, substrings of the frame's file path), first match wins
+CATEGORIES: list[tuple[str, tuple[str, ...]]] = [
+    ("shared.py", ("/src/shared.py",)),
+    ("pydantic/msgspec", ("/pydantic/", "/pydantic_core/", "/msgspec/")),
+    ("uvicorn/httptools", ("/uvicorn/", "/httptools/", "/uvloop/", "/h11/")),
+    (
+        "framework",
+        (
+            "/lihil/", "/ididi/", "/starlette/", "/fastapi/", "/litestar/",
+            "/blacksheep/", "/sanic/", "/sanic_routing/", "/robyn/", "/src/",
+        ),
+    ),
+]
+OTHER = "other"
+
+COLORS = {
+    "shared.py": "#7fc97f",
+    "pydantic/msgspec": "#beaed4",
+    "uvicorn/httptools": "#80b1d3",
+    "framework": "#fdb462",
+    OTHER: "#d9d9d9",
+}
+
+
+def pyspy_available() -> bool:
+    return shutil.which("py-spy") is not None
+
+
+def frame_path(frame: str) -> str:
+    """File part of a `function (file)` / `function (file:line)` frame."""
+    _, _, location = frame.rpartition(" (")
+    return location.rstrip(")")
+
+
+def categorize(frame: str) -> str:
+    path = frame_path(frame)
+    for category, needles in CATEGORIES:
+        if any(needle in path for needle in needles):
+            return category
+    return OTHER
+
+
+def read_collapsed(path: Path) -> Stacks:
+    stacks: Stacks = {}
+    for line in path.read_text().splitlines():
+        stack, _, count = line.rpartition(" ")
+        if not stack or not count.isdigit():
+            continue
+        key = tuple(stack.split(";"))
+        stacks[key] = stacks.get(key, 0) + int(count)
+    return stacks
+
+
+def self_time(stacks: Stacks) -> dict[str, int]:
+    """Samples per function where it was the innermost (running) frame."""
+    totals: dict[str, int] = {}
+    for stack, count in stacks.items():
+        totals[stack[-1]] = totals.get(stack[-1], 0) + count
+    return totals
+
+
+def category_time(stacks: Stacks) -> dict[str, int]:
+    """Self samples per category."""
+    totals: dict[str, int] = {}
+    for frame, count in self_time(stacks).items():
+        category = categorize(frame)
+        totals[category] = totals.get(category, 0) + count
+    return totals
+
+
+def format_top(stacks: Stacks, top: int = 20) -> list[str]:
+    """Category split plus the `top` hottest functions by self time."""
+    total = sum(stacks.values())
+    if not total:
+        return ["no samples collected"]
+
+    lines = [f"{total} samples", "", f"{'self%':>7}  category"]
+    for category, count in sorted(category_time(stacks).items(), key=lambda kv: -kv[1]):
+        lines.append(f"{count / total:>7.1%}  {category}")
+
+    lines += ["", f"{'self%':>7}  {'category':<18} function"]
+    hottest = sorted(self_time(stacks).items(), key=lambda kv: -kv[1])[:top]
+    for frame, count in hottest:
+        lines.append(f"{count / total:>7.1%}  {categorize(frame):<18} {frame}")
+    return lines
+
+
+class _Node:
+    __slots__ = ("count", "children")
+
+    def __init__(self):
+        self.count = 0
+        self.children: dict[str, "_Node"] = {}
+
+
+def render_flamegraph(stacks: Stacks, title: str, width: int = 1200) -> str:
+    """Minimal flamegraph SVG: root at the bottom, width ~ samples, colored
+    by category, hover for the full frame and sample count."""
+    root = _Node()
+    for stack, count in stacks.items():
+        node = root
+        node.count += count
+        for frame in stack:
+            node = node.children.setdefault(frame, _Node())
+            node.count += count
+
+    def depth(node: _Node) -> int:
+        return 1 + max((depth(child) for child in node.children.values()), default=0)
+
+    row, top_margin, min_width = 16, 24, 0.5
+    height = top_margin + depth(root) * row
+    total = root.count or 1
+    rects: list[str] = []
+
+    def draw(node: _Node, name: str, x: float, level: int):
+        w = node.count / total * width
+        if w < min_width:
+            return
+        y = height - (level + 1) * row
+        label = f"{name} ({node.count} samples, {node.count / total:.1%})"
+        color = COLORS.get(categorize(name), COLORS[OTHER]) if level else "#e0e0e0"
+        chars = int(w / 7)
+        text = name if len(name) <= chars else name[: max(chars - 2, 0)] + ".."
+        rects.append(
+            f'<g><title>{html.escape(label)}</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{w:.2f}" height="{row - 1}" fill="{color}"/>'
+            + (f'<text x="{x + 3:.2f}" y="{y + row - 4}">{html.escape(text)}</text>' if chars > 2 else "")
+            + "</g>"
+        )
+        for child_name, child in sorted(node.children.items()):
+            draw(child, child_name, x, level + 1)
+            x += child.count / total * width
+
+    draw(root, "all", 0.0, 0)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="monospace" font-size="11">'
+        f'<text x="{width / 2}" y="16" text-anchor="middle" font-size="14">{html.escape(title)}</text>'
+        + "".join(rects)
+        + "</svg>"
+    )
+
+
+def write_profile(stacks: Stacks, output: Path, title: str, top: int = 20) -> list[str]:
+    """Write `<output>.collapsed`, `.svg` and `.txt` (top-N table)."""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.with_suffix(".collapsed").open("w") as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{';'.join(stack)} {count}\n")
+    output.with_suffix(".svg").write_text(render_flamegraph(stacks, title))
+    table = format_top(stacks, top)
+    output.with_suffix(".txt").write_text("\n".join([title, "", *table]) + "\n")
+    return table
+
+
+class PySpyProfiler:
+    """`py-spy record` attached to the server tree for the measured window."""
+
+    def __init__(self, root_pid: int, output: Path, rate: int = 100):
+        self.root_pid = root_pid
+        self.raw = output.with_suffix(".pyspy")
+        self.rate = rate
+        self.process: Optional[subprocess.Popen] = None
+
+    def start(self):
+        self.raw.parent.mkdir(parents=True, exist_ok=True)
+        self.process = subprocess.Popen(
+            [
+                "py-spy", "record",
+                "--pid", str(self.root_pid),
+                "--subprocesses",
+                "--rate", str(self.rate),
+                "--nolineno",
+                "--format", "raw",
+                "--output", str(self.raw),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+    def stop(self) -> Optional[Stacks]:
+        if self.process is None:
+            return None
+        # py-spy writes its output when interrupted
+        self.process.send_signal(signal.SIGINT)
+        try:
+            _, stderr = self.process.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+            logger.error("py-spy did not exit after the measured window")
+            return None
+        if not self.raw.exists():
+            logger.error(f"py-spy wrote no profile: {stderr.decode().strip()}")
+            return None
+        stacks = read_collapsed(self.raw)
+        self.raw.unlink()
+        return stacks
+
+
+class LauncherWindow:
+    """Opens/closes the measured window of an instrument in servers run under
+    bench/launcher.py, which the server must have been started with
+    (`FrameWorkConfig.launcher`).
+
+    Every serving process writes `<output>.<pid><suffix>` when the window
+    closes; subclasses turn those files into a result in `merge`.
+    """
+
+    option = ""  # launcher option taking the output path
+    suffix = ""
+    what = "output"  # for log messages
+
+    def __init__(self, root_pid: int, output: Path, timeout: float = 10.0):
+        self.root_pid = root_pid
+        self.output = output
+        self.timeout = timeout
+        self.pids: list[int] = []
+
+    @classmethod
+    def launcher_options(cls, output: Path) -> list[str]:
+        """Options for `FrameWorkConfig.launcher`, `{pid}` is filled in per process."""
+        return [cls.option, str(output.with_suffix(".{pid}" + cls.suffix))]
+
+    def part(self, pid: int) -> Path:
+        return self.output.with_suffix(f".{pid}{self.suffix}")
+
+    def start(self):
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self.pids = leaf_processes(process_tree(self.root_pid))
+        for pid in self.pids:
+            self.part(pid).unlink(missing_ok=True)
+            os.kill(pid, START_SIGNAL)
+
+    def stop(self):
+        if not self.pids:
+            return None
+        for pid in self.pids:
+            try:
+                os.kill(pid, STOP_SIGNAL)
+            except ProcessLookupError:
+                logger.warning(f"server process {pid} exited during the measured window")
+
+        deadline = time.monotonic() + self.timeout
+        parts = [self.part(pid) for pid in self.pids]
+        while time.monotonic() < deadline and not all(p.exists() for p in parts):
+            time.sleep(0.05)
+
+        written = [path for path in parts if path.exists()]
+        if not written:
+            logger.error(f"launcher wrote no {self.what}, was the server started under it?")
+            return None
+        return self.merge(written)
+
+    def merge(self, paths: list[Path]):
+        raise NotImplementedError
+
+
+class SignalProfiler(LauncherWindow):
+    """Talks to the launcher's `StackSampler`; the collapsed stacks of every
+    serving process are merged on stop."""
+
+    option = "--profile"
+    suffix = ".collapsed"
+    what = "profile"
+
+    @classmethod
+    def launcher_options(cls, output: Path, rate: int = 100) -> list[str]:
+        return [*super().launcher_options(output), "--profile-rate", str(rate)]
+
+    def merge(self, paths: list[Path]) -> Stacks:
+        stacks: Stacks = {}
+        for path in paths:
+            for stack, count in read_collapsed(path).items():
+                stacks[stack] = stacks.get(stack, 0) + count
+            path.unlink()
+        return stacks
@@ -0,0 +1,101 @@
+"""
+Readiness and shutdown checks for benchmark servers.
+
+Instead of sleeping for a fixed amount of time we actively poll the server:
+first a TCP connect to the port, then an HTTP request against the benchmark
+URL. Polling backs off exponentially up to a deadline, so fast servers are
+benchmarked as soon as they serve and broken ones fail quickly.
+"""
+
+import http.client
+import socket
+import subprocess
+import time
+from urllib.parse import urlsplit
+
+INITIAL_BACKOFF = 0.01
+MAX_BACKOFF = 0.5
+
+
+class ServerNotReady(Exception):
+    """Raised when a server exits or misses its readiness deadline."""
+
+
+def split_host_port(url: str) -> tuple[str, int]:
+    parts = urlsplit(url)
+    return parts.hostname or "localhost", parts.port or 80
+
+
+def is_port_free(port: int, host: str = "127.0.0.1") -> bool:
+    """Whether a server could bind `host:port` right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+def wait_for_port_free(port: int, timeout: float) -> bool:
+    """Poll until `port` can be bound again, returns False on timeout."""
+    deadline = time.monotonic() + timeout
+    delay = INITIAL_BACKOFF
+    while not is_port_free(port):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_BACKOFF)
+    return True
+
+
+def probe_http(url: str, timeout: float = 1.0) -> bool:
+    """TCP connect then issue a GET against `url`.
+
+    Any HTTP response counts as ready, including 404/405 for routes that
+    only accept POST: we only care that the application is serving.
+    """
+    host, port = split_host_port(url)
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+    except OSError:
+        return False
+
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request("GET", path)
+        conn.getresponse().read()
+        return True
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
+def wait_until_ready(process: subprocess.Popen, url: str, timeout: float) -> float:
+    """Block until the server behind `url` answers, return seconds waited.
+
+    Raises `ServerNotReady` if the process exits or the deadline passes.
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = INITIAL_BACKOFF
+
+    while True:
+        if process.poll() is not None:
+            raise ServerNotReady(f"server exited with code {process.returncode}")
+        if probe_http(url):
+            return time.monotonic() - start
+        if time.monotonic() >= deadline:
+            host, port = split_host_port(url)
+            raise ServerNotReady(
+                f"server did not answer on {host}:{port} within {timeout:.0f}s"
+            )
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_BACKOFF)
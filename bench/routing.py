@@ -0,0 +1,56 @@
+"""
+Routing-scale benchmark: throughput vs. number of registered routes.
+
+With `BENCH_ROUTES=<count>` and `BENCH_ROUTE_KIND=static|param|mixed` in
+its environment, every app in `src/` registers only `/ping` and the route
+table of `src.shared.route_table`, so the same table is matched by each
+framework's router. Requests target the route registered first, in the
+middle and last: a router that scans its routes linearly slows down towards
+the end of a large table, a radix tree or hash lookup does not. All three
+are of the first route's kind, so a "mixed" table compares positions of
+static routes rather than a static route against a parameterized one.
+"""
+
+from msgspec.structs import replace
+
+from .data_manager import BenchmarkConfig
+from .scenarios import with_path
+from .src.shared import ROUTE_KINDS, route_table
+
+ROUTE_COUNTS = [10, 100, 1000, 10000]
+ROUTE_POSITIONS = ("start", "middle", "end")
+PARAM_ID = 42  # value of `{id}` in parameterized requests
+
+
+def route_index(table: list[tuple[str, bool]], position: str) -> int:
+    """Index of the route at `position`, stepped back to the nearest route
+    of the same kind as the first one."""
+    index = {"start": 0, "middle": len(table) // 2, "end": len(table) - 1}[position]
+    while table[index][1] != table[0][1]:
+        index -= 1
+    return index
+
+
+def app_env(count: int, kind: str) -> dict[str, str]:
+    """Environment that makes an app serve the generated table."""
+    return {"BENCH_ROUTES": str(count), "BENCH_ROUTE_KIND": kind}
+
+
+def routing_config(
+    config: BenchmarkConfig, count: int, kind: str, position: str
+) -> BenchmarkConfig:
+    """GET of the route at `position` of a `count` route table, on `config`'s
+    host and load settings."""
+    table = route_table(count, kind)
+    path, _ = table[route_index(table, position)]
+    return replace(
+        config,
+        bench_name=f"routing_{kind}@{count}_{position}",
+        method="GET",
+        url=with_path(config.url, path.format(id=PARAM_ID)),
+        data=None,
+        scenario=None,
+        mix=None,
+        workload=None,
+    )
+
@@ -0,0 +1,137 @@
+"""
+Parameterized workload scenarios declared in `tests/test.json`.
+
+A config with a `scenario` is expanded into one concrete `BenchmarkConfig`
+per size before it is run:
+
+- `orders`: POST a nested order (customer, address, items with tags and
+  options) to `/scenario/orders`, encoded to roughly `size` bytes of JSON.
+  With `invalid_ratio` set, that share of the requests carries an item
+  whose price is not a number, so it goes through the framework's
+  validation-error path instead.
+- `users`: GET `/scenario/users?n=<size>`, a list of `size` user objects.
+- `ndjson`: GET `/stream/ndjson?n=<size>`, `size` users streamed as chunked
+  NDJSON, one chunk per line.
+- `sse`: GET `/stream/sse?n=<size>`, `size` users as server-sent events.
+- `download`: GET `/stream/download/<size>`, a `size` MB file served with
+  the framework's file response (`prepare` writes it beforehand).
+
+Bodies are generated deterministically, every framework receives the same
+bytes.
+"""
+
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from msgspec.json import encode
+from msgspec.structs import replace
+
+from .data_manager import BenchmarkConfig, RequestVariant
+from .src.shared import download_file
+
+SCENARIO_KINDS = ("orders", "users", "ndjson", "sse", "download")
+
+# GET scenarios: kind -> path for a size
+GET_PATHS = {
+    "users": "/scenario/users?n={size}",
+    "ndjson": "/stream/ndjson?n={size}",
+    "sse": "/stream/sse?n={size}",
+    "download": "/stream/download/{size}",
+}
+
+
+def make_item(idx: int) -> dict[str, Any]:
+    return {
+        "id": idx,
+        "name": f"item-{idx}",
+        "price": round(1 + (idx * 37 % 1000) / 10, 2),
+        "quantity": 1 + idx % 5,
+        "tags": [f"tag-{idx % 7}", f"tag-{idx % 11}", f"tag-{idx % 13}"],
+        "options": [
+            {"name": "color", "value": ("red", "green", "blue")[idx % 3]},
+            {"name": "size", "value": ("s", "m", "l", "xl")[idx % 4]},
+        ],
+    }
+
+
+def make_order(target_bytes: int) -> dict[str, Any]:
+    """Order whose JSON encoding is about `target_bytes` long (at least one item)."""
+    order: dict[str, Any] = {
+        "id": 1,
+        "customer": {
+            "id": 1,
+            "name": "user",
+            "email": "user@email.com",
+            "address": {"street": "1 Main St", "city": "Springfield", "zip": "12345"},
+        },
+        "items": [make_item(0)],
+        "notes": "",
+    }
+    size = len(encode(order))
+    items = order["items"]
+    while True:
+        item = make_item(len(items))
+        item_size = len(encode(item)) + 1  # plus the separating comma
+        if size + item_size > target_bytes:
+            break
+        items.append(item)
+        size += item_size
+    # pad the remainder into the free text field
+    order["notes"] = "x" * max(0, target_bytes - len(encode(order)))
+    return order
+
+
+def invalidate_order(order: dict[str, Any]) -> dict[str, Any]:
+    """Copy of `order` that fails validation deep inside the first item."""
+    items = [dict(order["items"][0], price="free"), *order["items"][1:]]
+    return dict(order, items=items)
+
+
+def with_path(url: str, path: str) -> str:
+    """`url` on the same host with `path` (which may carry a query)."""
+    parts = urlsplit(url)
+    path, _, query = path.partition("?")
+    return urlunsplit(parts._replace(path=path, query=query))
+
+
+def sized_config(config: BenchmarkConfig, size: int) -> BenchmarkConfig:
+    """Concrete config running `config.scenario` at `size`, named `name@size`."""
+    scenario = config.scenario
+    assert scenario is not None
+    name = f"{config.bench_name}@{size}"
+
+    if scenario.kind in GET_PATHS:
+        url = with_path(config.url, GET_PATHS[scenario.kind].format(size=size))
+        return replace(config, bench_name=name, method="GET", url=url, data=None, scenario=None)
+
+    if scenario.kind != "orders":
+        raise ValueError(f"unknown scenario kind {scenario.kind!r}, expected one of {SCENARIO_KINDS}")
+
+    url = with_path(config.url, "/scenario/orders")
+    order = make_order(size)
+    mix = None
+    if scenario.invalid_ratio > 0:
+        mix = [
+            RequestVariant(method="POST", url=url, data=order, weight=1 - scenario.invalid_ratio),
+            RequestVariant(
+                method="POST", url=url, data=invalidate_order(order), weight=scenario.invalid_ratio
+            ),
+        ]
+    return replace(
+        config, bench_name=name, method="POST", url=url, data=order, scenario=None, mix=mix
+    )
+
+
+def prepare(config: BenchmarkConfig):
+    """Create what the server reads while serving `config`, before it starts."""
+    scenario = config.scenario
+    if scenario is not None and scenario.kind == "download":
+        for size in scenario.sizes:
+            download_file(size)
+
+
+def request_bytes(config: BenchmarkConfig) -> float:
+    """Mean request body size of `config`, weighted like the load generator."""
+    variants = config.requests
+    total = sum(variant.weight for variant in variants)
+    return sum(len(variant.body or b"") * variant.weight for variant in variants) / total
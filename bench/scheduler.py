@@ -0,0 +1,153 @@
+"""
+Parallel benchmark scheduling across isolated CPU sets.
+
+Each concurrent run gets a `CoreSlot`: a private port plus two disjoint sets
+of cores, one for the server and one for wrk. Slots never share a core or a
+port, and a slot is only ever used by one run at a time, so concurrent runs
+do not contend with each other for CPU.
+"""
+
+import logging
+import os
+import queue
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .data_manager import Base, BenchmarkConfig, FrameworkResult
+
+if TYPE_CHECKING:
+    from .auto_bench import BenchmarkRunner
+
+logger = logging.getLogger(__name__)
+
+
+class CoreSlot(Base):
+    port: int
+    server_cores: list[int]
+    client_cores: list[int]
+
+    @property
+    def cores(self) -> set[int]:
+        return set(self.server_cores) | set(self.client_cores)
+
+
+def format_cores(cores: list[int]) -> str:
+    return ",".join(str(core) for core in cores)
+
+
+def pin_command(cmd: list[str], cores: Optional[list[int]]) -> list[str]:
+    """Prefix `cmd` with taskset so it (and its children) only run on `cores`."""
+    if not cores:
+        return cmd
+    if shutil.which("taskset") is None:
+        raise RuntimeError("taskset is required to pin benchmark processes to cores")
+    return ["taskset", "-c", format_cores(cores), *cmd]
+
+
+def validate_slots(slots: list[CoreSlot]) -> None:
+    """Refuse slot layouts whose core sets or ports would collide."""
+    seen_cores: dict[int, int] = {}
+    seen_ports: dict[int, int] = {}
+
+    for idx, slot in enumerate(slots):
+        if not slot.server_cores or not slot.client_cores:
+            raise ValueError(f"slot {idx} needs at least one server and one client core")
+
+        overlap = set(slot.server_cores) & set(slot.client_cores)
+        if overlap:
+            raise ValueError(
+                f"slot {idx} shares cores {sorted(overlap)} between server and wrk"
+            )
+
+        for core in slot.cores:
+            if core in seen_cores:
+                raise ValueError(
+                    f"core {core} is assigned to both slot {seen_cores[core]} and slot {idx}"
+                )
+            seen_cores[core] = idx
+
+        if slot.port in seen_ports:
+            raise ValueError(
+                f"port {slot.port} is assigned to both slot {seen_ports[slot.port]} and slot {idx}"
+            )
+        seen_ports[slot.port] = idx
+
+
+def allocate_slots(
+    parallel: int,
+    server_cores: int,
+    client_cores: int,
+    base_port: int = 8000,
+    available: Optional[list[int]] = None,
+) -> list[CoreSlot]:
+    """Carve `parallel` disjoint slots out of the cores this process may use."""
+    if available is None:
+        available = sorted(os.sched_getaffinity(0))
+
+    needed = parallel * (server_cores + client_cores)
+    if needed > len(available):
+        raise ValueError(
+            f"{parallel} parallel runs need {needed} cores "
+            f"({server_cores} server + {client_cores} wrk each), "
+            f"only {len(available)} available"
+        )
+
+    slots = []
+    cores = iter(available)
+    for idx in range(parallel):
+        slots.append(
+            CoreSlot(
+                port=base_port + idx,
+                server_cores=[next(cores) for _ in range(server_cores)],
+                client_cores=[next(cores) for _ in range(client_cores)],
+            )
+        )
+
+    validate_slots(slots)
+    return slots
+
+
+class ParallelScheduler:
+    """Run framework/test pairs concurrently, one run per free slot."""
+
+    def __init__(self, runner: "BenchmarkRunner", slots: list[CoreSlot]):
+        validate_slots(slots)
+        self.runner = runner
+        self.slots = slots
+
+    def run(
+        self,
+        pairs: list[tuple[str, BenchmarkConfig]],
+        on_result: Optional[Callable[[str, BenchmarkConfig, Optional[FrameworkResult]], None]] = None,
+    ) -> list[tuple[str, BenchmarkConfig, Optional[FrameworkResult]]]:
+        """Benchmark every `(framework_key, benchmark_config)` pair.
+
+        Results are returned in the order of `pairs` regardless of the order
+        in which runs complete.
+        """
+        free_slots: queue.Queue[CoreSlot] = queue.Queue()
+        for slot in self.slots:
+            free_slots.put(slot)
+
+        def run_pair(pair: tuple[str, BenchmarkConfig]):
+            framework_key, benchmark_config = pair
+            # blocks until a slot is free, so a slot never hosts two runs
+            slot = free_slots.get()
+            try:
+                logger.info(
+                    f"{framework_key}/{benchmark_config.bench_name} on port {slot.port}, "
+                    f"server cores [{format_cores(slot.server_cores)}], "
+                    f"wrk cores [{format_cores(slot.client_cores)}]"
+                )
+                result = self.runner.benchmark_framework(
+                    framework_key, benchmark_config, slot=slot
+                )
+            finally:
+                free_slots.put(slot)
+            if on_result is not None:
+                on_result(framework_key, benchmark_config, result)
+            return framework_key, benchmark_config, result
+
+        with ThreadPoolExecutor(max_workers=len(self.slots)) as executor:
+            return list(executor.map(run_pair, pairs))
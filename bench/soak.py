@@ -0,0 +1,165 @@
+"""
+Soak runs: hours of constant load below max RPS, watching for slow leaks.
+
+The runner measures the server's closed-loop max RPS, then drives a fixed
+fraction of it open-loop with one run of the built-in generator on
+long-lived connections (`loadgen.run_stream`), which reports throughput and
+latency every second. While it runs, the server tree's RSS and open file
+descriptors are sampled every `SOAK_SAMPLE_INTERVAL` seconds. Sockets are
+counted apart and not fitted: they follow the client connections, a leak
+shows in the other descriptors (files, pipes, eventfds, ...).
+
+Trends are least-squares lines fitted after the first `SOAK_WARMUP` of the
+run (caches, pools and allocator arenas filling up), over the samples taken
+under load only. A trend is flagged when
+the fitted change over the run passes its threshold and the last quarter of
+the samples sits above (or, for throughput, below) the first quarter, so a
+single spike does not make a leak.
+
+With tracemalloc the server is run under bench/launcher.py, which
+snapshots allocations every interval; the call sites that grew the most
+since the first snapshot are reported. Tracing slows the server down, so
+throughput and latency of such runs are not comparable to plain ones.
+"""
+
+import logging
+import statistics
+from pathlib import Path
+from typing import Optional, Sequence
+
+from msgspec.json import decode
+
+from .data_manager import AllocationSite, Base, SecondStats, SoakReport, SoakSample
+from .profiler import LauncherWindow
+from .stats import linear_fit
+
+logger = logging.getLogger(__name__)
+
+SOAK_DURATION = "1h"
+SOAK_FRACTION = 0.5  # of the closed-loop max RPS
+PROGRESS_INTERVAL = 60  # seconds between progress lines
+SOAK_SAMPLE_INTERVAL = 5.0  # seconds between RSS/FD samples
+SOAK_WARMUP = 0.1  # fraction of the run left out of the trend fits
+TRACEMALLOC_INTERVAL = 300.0
+TRACEMALLOC_TOP = 10
+
+# flagged when the fitted change over the run exceeds these
+MEMORY_GROWTH = 0.05  # of the fitted starting RSS
+FD_GROWTH = 10  # descriptors
+THROUGHPUT_DECAY = 0.05  # of the fitted starting RPS
+
+
+class TracemallocSnapshot(Base):
+    """One line written by the launcher's `AllocationTracer`."""
+
+    t: float  # seconds since tracing started
+    traced_mb: float
+    sites: list[AllocationSite]
+
+
+def fit(xs: Sequence[float], ys: Sequence[float]) -> tuple[float, float]:
+    """`(slope, fitted value at the first x)` of a least-squares line."""
+    if not xs:
+        return 0.0, 0.0
+    slope, intercept = linear_fit(xs, ys)
+    return slope, intercept + slope * xs[0]
+
+
+def relative_change(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Change of the fitted line over `xs`, relative to where it starts."""
+    slope, start = fit(xs, ys)
+    return slope * (xs[-1] - xs[0]) / start if len(xs) > 1 and start else 0.0
+
+
+def rises(xs: Sequence[float], ys: Sequence[float], threshold: float) -> bool:
+    """Whether `ys` grows by more than `threshold` over the run, confirmed
+    by the last quarter of the samples sitting above the first."""
+    quarter = len(ys) // 4
+    if quarter < 2:
+        return False
+    slope, _ = linear_fit(xs, ys)
+    return (
+        slope * (xs[-1] - xs[0]) > threshold
+        and statistics.median(ys[-quarter:]) > statistics.median(ys[:quarter])
+    )
+
+
+def analyze(
+    throughput: list[SecondStats],
+    resources: list[SoakSample],
+    target_rps: int,
+    max_rps: float,
+    seconds: float,
+    allocations: Optional[list[AllocationSite]] = None,
+) -> SoakReport:
+    """Trends of a soak run, fitted past its warmup and while load ran."""
+    warmup = seconds * SOAK_WARMUP
+    # samples before the first or after the last loaded second are idle
+    loaded = throughput[-1].second + 1 if throughput else seconds
+    resources = [sample for sample in resources if sample.t < loaded]
+    steady = [sample for sample in resources if sample.t >= warmup]
+    times = [sample.t for sample in steady]
+    rss = [sample.rss_mb for sample in steady]
+    fds = [float(sample.fds) for sample in steady]
+    rss_slope, rss_start = fit(times, rss)
+    fd_slope, fds_start = fit(times, fds)
+    span = times[-1] - times[0] if times else 0.0
+
+    per_second = [point for point in throughput if point.second >= warmup]
+    secs = [float(point.second) for point in per_second]
+    rps = [float(point.requests) for point in per_second]
+    p99 = [point.p99 for point in per_second]
+    _, start_rps = fit(secs, rps)
+    return SoakReport(
+        target_rps=target_rps,
+        max_rps=max_rps,
+        seconds=seconds,
+        throughput=throughput,
+        resources=resources,
+        rss_mb_per_hour=rss_slope * 3600,
+        fds_per_hour=fd_slope * 3600,
+        rss_mb_start=rss_start,
+        rss_mb_end=rss_start + rss_slope * span,
+        fds_start=fds_start,
+        fds_end=fds_start + fd_slope * span,
+        rps_change=relative_change(secs, rps),
+        p99_change=relative_change(secs, p99),
+        memory_growth=rises(times, rss, MEMORY_GROWTH * rss_start),
+        fd_growth=rises(times, fds, FD_GROWTH),
+        throughput_decay=rises(secs, [-r for r in rps], THROUGHPUT_DECAY * start_rps),
+        allocations=allocations,
+    )
+
+
+class AllocationTracker(LauncherWindow):
+    """Talks to the launcher's `AllocationTracer`. Every serving process
+    writes one JSON line per snapshot; the files are kept next to the soak's
+    other artifacts and the last snapshots are merged on stop."""
+
+    option = "--tracemalloc"
+    suffix = ".tracemalloc"
+    what = "tracemalloc snapshots"
+
+    def __init__(self, root_pid: int, output: Path, timeout: float = 60.0):
+        # the final snapshot of a big heap takes a while
+        super().__init__(root_pid, output, timeout)
+
+    @classmethod
+    def launcher_options(cls, output: Path, interval: float) -> list[str]:
+        return [*super().launcher_options(output), "--tracemalloc-interval", str(interval)]
+
+    def merge(self, paths: list[Path]) -> list[AllocationSite]:
+        """Growth per call site at the last snapshot, summed over processes."""
+        sites: dict[str, AllocationSite] = {}
+        for path in paths:
+            last = path.read_text().strip().splitlines()[-1]
+            for site in decode(last, type=TracemallocSnapshot).sites:
+                if site.site in sites:
+                    merged = sites[site.site]
+                    merged.size_diff_kb += site.size_diff_kb
+                    merged.count_diff += site.count_diff
+                else:
+                    sites[site.site] = site
+        logger.info(f"tracemalloc snapshots: {', '.join(str(path) for path in paths)}")
+        top = sorted(sites.values(), key=lambda site: site.size_diff_kb, reverse=True)
+        return top[:TRACEMALLOC_TOP]
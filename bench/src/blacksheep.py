@@ -1,16 +1,48 @@
+import msgspec
 from blacksheep import (
     Application,
     FromJSON,
     FromQuery,
     JSONContent,
+    Request,
     Response,
+    StreamedContent,
     TextContent,
+    file,
     get,
 )
+from blacksheep.server.routing import Router
+from blacksheep.server.sse import ServerSentEvent, ServerSentEventsResponse
 
-from .shared import Engine, User, get_engine
+from .shared import (
+    DI_CACHED,
+    MIDDLEWARE_KIND,
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    Engine,
+    Order,
+    ResourceIn,
+    User,
+    asgi_stack,
+    create_resource,
+    dep_types,
+    download_file,
+    get_engine,
+    get_resource,
+    iter_users,
+    layer_header,
+    list_resources,
+    list_users,
+    ndjson_lines,
+    resource_children,
+    summarize_order,
+    with_signature,
+)
 
 app = Application()
+order_decoder = msgspec.json.Decoder(Order)
+resource_decoder = msgspec.json.Decoder(ResourceIn)
 
 
 @app.router.post("/profile/{pid}")
@@ -30,3 +62,128 @@ async def profile_handler(
 @get("/ping")
 async def pong():
     return Response(status=200, content=TextContent("pong"))
+
+
+@app.router.post("/scenario/orders")
+async def create_order(request: Request) -> Response:
+    try:
+        order = order_decoder.decode(await request.read())
+    except msgspec.DecodeError as e:
+        return Response(status=400, content=JSONContent({"detail": str(e)}))
+    return Response(status=200, content=JSONContent(summarize_order(order).asdict()))
+
+
+@app.router.get("/scenario/users")
+async def get_users(n: FromQuery[int] = FromQuery(100)) -> Response:
+    users = [user.asdict() for user in list_users(n.value)]
+    return Response(status=200, content=JSONContent(users))
+
+
+@app.router.get("/stream/ndjson")
+async def stream_ndjson(n: FromQuery[int] = FromQuery(100)) -> Response:
+    async def lines():
+        async for line in ndjson_lines(n.value):
+            yield line
+
+    content = StreamedContent(b"application/x-ndjson", lines)
+    return Response(status=200, content=content)
+
+
+@app.router.get("/stream/sse")
+async def stream_sse(n: FromQuery[int] = FromQuery(100)) -> Response:
+    async def events():
+        for user in iter_users(n.value):
+            yield ServerSentEvent(user.asdict())
+
+    return ServerSentEventsResponse(events)
+
+
+@app.router.get("/stream/download/{mb}")
+async def get_download(mb: int) -> Response:
+    return file(str(download_file(mb)), "application/octet-stream")
+
+
+def add_resource_routes(resource: str):
+    async def list_all(limit: FromQuery[int] = FromQuery(10)) -> Response:
+        items = [r.asdict() for r in list_resources(resource, limit.value)]
+        return Response(status=200, content=JSONContent(items))
+
+    async def create(request: Request) -> Response:
+        try:
+            data = resource_decoder.decode(await request.read())
+        except msgspec.DecodeError as e:
+            return Response(status=400, content=JSONContent({"detail": str(e)}))
+        created = create_resource(resource, data)
+        return Response(status=200, content=JSONContent(created.asdict()))
+
+    async def get_one(id: int) -> Response:
+        return Response(status=200, content=JSONContent(get_resource(resource, id).asdict()))
+
+    async def get_children(id: int) -> Response:
+        children = [r.asdict() for r in resource_children(resource, id)]
+        return Response(status=200, content=JSONContent(children))
+
+    app.router.add_get(f"/api/{resource}", list_all)
+    app.router.add_post(f"/api/{resource}", create)
+    app.router.add_get(f"/api/{resource}/{{id}}", get_one)
+    app.router.add_get(f"/api/{resource}/{{id}}/children", get_children)
+
+
+for resource in RESOURCES:
+    add_resource_routes(resource)
+
+
+def add_di_route():
+    """`/di`, its handler depending on the last level of every chain.
+
+    rodi builds services from their typed constructors and only
+    synchronously, so there is no async variant; cached services are
+    singletons.
+    """
+    levels = dep_types()
+    add = app.services.add_singleton if DI_CACHED else app.services.add_transient
+    for level in levels:
+        for cls in level:
+            add(cls)
+
+    async def resolve(*args, **kwargs) -> Response:
+        return Response(status=200, content=TextContent("ok"))
+
+    top = {f"dep{j}": cls for j, cls in enumerate(levels[-1])} if levels else {}
+    app.router.add_get("/di", with_signature(resolve, top, Response))
+
+
+add_di_route()
+
+
+async def get_static() -> Response:
+    return Response(status=200, content=TextContent("ok"))
+
+
+async def get_item(id: int) -> Response:
+    return Response(status=200, content=TextContent(str(id)))
+
+
+if ROUTE_TABLE:
+    # routing-scale mode: a fresh router holding only the generated table
+    app = Application(router=Router())
+    app.router.add_get("/ping", pong)
+    for path, param in ROUTE_TABLE:
+        app.router.add_get(path, get_item if param else get_static)
+
+
+def header_layer(layer: int):
+    header = layer_header(layer).encode()
+
+    async def middleware(request: Request, handler) -> Response:
+        response = await handler(request)
+        response.add_header(header, b"1")
+        return response
+
+    return middleware
+
+
+if MIDDLEWARE_KIND == "native":
+    app.middlewares.extend(header_layer(layer) for layer in range(MIDDLEWARE_LAYERS))
+else:
+    app = asgi_stack(app)
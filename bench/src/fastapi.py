@@ -1,10 +1,30 @@
-from typing import Annotated
+from contextlib import asynccontextmanager
+from typing import Annotated, Callable
 
-from fastapi import APIRouter, Depends, FastAPI
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.middleware.base import BaseHTTPMiddleware
 
-from .shared import Engine, get_engine
+from .shared import (
+    DI_ASYNC,
+    DI_CACHED,
+    MIDDLEWARE_KIND,
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    USERS,
+    Engine,
+    asgi_stack,
+    dep_factory,
+    dep_types,
+    download_file,
+    get_engine,
+    layer_header,
+    ndjson_lines,
+    sse_events,
+    with_signature,
+)
 
 
 async def dump_wrapper(pid: str, q: int):
@@ -17,8 +37,63 @@ class PdUser(BaseModel):
     email: str
 
 
+class PdAddress(BaseModel):
+    street: str
+    city: str
+    zip: str
+
+
+class PdCustomer(BaseModel):
+    id: int
+    name: str
+    email: str
+    address: PdAddress
+
+
+class PdOption(BaseModel):
+    name: str
+    value: str
+
+
+class PdItem(BaseModel):
+    id: int
+    name: str
+    price: float
+    quantity: int
+    tags: list[str]
+    options: list[PdOption]
+
+
+class PdOrder(BaseModel):
+    id: int
+    customer: PdCustomer
+    items: list[PdItem]
+    notes: str = ""
+
+
+class PdOrderSummary(BaseModel):
+    id: int
+    items: int
+    total: float
+
+
+class PdResource(BaseModel):
+    id: int
+    name: str
+    tags: list[str] = []
+
+
+class PdResourceIn(BaseModel):
+    name: str
+    tags: list[str] = []
+
+
+PD_USERS = [PdUser(id=user.id, name=user.name, email=user.email) for user in USERS]
+
 profile_route = APIRouter()
 ping_route = APIRouter()
+scenario_route = APIRouter(prefix="/scenario")
+stream_route = APIRouter(prefix="/stream")
 
 
 @profile_route.post("/profile/{pid}")
@@ -34,6 +109,165 @@ async def ping():
     return PlainTextResponse("pong")
 
 
+@scenario_route.post("/orders")
+async def create_order(order: PdOrder) -> PdOrderSummary:
+    total = sum(item.price * item.quantity for item in order.items)
+    return PdOrderSummary(id=order.id, items=len(order.items), total=round(total, 2))
+
+
+@scenario_route.get("/users")
+async def get_users(n: int = 100) -> list[PdUser]:
+    return PD_USERS[: max(0, min(n, len(PD_USERS)))]
+
+
+@stream_route.get("/ndjson")
+async def stream_ndjson(n: int = 100):
+    return StreamingResponse(ndjson_lines(n), media_type="application/x-ndjson")
+
+
+@stream_route.get("/sse")
+async def stream_sse(n: int = 100):
+    return StreamingResponse(sse_events(n), media_type="text/event-stream")
+
+
+@stream_route.get("/download/{mb}")
+async def get_download(mb: int):
+    return FileResponse(download_file(mb))
+
+
+def pd_resource(resource: str, id: int) -> PdResource:
+    return PdResource(id=id, name=f"{resource}-{id}", tags=[resource])
+
+
+def resource_router(resource: str) -> APIRouter:
+    router = APIRouter(prefix=f"/api/{resource}")
+
+    @router.get("")
+    async def list_all(limit: int = 10) -> list[PdResource]:
+        return [pd_resource(resource, i) for i in range(max(0, min(limit, 100)))]
+
+    @router.post("")
+    async def create(data: PdResourceIn) -> PdResource:
+        return PdResource(id=1, name=data.name, tags=[resource, *data.tags])
+
+    @router.get("/{id}")
+    async def get_one(id: int) -> PdResource:
+        return pd_resource(resource, id)
+
+    @router.get("/{id}/children")
+    async def get_children(id: int) -> list[PdResource]:
+        return [pd_resource(resource, id * 10 + i) for i in range(5)]
+
+    return router
+
+
+def di_router() -> APIRouter:
+    """`/di`, its handler depending on the last level of every chain.
+
+    FastAPI has no app-lifetime scope: cached variants build the chains once
+    in the router's lifespan and hand them out through a dependency reading
+    `app.state`, uncached ones solve every `Depends` per request.
+    """
+    levels = dep_types()
+
+    async def resolve(*args, **kwargs):
+        return "ok"
+
+    if DI_CACHED:
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            chains = []
+            for chain in zip(*levels):
+                dep = chain[0]()
+                for cls in chain[1:]:
+                    dep = cls(dep)
+                chains.append(dep)
+            app.state.di = chains
+            yield
+
+        router = APIRouter(default_response_class=PlainTextResponse, lifespan=lifespan)
+        top = {
+            f"dep{j}": Annotated[cls, Depends(singleton(j, cls))]
+            for j, cls in enumerate(levels[-1])
+        } if levels else {}
+        router.add_api_route("/di", with_signature(resolve, top), methods=["GET"])
+        return router
+
+    router = APIRouter(default_response_class=PlainTextResponse)
+    builds: list[list] = []
+    for i, level in enumerate(levels):
+        row = []
+        for j, cls in enumerate(level):
+            params = {"dep": Annotated[levels[i - 1][j], Depends(builds[i - 1][j])]} if i else {}
+            row.append(dep_factory(cls, params))
+        builds.append(row)
+
+    top = {
+        f"dep{j}": Annotated[cls, Depends(builds[-1][j])] for j, cls in enumerate(levels[-1])
+    } if levels else {}
+    router.add_api_route("/di", with_signature(resolve, top), methods=["GET"])
+    return router
+
+
+def singleton(chain: int, cls: type) -> Callable:
+    """Dependency handing out the top of `chain`, built in the lifespan; sync
+    or async like the factories of the uncached variants."""
+    if DI_ASYNC:
+
+        async def get(request: Request):
+            return request.app.state.di[chain]
+
+    else:
+
+        def get(request: Request):
+            return request.app.state.di[chain]
+
+    get.__annotations__["return"] = cls
+    return get
+
+
+async def get_static():
+    return "ok"
+
+
+async def get_item(id: int):
+    return str(id)
+
+
+def table_router() -> APIRouter:
+    """The generated route table of routing-scale mode."""
+    router = APIRouter(default_response_class=PlainTextResponse)
+    for path, param in ROUTE_TABLE:
+        router.add_api_route(path, get_item if param else get_static, methods=["GET"])
+    return router
+
+
+def header_dispatch(layer: int):
+    header = layer_header(layer)
+
+    async def dispatch(request, call_next):
+        response = await call_next(request)
+        response.headers[header] = "1"
+        return response
+
+    return dispatch
+
+
 app = FastAPI()
-app.include_router(profile_route)
 app.include_router(ping_route)
+if ROUTE_TABLE:
+    app.include_router(table_router())
+else:
+    app.include_router(profile_route)
+    app.include_router(scenario_route)
+    app.include_router(stream_route)
+    app.include_router(di_router())
+    for resource in RESOURCES:
+        app.include_router(resource_router(resource))
+
+if MIDDLEWARE_KIND == "native":
+    for layer in range(MIDDLEWARE_LAYERS):
+        app.add_middleware(BaseHTTPMiddleware, dispatch=header_dispatch(layer))
+else:
+    app = asgi_stack(app)
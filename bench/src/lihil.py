@@ -1,6 +1,36 @@
-from lihil import Lihil, Route, Text
+from functools import partial
 
-from .shared import Engine, User, get_engine
+from lihil import SSE, EventStream, Lihil, Route, Text
+from starlette.responses import FileResponse, StreamingResponse
+
+from .shared import (
+    DI_CACHED,
+    MIDDLEWARE_KIND,
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    Engine,
+    HeaderMiddleware,
+    Order,
+    OrderSummary,
+    Resource,
+    ResourceIn,
+    User,
+    asgi_stack,
+    create_resource,
+    dep_factory,
+    dep_types,
+    download_file,
+    get_engine,
+    get_resource,
+    iter_users,
+    list_resources,
+    list_users,
+    ndjson_lines,
+    resource_children,
+    summarize_order,
+    with_signature,
+)
 
 profile_route = Route("profile/{pid}")
 profile_route.factory(get_engine)
@@ -20,4 +50,125 @@ def pong() -> Text:
     return "pong"
 
 
-app = Lihil(profile_route)
+orders = Route("/scenario/orders")
+
+
+@orders.post
+async def create_order(order: Order) -> OrderSummary:
+    return summarize_order(order)
+
+
+users = Route("/scenario/users")
+
+
+@users.get
+async def get_users(n: int = 100) -> list[User]:
+    return list_users(n)
+
+
+ndjson = Route("/stream/ndjson")
+
+
+@ndjson.get
+async def stream_ndjson(n: int = 100):
+    return StreamingResponse(ndjson_lines(n), media_type="application/x-ndjson")
+
+
+sse = Route("/stream/sse")
+
+
+@sse.get
+async def stream_sse(n: int = 100) -> EventStream:
+    for user in iter_users(n):
+        yield SSE(data=user)
+
+
+download = Route("/stream/download/{mb}")
+
+
+@download.get
+async def get_download(mb: int):
+    return FileResponse(download_file(mb))
+
+
+def resource_routes(resource: str) -> list[Route]:
+    collection = Route(f"/api/{resource}")
+    item = Route(f"/api/{resource}/{{id}}")
+    children = Route(f"/api/{resource}/{{id}}/children")
+
+    @collection.get
+    async def list_all(limit: int = 10) -> list[Resource]:
+        return list_resources(resource, limit)
+
+    @collection.post
+    async def create(data: ResourceIn) -> Resource:
+        return create_resource(resource, data)
+
+    @item.get
+    async def get_one(id: int) -> Resource:
+        return get_resource(resource, id)
+
+    @children.get
+    async def get_children(id: int) -> list[Resource]:
+        return resource_children(resource, id)
+
+    return [collection, item, children]
+
+
+def di_route() -> Route:
+    """`/di`, its handler depending on the last level of every chain; cached
+    factories are singletons of the graph (`reuse=True`)."""
+    route = Route("/di")
+    levels = dep_types()
+    for i, level in enumerate(levels):
+        for j, cls in enumerate(level):
+            params = {"dep": levels[i - 1][j]} if i else {}
+            route.graph.node(dep_factory(cls, params), reuse=DI_CACHED)
+
+    async def resolve(*args, **kwargs) -> Text:
+        return "ok"
+
+    top = {f"dep{j}": cls for j, cls in enumerate(levels[-1])} if levels else {}
+    route.get(with_signature(resolve, top, Text))
+    return route
+
+
+async def get_static() -> Text:
+    return "ok"
+
+
+async def get_item(id: int) -> Text:
+    return str(id)
+
+
+def table_routes() -> list[Route]:
+    """The generated route table of routing-scale mode."""
+    routes = []
+    for path, param in ROUTE_TABLE:
+        route = Route(path)
+        route.get(get_item if param else get_static)
+        routes.append(route)
+    return routes
+
+
+if ROUTE_TABLE:
+    app = Lihil(ping, *table_routes())
+else:
+    app = Lihil(
+        profile_route,
+        ping,
+        orders,
+        users,
+        ndjson,
+        sse,
+        download,
+        di_route(),
+        *(route for resource in RESOURCES for route in resource_routes(resource)),
+    )
+
+if MIDDLEWARE_KIND == "native":
+    # Lihil's middleware are ASGI factories, registered on the app
+    for layer in range(MIDDLEWARE_LAYERS):
+        app.add_middleware(partial(HeaderMiddleware, layer=layer))
+else:
+    app = asgi_stack(app)
@@ -1,11 +1,42 @@
 import json
 
+import msgspec
 from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.responses import (
+    FileResponse,
+    JSONResponse,
+    PlainTextResponse,
+    StreamingResponse,
+)
 from starlette.routing import Route
 
-from .shared import Engine, User, get_engine
+from .shared import (
+    MIDDLEWARE_KIND,
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    Engine,
+    Order,
+    ResourceIn,
+    User,
+    asgi_stack,
+    create_resource,
+    download_file,
+    get_engine,
+    get_resource,
+    layer_header,
+    list_resources,
+    list_users,
+    resource_children,
+    ndjson_lines,
+    sse_events,
+    summarize_order,
+)
+
+order_decoder = msgspec.json.Decoder(Order)
+resource_decoder = msgspec.json.Decoder(ResourceIn)
 
 
 async def profile_handler(request: Request):
@@ -23,9 +54,105 @@ async def ping(r: Request):
     return PlainTextResponse("pong")
 
 
+async def create_order(request: Request):
+    try:
+        order = order_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        return JSONResponse({"detail": str(e)}, status_code=422)
+    return JSONResponse(summarize_order(order).asdict())
+
+
+async def get_users(request: Request):
+    n = int(request.query_params.get("n", "100"))
+    return JSONResponse([user.asdict() for user in list_users(n)])
+
+
+async def stream_ndjson(request: Request):
+    n = int(request.query_params.get("n", "100"))
+    return StreamingResponse(ndjson_lines(n), media_type="application/x-ndjson")
+
+
+async def stream_sse(request: Request):
+    n = int(request.query_params.get("n", "100"))
+    return StreamingResponse(sse_events(n), media_type="text/event-stream")
+
+
+async def get_download(request: Request):
+    return FileResponse(download_file(request.path_params["mb"]))
+
+
+def resource_routes(resource: str) -> list[Route]:
+    async def list_all(request: Request):
+        limit = int(request.query_params.get("limit", "10"))
+        return JSONResponse([r.asdict() for r in list_resources(resource, limit)])
+
+    async def create(request: Request):
+        try:
+            data = resource_decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            return JSONResponse({"detail": str(e)}, status_code=422)
+        return JSONResponse(create_resource(resource, data).asdict())
+
+    async def get_one(request: Request):
+        return JSONResponse(get_resource(resource, request.path_params["id"]).asdict())
+
+    async def get_children(request: Request):
+        children = resource_children(resource, request.path_params["id"])
+        return JSONResponse([r.asdict() for r in children])
+
+    return [
+        Route(f"/api/{resource}", list_all, methods=["GET"]),
+        Route(f"/api/{resource}", create, methods=["POST"]),
+        Route(f"/api/{resource}/{{id:int}}", get_one, methods=["GET"]),
+        Route(f"/api/{resource}/{{id:int}}/children", get_children, methods=["GET"]),
+    ]
+
+
 routes = [
     Route("/ping", ping, methods=["GET"]),
     Route("/profile/{pid}", profile_handler, methods=["POST"]),
+    Route("/scenario/orders", create_order, methods=["POST"]),
+    Route("/scenario/users", get_users, methods=["GET"]),
+    Route("/stream/ndjson", stream_ndjson, methods=["GET"]),
+    Route("/stream/sse", stream_sse, methods=["GET"]),
+    Route("/stream/download/{mb:int}", get_download, methods=["GET"]),
+    *(route for resource in RESOURCES for route in resource_routes(resource)),
 ]
 
-app = Starlette(routes=routes)
+async def get_static(request: Request):
+    return PlainTextResponse("ok")
+
+
+async def get_item(request: Request):
+    return PlainTextResponse(str(request.path_params["id"]))
+
+
+def table_routes() -> list[Route]:
+    """The generated route table of routing-scale mode."""
+    return [
+        Route(path.replace("{id}", "{id:int}"), get_item if param else get_static, methods=["GET"])
+        for path, param in ROUTE_TABLE
+    ]
+
+
+def header_dispatch(layer: int):
+    header = layer_header(layer)
+
+    async def dispatch(request: Request, call_next):
+        response = await call_next(request)
+        response.headers[header] = "1"
+        return response
+
+    return dispatch
+
+
+if ROUTE_TABLE:
+    app = Starlette(routes=[Route("/ping", ping, methods=["GET"]), *table_routes()])
+else:
+    app = Starlette(routes=routes)
+
+if MIDDLEWARE_KIND == "native":
+    for layer in range(MIDDLEWARE_LAYERS):
+        app.add_middleware(BaseHTTPMiddleware, dispatch=header_dispatch(layer))
+else:
+    app = asgi_stack(app)
@@ -1,13 +1,43 @@
 import json
+import os
 
-from robyn import Request, Robyn, jsonify
+import msgspec
+from robyn import (
+    Headers,
+    Request,
+    Response,
+    Robyn,
+    SSEResponse,
+    StreamingResponse,
+    jsonify,
+    serve_file,
+)
 
-from .shared import Engine, User, get_engine
+from .shared import (
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    Engine,
+    Order,
+    ResourceIn,
+    User,
+    create_resource,
+    download_file,
+    get_engine,
+    get_resource,
+    layer_header,
+    list_resources,
+    list_users,
+    ndjson_lines,
+    resource_children,
+    sse_events,
+    summarize_order,
+)
 
-app = Robyn(__file__)
+order_decoder = msgspec.json.Decoder(Order)
+resource_decoder = msgspec.json.Decoder(ResourceIn)
 
 
-@app.post("/profile/:pid")
 async def profile_handler(request: Request):
     pid = request.path_params["pid"]
     q = int(request.queries.get("q", "0"))
@@ -17,9 +47,113 @@ async def profile_handler(request: Request):
     return jsonify(user.asdict())
 
 
-@app.get("/ping")
+async def create_order(request: Request):
+    try:
+        order = order_decoder.decode(request.body)
+    except msgspec.DecodeError as e:
+        return Response(
+            status_code=422,
+            headers={"Content-Type": "application/json"},
+            description=json.dumps({"detail": str(e)}),
+        )
+    return jsonify(summarize_order(order).asdict())
+
+
+async def get_users(request: Request):
+    n = int(request.query_params.get("n", "100"))
+    return jsonify([user.asdict() for user in list_users(n)])
+
+
+async def stream_ndjson(request: Request):
+    n = int(request.query_params.get("n", "100"))
+    return StreamingResponse(
+        ndjson_lines(n),
+        headers=Headers({"Content-Type": "application/x-ndjson"}),
+        media_type="application/x-ndjson",
+    )
+
+
+async def stream_sse(request: Request):
+    n = int(request.query_params.get("n", "100"))
+    return SSEResponse(sse_events(n))
+
+
+async def get_download(request: Request):
+    return serve_file(str(download_file(int(request.path_params["mb"]))))
+
+
+def add_resource_routes(resource: str):
+    async def list_all(request: Request):
+        limit = int(request.query_params.get("limit", "10"))
+        return jsonify([r.asdict() for r in list_resources(resource, limit)])
+
+    async def create(request: Request):
+        try:
+            data = resource_decoder.decode(request.body)
+        except msgspec.DecodeError as e:
+            return Response(
+                status_code=422,
+                headers={"Content-Type": "application/json"},
+                description=json.dumps({"detail": str(e)}),
+            )
+        return jsonify(create_resource(resource, data).asdict())
+
+    async def get_one(request: Request):
+        id = int(request.path_params["id"])
+        return jsonify(get_resource(resource, id).asdict())
+
+    async def get_children(request: Request):
+        id = int(request.path_params["id"])
+        return jsonify([r.asdict() for r in resource_children(resource, id)])
+
+    app.get(f"/api/{resource}")(list_all)
+    app.post(f"/api/{resource}")(create)
+    app.get(f"/api/{resource}/:id")(get_one)
+    app.get(f"/api/{resource}/:id/children")(get_children)
+
+
 async def ping():
     return "pong"
 
 
-app.start(port=8000)
+async def get_static():
+    return "ok"
+
+
+async def get_item(request: Request):
+    return str(int(request.path_params["id"]))
+
+
+app = Robyn(__file__)
+app.get("/ping")(ping)
+if ROUTE_TABLE:
+    # routing-scale mode: only the generated table
+    for path, param in ROUTE_TABLE:
+        app.get(path.replace("{id}", ":id"))(get_item if param else get_static)
+else:
+    app.post("/profile/:pid")(profile_handler)
+    app.post("/scenario/orders")(create_order)
+    app.get("/scenario/users")(get_users)
+    app.get("/stream/ndjson")(stream_ndjson)
+    app.get("/stream/sse")(stream_sse)
+    app.get("/stream/download/:mb")(get_download)
+    for resource in RESOURCES:
+        add_resource_routes(resource)
+
+
+def header_layer(layer: int):
+    header = layer_header(layer)
+
+    def add_header(response: Response):
+        response.headers.set(header, "1")
+        return response
+
+    return add_header
+
+
+# served by Robyn's own server: native middleware only
+for layer in range(MIDDLEWARE_LAYERS):
+    app.after_request()(header_layer(layer))
+
+
+app.start(port=int(os.environ.get("BENCH_PORT", "8000")))
@@ -1,12 +1,36 @@
 import json
+import os
+
+import msgspec
 from sanic import Sanic, Request, response
 
-from .shared import Engine, User, get_engine
+from .shared import (
+    MIDDLEWARE_KIND,
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    Engine,
+    Order,
+    ResourceIn,
+    User,
+    asgi_stack,
+    create_resource,
+    download_file,
+    get_engine,
+    get_resource,
+    layer_header,
+    list_resources,
+    list_users,
+    ndjson_lines,
+    resource_children,
+    sse_events,
+    summarize_order,
+)
 
-app = Sanic("sanic_bench")
+order_decoder = msgspec.json.Decoder(Order)
+resource_decoder = msgspec.json.Decoder(ResourceIn)
 
 
-@app.post("/profile/<pid>")
 async def profile_handler(request: Request, pid: str):
     q = int(request.args.get("q", "0"))
     engine: Engine = get_engine(pid=pid, q=q)
@@ -19,5 +43,118 @@ async def profile_handler(request: Request, pid: str):
     return response.json(new_user.asdict())
 
 
+async def ping(request: Request):
+    return response.text("pong")
+
+
+async def create_order(request: Request):
+    try:
+        order = order_decoder.decode(request.body)
+    except msgspec.DecodeError as e:
+        return response.json({"detail": str(e)}, status=422)
+    return response.json(summarize_order(order).asdict())
+
+
+async def get_users(request: Request):
+    n = int(request.args.get("n", "100"))
+    return response.json([user.asdict() for user in list_users(n)])
+
+
+async def send_stream(request: Request, content_type: str, chunks):
+    resp = await request.respond(content_type=content_type)
+    async for chunk in chunks:
+        await resp.send(chunk)
+    await resp.eof()
+
+
+async def stream_ndjson(request: Request):
+    n = int(request.args.get("n", "100"))
+    await send_stream(request, "application/x-ndjson", ndjson_lines(n))
+
+
+async def stream_sse(request: Request):
+    n = int(request.args.get("n", "100"))
+    await send_stream(request, "text/event-stream", sse_events(n))
+
+
+async def get_download(request: Request, mb: int):
+    return await response.file_stream(download_file(mb))
+
+
+def add_resource_routes(resource: str):
+    async def list_all(request: Request):
+        limit = int(request.args.get("limit", "10"))
+        return response.json([r.asdict() for r in list_resources(resource, limit)])
+
+    async def create(request: Request):
+        try:
+            data = resource_decoder.decode(request.body)
+        except msgspec.DecodeError as e:
+            return response.json({"detail": str(e)}, status=422)
+        return response.json(create_resource(resource, data).asdict())
+
+    async def get_one(request: Request, id: int):
+        return response.json(get_resource(resource, id).asdict())
+
+    async def get_children(request: Request, id: int):
+        return response.json([r.asdict() for r in resource_children(resource, id)])
+
+    # sanic route names must be unique across the app
+    app.add_route(list_all, f"/api/{resource}", methods=["GET"], name=f"{resource}_list")
+    app.add_route(create, f"/api/{resource}", methods=["POST"], name=f"{resource}_create")
+    app.add_route(get_one, f"/api/{resource}/<id:int>", methods=["GET"], name=f"{resource}_get")
+    app.add_route(
+        get_children,
+        f"/api/{resource}/<id:int>/children",
+        methods=["GET"],
+        name=f"{resource}_children",
+    )
+
+
+async def get_static(request: Request):
+    return response.text("ok")
+
+
+async def get_item(request: Request, id: int):
+    return response.text(str(id))
+
+
+app = Sanic("sanic_bench")
+app.add_route(ping, "/ping", methods=["GET"])
+if ROUTE_TABLE:
+    # routing-scale mode: only the generated table
+    for idx, (path, param) in enumerate(ROUTE_TABLE):
+        handler = get_item if param else get_static
+        path = path.replace("{id}", "<id:int>")
+        app.add_route(handler, path, methods=["GET"], name=f"route_{idx}")
+else:
+    app.add_route(profile_handler, "/profile/<pid>", methods=["POST"])
+    app.add_route(create_order, "/scenario/orders", methods=["POST"])
+    app.add_route(get_users, "/scenario/users", methods=["GET"])
+    app.add_route(stream_ndjson, "/stream/ndjson", methods=["GET"])
+    app.add_route(stream_sse, "/stream/sse", methods=["GET"])
+    app.add_route(get_download, "/stream/download/<mb:int>", methods=["GET"])
+    for resource in RESOURCES:
+        add_resource_routes(resource)
+
+
+def header_layer(layer: int):
+    header = layer_header(layer)
+
+    async def add_header(request: Request, response):
+        response.headers[header] = "1"
+
+    return add_header
+
+
+if MIDDLEWARE_KIND == "native":
+    for layer in range(MIDDLEWARE_LAYERS):
+        app.on_response(header_layer(layer))
+else:
+    # served under uvicorn (SanicConfig without workers), so the whole app
+    # can be wrapped; Sanic's own server would need the bare app
+    app = asgi_stack(app)
+
+
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=int(os.environ.get("BENCH_PORT", "8000")))
\ No newline at end of file
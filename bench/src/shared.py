@@ -1,4 +1,11 @@
+import inspect
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable
+
 from msgspec import Struct
+from msgspec.json import Encoder
 from msgspec.structs import asdict
 
 
@@ -19,3 +26,295 @@ class Engine:
 
 def get_engine(pid: str, q: int) -> Engine:
     return Engine(url=pid, nums=q)
+
+
+# Scenario suite: nested order documents and list responses
+
+
+class Address(Struct):
+    street: str
+    city: str
+    zip: str
+
+
+class Customer(Struct):
+    id: int
+    name: str
+    email: str
+    address: Address
+
+
+class Option(Struct):
+    name: str
+    value: str
+
+
+class Item(Struct):
+    id: int
+    name: str
+    price: float
+    quantity: int
+    tags: list[str]
+    options: list[Option]
+
+
+class Order(Struct):
+    id: int
+    customer: Customer
+    items: list[Item]
+    notes: str = ""
+
+
+class OrderSummary(Struct):
+    id: int
+    items: int
+    total: float
+
+    def asdict(self):
+        return asdict(self)
+
+
+def summarize_order(order: Order) -> OrderSummary:
+    total = sum(item.price * item.quantity for item in order.items)
+    return OrderSummary(id=order.id, items=len(order.items), total=round(total, 2))
+
+
+MAX_USERS = 10_000
+
+# list responses are sliced from here, so handlers only pay for serialization
+USERS = [User(id=i, name=f"user-{i}", email=f"user-{i}@email.com") for i in range(MAX_USERS)]
+
+
+def list_users(n: int) -> list[User]:
+    return USERS[: max(0, min(n, MAX_USERS))]
+
+
+# Streaming suite: NDJSON exports, server-sent events and file downloads
+
+MAX_STREAM_ITEMS = 1_000_000
+MAX_DOWNLOAD_MB = 100
+DOWNLOAD_DIR = Path(
+    os.environ.get("BENCH_DOWNLOAD_DIR", Path(tempfile.gettempdir()) / "lhl_bench_downloads")
+)
+
+encoder = Encoder()
+
+
+def iter_users(n: int):
+    """`n` users, cycling through `USERS` for streams longer than it."""
+    for i in range(max(0, min(n, MAX_STREAM_ITEMS))):
+        yield USERS[i % MAX_USERS]
+
+
+async def ndjson_lines(n: int) -> AsyncIterator[bytes]:
+    """One JSON document per line, one chunk per user."""
+    for user in iter_users(n):
+        yield encoder.encode(user) + b"\n"
+
+
+async def sse_events(n: int) -> AsyncIterator[bytes]:
+    """`data: <user json>` events, for frameworks without an SSE helper."""
+    for user in iter_users(n):
+        yield b"data: " + encoder.encode(user) + b"\n\n"
+
+
+def download_file(mb: int) -> Path:
+    """Path of an `mb` MB file, written on first use.
+
+    The benchmark runner calls this before starting the server, so no
+    request pays for creating the file.
+    """
+    mb = max(1, min(mb, MAX_DOWNLOAD_MB))
+    path = DOWNLOAD_DIR / f"{mb}mb.bin"
+    if not path.exists():
+        DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        block = bytes(range(256)) * 4096  # 1 MB
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            for _ in range(mb):
+                f.write(block)
+        tmp.replace(path)
+    return path
+
+
+# Route table for mixed traffic: the same CRUD-style routes over many
+# resources (4 routes each), so routers are measured with 100+ entries
+
+RESOURCES = [
+    "accounts", "addresses", "alerts", "articles", "audits",
+    "carts", "categories", "comments", "coupons", "devices",
+    "events", "files", "groups", "invoices", "messages",
+    "notifications", "payments", "products", "projects", "reviews",
+    "sessions", "shipments", "subscriptions", "tickets", "webhooks",
+]
+
+
+class Resource(Struct):
+    id: int
+    name: str
+    tags: list[str] = []
+
+    def asdict(self):
+        return asdict(self)
+
+
+class ResourceIn(Struct):
+    name: str
+    tags: list[str] = []
+
+
+def get_resource(resource: str, id: int) -> Resource:
+    return Resource(id=id, name=f"{resource}-{id}", tags=[resource])
+
+
+def list_resources(resource: str, limit: int = 10) -> list[Resource]:
+    return [get_resource(resource, i) for i in range(max(0, min(limit, 100)))]
+
+
+def create_resource(resource: str, data: ResourceIn) -> Resource:
+    return Resource(id=1, name=data.name, tags=[resource, *data.tags])
+
+
+def resource_children(resource: str, id: int) -> list[Resource]:
+    return [get_resource(resource, id * 10 + i) for i in range(5)]
+
+
+# Routing-scale mode: with BENCH_ROUTES=<count> set, every app serves only a
+# generated table of `count` routes (plus /ping), see bench/routing.py
+
+ROUTE_KINDS = ("static", "param", "mixed")
+
+
+def route_table(count: int, kind: str = "mixed") -> list[tuple[str, bool]]:
+    """`(path, has {id} parameter)` of a generated app, in registration order.
+
+    Paths fan out at the first segment like a real API, e.g.
+    `/carts/17/items` (static) or `/carts/18/items/{id}` (param); "mixed"
+    alternates the two.
+    """
+    if kind not in ROUTE_KINDS:
+        raise ValueError(f"unknown route kind {kind!r}, expected one of {ROUTE_KINDS}")
+    table = []
+    for i in range(count):
+        param = kind == "param" or (kind == "mixed" and i % 2 == 1)
+        path = f"/{RESOURCES[i % len(RESOURCES)]}/{i}/items"
+        table.append((path + "/{id}", True) if param else (path, False))
+    return table
+
+
+ROUTE_TABLE = route_table(
+    int(os.environ.get("BENCH_ROUTES", "0")), os.environ.get("BENCH_ROUTE_KIND", "mixed")
+)
+
+
+# DI scenario: `/di` depends on BENCH_DI_WIDTH chains of BENCH_DI_DEPTH
+# nested dependencies (config -> pool -> repo -> service -> ...), each built
+# by a sync or async factory, per request or once (BENCH_DI_CACHED=1, a
+# singleton), see bench/di.py
+
+DI_DEPTH = int(os.environ.get("BENCH_DI_DEPTH", "0"))
+DI_WIDTH = int(os.environ.get("BENCH_DI_WIDTH", "1"))
+DI_ASYNC = os.environ.get("BENCH_DI_ASYNC") == "1"
+DI_CACHED = os.environ.get("BENCH_DI_CACHED") == "1"
+
+
+class Dep:
+    """A dependency, built from the one below it in its chain."""
+
+    dep = None  # not annotated: rodi would try to inject annotated attributes
+
+
+def dep_types(depth: int = DI_DEPTH, width: int = DI_WIDTH) -> list[list[type[Dep]]]:
+    """`levels[i][j]` is level `i` of chain `j`.
+
+    Every node is its own class, so containers keyed by type tell them
+    apart; its `__init__` takes the level below, typed, for containers that
+    build classes from their constructor (rodi).
+    """
+    levels: list[list[type[Dep]]] = []
+    for i in range(depth):
+        level = []
+        for j in range(width):
+            attrs: dict[str, Any] = {}
+            if i:
+
+                def __init__(self, dep):
+                    self.dep = dep
+
+                __init__.__annotations__ = {"dep": levels[i - 1][j]}
+                attrs["__init__"] = __init__
+            level.append(type(f"Dep{i}_{j}", (Dep,), attrs))
+        levels.append(level)
+    return levels
+
+
+def with_signature(fn: Callable, params: dict[str, Any], returns: Any = inspect.Signature.empty):
+    """Give `fn(*args, **kwargs)` the signature `(name: annotation, ...) -> returns`,
+    which is what frameworks inspect to find a callable's dependencies."""
+    fn.__signature__ = inspect.Signature(
+        [
+            inspect.Parameter(name, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation)
+            for name, annotation in params.items()
+        ],
+        return_annotation=returns,
+    )
+    fn.__annotations__ = dict(params)
+    if returns is not inspect.Signature.empty:
+        fn.__annotations__["return"] = returns
+    return fn
+
+
+def dep_factory(cls: type[Dep], params: dict[str, Any], is_async: bool = DI_ASYNC) -> Callable:
+    """Factory of `cls` taking `params`, the dependency below it (if any)."""
+    if is_async:
+
+        async def build(*args, **kwargs):
+            return cls(*args, *kwargs.values())
+
+    else:
+
+        def build(*args, **kwargs):
+            return cls(*args, *kwargs.values())
+
+    build.__name__ = build.__qualname__ = f"build_{cls.__name__.lower()}"
+    return with_signature(build, params, cls)
+
+
+# Middleware scenario: BENCH_MIDDLEWARE=<layers> stacks that many equivalent
+# layers on the app, each adding an `x-layer-<i>` response header, written
+# with the framework's own middleware API (BENCH_MIDDLEWARE_KIND=native) or
+# as pure ASGI wrapped around the app (asgi), see bench/middleware.py
+
+MIDDLEWARE_LAYERS = int(os.environ.get("BENCH_MIDDLEWARE", "0"))
+MIDDLEWARE_KIND = os.environ.get("BENCH_MIDDLEWARE_KIND", "native")
+
+
+def layer_header(layer: int) -> str:
+    return f"x-layer-{layer}"
+
+
+class HeaderMiddleware:
+    """Pure ASGI middleware adding one layer's response header."""
+
+    def __init__(self, app, layer: int = 0):
+        self.app = app
+        self.header = (layer_header(layer).encode(), b"1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), self.header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_header)
+
+
+def asgi_stack(app, layers: int = MIDDLEWARE_LAYERS):
+    """`app` wrapped in `layers` pure ASGI middleware."""
+    for layer in range(layers):
+        app = HeaderMiddleware(app, layer)
+    return app
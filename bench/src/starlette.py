@@ -1,9 +1,40 @@
 from litestar import Litestar, Router, get, post
 from litestar.di import Provide
+from litestar.middleware import ASGIMiddleware
 from litestar.params import Body, Parameter
+from litestar.response import File, ServerSentEvent, Stream
 
-from typing import Literal
-from .shared import Engine, User, get_engine
+from typing import AsyncIterator, Literal
+from .shared import (
+    DI_ASYNC,
+    DI_CACHED,
+    MIDDLEWARE_KIND,
+    MIDDLEWARE_LAYERS,
+    RESOURCES,
+    ROUTE_TABLE,
+    Engine,
+    Order,
+    OrderSummary,
+    Resource,
+    ResourceIn,
+    User,
+    asgi_stack,
+    create_resource,
+    dep_factory,
+    dep_types,
+    download_file,
+    encoder,
+    get_engine,
+    get_resource,
+    iter_users,
+    layer_header,
+    list_resources,
+    list_users,
+    ndjson_lines,
+    resource_children,
+    summarize_order,
+    with_signature,
+)
 
 
 @post("/{pid:str}")
@@ -28,6 +59,140 @@ profile_router = Router(
     dependencies={"engine": Provide(get_engine)},
 )
 
-app = Litestar(
-    route_handlers=[profile_router, ping],
+@post("/orders")
+async def create_order(data: Order) -> OrderSummary:
+    return summarize_order(data)
+
+
+@get("/users")
+async def get_users(n: int = 100) -> list[User]:
+    return list_users(n)
+
+
+scenario_router = Router(path="/scenario", route_handlers=[create_order, get_users])
+
+
+@get("/ndjson")
+async def stream_ndjson(n: int = 100) -> Stream:
+    return Stream(ndjson_lines(n), media_type="application/x-ndjson")
+
+
+async def user_events(n: int) -> AsyncIterator[bytes]:
+    for user in iter_users(n):
+        yield encoder.encode(user)
+
+
+@get("/sse")
+async def stream_sse(n: int = 100) -> ServerSentEvent:
+    return ServerSentEvent(user_events(n))
+
+
+@get("/download/{mb:int}")
+async def get_download(mb: int) -> File:
+    return File(download_file(mb))
+
+
+stream_router = Router(
+    path="/stream", route_handlers=[stream_ndjson, stream_sse, get_download]
+)
+
+def resource_router(resource: str) -> Router:
+    @get("/")
+    async def list_all(limit: int = 10) -> list[Resource]:
+        return list_resources(resource, limit)
+
+    @post("/")
+    async def create(data: ResourceIn) -> Resource:
+        return create_resource(resource, data)
+
+    @get("/{id:int}")
+    async def get_one(id: int) -> Resource:
+        return get_resource(resource, id)
+
+    @get("/{id:int}/children")
+    async def get_children(id: int) -> list[Resource]:
+        return resource_children(resource, id)
+
+    return Router(
+        path=f"/api/{resource}",
+        route_handlers=[list_all, create, get_one, get_children],
+    )
+
+
+def di_handler():
+    """`/di`, depending on the last level of every chain; cached providers
+    keep their first value (`use_cache=True`)."""
+    levels = dep_types()
+    dependencies = {}
+    for i, level in enumerate(levels):
+        for j, cls in enumerate(level):
+            params = {f"dep{i - 1}_{j}": levels[i - 1][j]} if i else {}
+            options = {} if DI_ASYNC else {"sync_to_thread": False}
+            dependencies[f"dep{i}_{j}"] = Provide(
+                dep_factory(cls, params), use_cache=DI_CACHED, **options
+            )
+
+    async def resolve(*args, **kwargs) -> str:
+        return "ok"
+
+    top = {f"dep{len(levels) - 1}_{j}": cls for j, cls in enumerate(levels[-1])} if levels else {}
+    return get("/di", dependencies=dependencies)(with_signature(resolve, top, str))
+
+
+def table_handlers() -> list:
+    """The generated route table of routing-scale mode, one handler per route."""
+    handlers = []
+    for path, param in ROUTE_TABLE:
+        if param:
+
+            async def get_item(id: int) -> str:
+                return str(id)
+
+            handlers.append(get(path.replace("{id}", "{id:int}"))(get_item))
+        else:
+
+            async def get_static() -> str:
+                return "ok"
+
+            handlers.append(get(path)(get_static))
+    return handlers
+
+
+class HeaderLayer(ASGIMiddleware):
+    """One layer of the middleware stack, adding its response header."""
+
+    def __init__(self, layer: int):
+        self.header = (layer_header(layer).encode(), b"1")
+
+    async def handle(self, scope, receive, send, next_app):
+        async def send_with_header(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), self.header]
+            await send(message)
+
+        await next_app(scope, receive, send_with_header)
+
+
+middleware = (
+    [HeaderLayer(layer) for layer in range(MIDDLEWARE_LAYERS)]
+    if MIDDLEWARE_KIND == "native"
+    else []
 )
+
+if ROUTE_TABLE:
+    app = Litestar(route_handlers=[ping, *table_handlers()], middleware=middleware)
+else:
+    app = Litestar(
+        route_handlers=[
+            profile_router,
+            ping,
+            scenario_router,
+            stream_router,
+            di_handler(),
+            *(resource_router(resource) for resource in RESOURCES),
+        ],
+        middleware=middleware,
+    )
+
+if MIDDLEWARE_KIND == "asgi":
+    app = asgi_stack(app)
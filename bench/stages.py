@@ -0,0 +1,302 @@
+"""
+Per-stage request timing for bench/inproc.py (`--stages`).
+
+Wraps the functions each framework calls while serving a request in timers
+(`time.perf_counter_ns`) and attributes every request's time to the stage
+that spent it:
+
+- `receive` / `send`: awaiting the ASGI channel (the harness's callables).
+- `routing`: matching the path to a route.
+- `decode`: reading and parsing parameters and the body into `User`/`PdUser`.
+- `di`: dependency resolution, `get_engine` included.
+- `handler`: the endpoint function itself.
+- `serialize`: turning the return value into a response and its headers.
+- `other`: the rest, the framework's glue between stages.
+
+Stages nest (a handler calls `get_engine`, decoding awaits `receive`), so a
+timer records exclusive time, its own minus that of the timers inside it.
+This relies on requests being served one at a time, as the harness does.
+Like inproc.py this module only depends on the standard library and is
+imported inside the framework's environment.
+"""
+
+import functools
+import inspect
+import json
+import sys
+from time import perf_counter_ns
+from typing import Any, Callable
+
+STAGES = ("receive", "routing", "decode", "di", "handler", "serialize", "send", "other")
+RECEIVE, ROUTING, DECODE, DI, HANDLER, SERIALIZE, SEND, OTHER = range(len(STAGES))
+
+# histogram buckets: 8 per power of two (~9% wide), exact below 16ns
+SUB_BITS = 3
+BUCKETS = 64 << SUB_BITS
+
+
+def bucket_of(ns: int) -> int:
+    octave = ns.bit_length()
+    if octave <= SUB_BITS + 1:
+        return ns
+    return ((octave - SUB_BITS) << SUB_BITS) + ((ns >> (octave - SUB_BITS - 1)) & ((1 << SUB_BITS) - 1))
+
+
+def bucket_value(bucket: int) -> float:
+    """Middle of a bucket's range, in ns."""
+    if bucket < 2 << SUB_BITS:
+        return float(bucket)
+    octave = (bucket >> SUB_BITS) + SUB_BITS
+    low = ((1 << SUB_BITS) + (bucket & ((1 << SUB_BITS) - 1))) << (octave - SUB_BITS - 1)
+    return low + (1 << (octave - SUB_BITS - 2))
+
+
+class StageRecorder:
+    """Exclusive time per stage of the current request and a histogram of
+    each stage's time per request."""
+
+    def __init__(self):
+        self.current = [0] * len(STAGES)
+        self.calls = [0] * len(STAGES)
+        self.stack: list[int] = []  # per running timer: time spent in nested timers
+        self.totals = [0] * len(STAGES)
+        self.histograms = [[0] * BUCKETS for _ in STAGES]
+        self.requests = 0
+        self.timers: set[int] = set()  # ids of the wrappers handed out
+
+    def timer(self, stage: int, fn: Callable) -> Callable:
+        """`fn` with its calls (and awaits of what it returns) counted as
+        `stage`; bare and cheap to build, for callables made per request."""
+        current, calls, stack = self.current, self.calls, self.stack
+
+        async def timed_await(awaitable):
+            stack.append(0)
+            started = perf_counter_ns()
+            try:
+                return await awaitable
+            finally:
+                elapsed = perf_counter_ns() - started
+                current[stage] += elapsed - stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+
+        if inspect.iscoroutinefunction(fn):
+
+            async def async_wrapper(*args, **kwargs):
+                calls[stage] += 1
+                stack.append(0)
+                started = perf_counter_ns()
+                try:
+                    return await fn(*args, **kwargs)
+                finally:
+                    elapsed = perf_counter_ns() - started
+                    current[stage] += elapsed - stack.pop()
+                    if stack:
+                        stack[-1] += elapsed
+
+            return async_wrapper
+
+        def wrapper(*args, **kwargs):
+            calls[stage] += 1
+            stack.append(0)
+            started = perf_counter_ns()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - started
+                current[stage] += elapsed - stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+            # compiled (Cython) coroutine functions are not recognized above
+            return timed_await(result) if inspect.iscoroutine(result) else result
+
+        return wrapper
+
+    def timed(self, stage: int, fn: Callable) -> Callable:
+        """`timer` looking like `fn` to frameworks that inspect it."""
+        wrapper = functools.update_wrapper(self.timer(stage, fn), fn)
+        # frameworks read signatures, but some DI systems take `__wrapped__`
+        # for the mark of a context manager (ididi)
+        del wrapper.__wrapped__
+        try:
+            wrapper.__signature__ = inspect.signature(fn)
+        except (TypeError, ValueError):
+            pass
+        self.timers.add(id(wrapper))
+        return wrapper
+
+    def hook(self, stage: int, owner: Any, attr: str) -> None:
+        """Replace `owner.attr` (a module, class or instance attribute) with
+        its timed version, keeping class/static methods what they are."""
+        raw = inspect.getattr_static(owner, attr)
+        if id(getattr(raw, "__func__", raw)) in self.timers:
+            return  # inherited from a class hooked already
+        if isinstance(raw, classmethod):
+            setattr(owner, attr, classmethod(self.timed(stage, raw.__func__)))
+        elif isinstance(raw, staticmethod):
+            setattr(owner, attr, staticmethod(self.timed(stage, raw.__func__)))
+        else:
+            setattr(owner, attr, self.timed(stage, raw))
+
+    def hook_overrides(self, stage: int, base: type, attr: str) -> None:
+        """Time `attr` on `base` and on every subclass that overrides it."""
+        pending, seen = [base], set()
+        while pending:
+            cls = pending.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            if attr in cls.__dict__:
+                self.hook(stage, cls, attr)
+            pending.extend(cls.__subclasses__())
+
+    def record(self, total_ns: int) -> None:
+        """Close the current request, which took `total_ns` in all."""
+        current, totals, histograms = self.current, self.totals, self.histograms
+        current[OTHER] = max(total_ns - sum(current) + current[OTHER], 0)
+        for stage, ns in enumerate(current):
+            totals[stage] += ns
+            histograms[stage][bucket_of(ns)] += 1
+            current[stage] = 0
+        self.requests += 1
+
+    def reset(self) -> None:
+        """Forget recorded requests, e.g. after warmup. In place, the timers
+        hold on to these lists."""
+        for counters in (self.current, self.calls, self.totals):
+            counters[:] = [0] * len(STAGES)
+        for histogram in self.histograms:
+            histogram[:] = [0] * BUCKETS
+        self.requests = 0
+
+    def percentile(self, stage: int, q: float) -> float:
+        rank, seen = q * self.requests, 0
+        for bucket, count in enumerate(self.histograms[stage]):
+            seen += count
+            if count and seen >= rank:
+                return bucket_value(bucket)
+        return 0.0
+
+    def summary(self) -> list[dict[str, Any]]:
+        requests = max(self.requests, 1)
+        return [
+            {
+                "stage": name,
+                "mean_ns": self.totals[stage] / requests,
+                "p50_ns": self.percentile(stage, 0.5),
+                "p99_ns": self.percentile(stage, 0.99),
+                "calls": self.calls[stage] / requests,
+            }
+            for stage, name in enumerate(STAGES)
+        ]
+
+
+def hook_shared(recorder: StageRecorder, shared) -> None:
+    """Before the app is imported: functions the apps bind by name at import."""
+    recorder.hook(DI, shared, "get_engine")
+    # the Starlette and Sanic apps parse bodies themselves
+    recorder.hook(DECODE, json, "loads")
+
+
+def hook_lihil(recorder: StageRecorder, app) -> None:
+    from lihil.asgi import ASGIRoute
+    from lihil.http.endpoint import Endpoint, HTTPInjector
+    from lihil.http.routing import Route
+
+    recorder.hook_overrides(ROUTING, ASGIRoute, "match")
+    recorder.hook(DECODE, HTTPInjector, "validate_request")
+    recorder.hook(SERIALIZE, Endpoint, "return_to_response")
+    for route in app.routes:
+        if isinstance(route, Route):
+            for endpoint in route.endpoints.values():
+                endpoint._func = recorder.timed(HANDLER, endpoint._func)
+
+
+def hook_fastapi(recorder: StageRecorder, app) -> None:
+    import fastapi.dependencies.utils as dependencies
+    import fastapi.routing as routing
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse, Response
+
+    for cls in {type(route) for route in app.router.routes}:
+        recorder.hook(ROUTING, cls, "matches")
+    recorder.hook(DECODE, Request, "json")
+    recorder.hook(DECODE, dependencies, "request_params_to_args")
+    recorder.hook(DECODE, dependencies, "request_body_to_args")
+    recorder.hook(DI, routing, "solve_dependencies")
+    recorder.hook(HANDLER, routing, "run_endpoint_function")
+    recorder.hook(SERIALIZE, routing, "serialize_response")
+    recorder.hook(SERIALIZE, Response, "render")
+    recorder.hook(SERIALIZE, JSONResponse, "render")
+
+
+def hook_starlette(recorder: StageRecorder, app) -> None:
+    from starlette.requests import Request
+    from starlette.responses import JSONResponse, Response
+    from starlette.routing import Route, request_response
+
+    recorder.hook(DECODE, Request, "body")
+    recorder.hook(SERIALIZE, Response, "render")
+    recorder.hook(SERIALIZE, JSONResponse, "render")
+    for route in app.routes:
+        recorder.hook(ROUTING, type(route), "matches")
+        if isinstance(route, Route) and inspect.iscoroutinefunction(route.endpoint):
+            route.app = request_response(recorder.timed(HANDLER, route.endpoint))
+
+
+def hook_litestar(recorder: StageRecorder, app) -> None:
+    from litestar._asgi.asgi_router import ASGIRouter
+    from litestar._kwargs.kwargs_model import KwargsModel
+    from litestar._signature.model import SignatureModel
+    from litestar.handlers.http_handlers.base import HTTPRouteHandler
+
+    recorder.hook(ROUTING, ASGIRouter, "handle_routing")
+    recorder.hook(DECODE, KwargsModel, "to_kwargs")
+    recorder.hook(DECODE, SignatureModel, "parse_values_from_connection_kwargs")
+    recorder.hook(DI, KwargsModel, "resolve_dependencies")
+    recorder.hook(SERIALIZE, HTTPRouteHandler, "to_response")
+    for route in app.routes:
+        for handler, _ in getattr(route, "route_handler_map", {}).values():
+            handler._fn = recorder.timed(HANDLER, handler._fn)
+
+
+def hook_blacksheep(recorder: StageRecorder, app) -> None:
+    import blacksheep.server.application as application
+    from blacksheep.server.bindings import Binder
+
+    recorder.hook(ROUTING, type(app.router), "get_match")
+    recorder.hook_overrides(DECODE, Binder, "get_value")
+    recorder.hook(SERIALIZE, application, "send_asgi_response")
+    for route in app.router:
+        route.handler = recorder.timed(HANDLER, route.handler)
+
+
+def hook_sanic(recorder: StageRecorder, app) -> None:
+    import sanic.response as response
+    from sanic.response import BaseHTTPResponse
+
+    recorder.hook(ROUTING, type(app.router), "get")
+    recorder.hook(SERIALIZE, response, "json")
+    recorder.hook(SERIALIZE, response, "text")
+    recorder.hook(SERIALIZE, BaseHTTPResponse, "send")
+    for route in app.router.routes:
+        route.handler = recorder.timed(HANDLER, route.handler)
+
+
+# by the package the app object comes from; src/litestar.py serves Starlette
+FRAMEWORK_HOOKS = {
+    "lihil": hook_lihil,
+    "fastapi": hook_fastapi,
+    "starlette": hook_starlette,
+    "litestar": hook_litestar,
+    "blacksheep": hook_blacksheep,
+    "sanic": hook_sanic,
+}
+
+
+def hook_app(recorder: StageRecorder, app) -> None:
+    """After startup: time the app's routing, parsing, handlers and rendering."""
+    package = type(app).__module__.split(".")[0]
+    if package not in FRAMEWORK_HOOKS:
+        sys.exit(f"inproc: no stage hooks for {package} apps")
+    FRAMEWORK_HOOKS[package](recorder, app)
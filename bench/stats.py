@@ -0,0 +1,168 @@
+"""
+Statistics helpers for benchmark results.
+"""
+
+import math
+import random
+import statistics
+from itertools import combinations, pairwise
+from typing import Optional, Sequence
+
+from .data_manager import (
+    DriftReport,
+    FrameworkResult,
+    LatencyStats,
+    RunSample,
+    SweepPoint,
+    TrialStats,
+)
+
+
+def percentile(ordered: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    if not ordered:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def latency_stats(samples: Sequence[float]) -> LatencyStats:
+    """Summarize latency samples (microseconds) the same way wrk does."""
+    ordered = sorted(samples)
+    if not ordered:
+        return LatencyStats(0, 0, 0, 0, 0, 0, 0, 0, 0)
+    mean = sum(ordered) / len(ordered)
+    variance = sum((x - mean) ** 2 for x in ordered) / len(ordered)
+    return LatencyStats(
+        min=ordered[0],
+        max=ordered[-1],
+        mean=mean,
+        stdev=math.sqrt(variance),
+        p50=percentile(ordered, 50),
+        p75=percentile(ordered, 75),
+        p90=percentile(ordered, 90),
+        p99=percentile(ordered, 99),
+        p999=percentile(ordered, 99.9),
+    )
+
+
+def find_saturation_point(
+    points: list[SweepPoint],
+    plateau: float = 0.05,
+    latency_factor: float = 1.5,
+) -> Optional[int]:
+    """Locate the knee of a load curve.
+
+    The knee is the last swept value before throughput stops growing (less
+    than `plateau` relative gain to the next point) while p99 latency grows
+    by at least `latency_factor`: past it, extra load only adds queueing.
+    Returns None if the curve never saturates in the swept range.
+    """
+    ordered = sorted(points, key=lambda point: point.value)
+    for prev, nxt in pairwise(ordered):
+        if prev.rps <= 0:
+            continue
+        gain = (nxt.rps - prev.rps) / prev.rps
+        if gain >= plateau:
+            continue
+        if prev.latency is None or nxt.latency is None:
+            return prev.value
+        if nxt.latency.p99 >= latency_factor * prev.latency.p99:
+            return prev.value
+    return None
+
+
+def bootstrap_ci(
+    samples: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> tuple[float, float]:
+    """Percentile bootstrap confidence interval of the mean."""
+    if len(samples) < 2:
+        return samples[0], samples[0]
+    rng = random.Random(seed)
+    n = len(samples)
+    means = sorted(sum(rng.choices(samples, k=n)) / n for _ in range(resamples))
+    tail = (1 - confidence) / 2 * 100
+    return percentile(means, tail), percentile(means, 100 - tail)
+
+
+def summarize_trials(samples: Sequence[float], confidence: float = 0.95) -> TrialStats:
+    """Mean, stdev, median and bootstrap CI of per-trial RPS."""
+    ci_low, ci_high = bootstrap_ci(samples, confidence)
+    return TrialStats(
+        samples=list(samples),
+        mean=statistics.fmean(samples),
+        stdev=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        median=statistics.median(samples),
+        ci_low=ci_low,
+        ci_high=ci_high,
+        confidence=confidence,
+    )
+
+
+def find_ties(results: list[FrameworkResult]) -> list[list[str]]:
+    """Framework pairs whose confidence intervals overlap: statistically tied."""
+    with_trials = [r for r in results if r.trials is not None and len(r.trials.samples) > 1]
+    ties = []
+    for a, b in combinations(sorted(with_trials, key=lambda r: r.rps, reverse=True), 2):
+        assert a.trials is not None and b.trials is not None
+        if a.trials.overlaps(b.trials):
+            ties.append([a.framework, b.framework])
+    return ties
+
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> tuple[float, float]:
+    """Least squares `(slope, intercept)` of ys against xs."""
+    if len(xs) < 2:
+        return 0.0, ys[0] if ys else 0.0
+    slope, intercept = statistics.linear_regression(xs, ys)
+    return slope, intercept
+
+
+def fitted_change(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Change of the fitted line between the first and last x."""
+    slope, _ = linear_fit(xs, ys)
+    return slope * (xs[-1] - xs[0]) if xs else 0.0
+
+
+def overhead_us(rps: float, baseline_rps: float) -> float:
+    """Extra server time per request vs. the baseline, in microseconds.
+
+    Valid for a single server process under closed-loop load at saturation,
+    where 1/RPS is its time per request.
+    """
+    return (1 / rps - 1 / baseline_rps) * 1e6
+
+
+def detect_drift(runs: list[RunSample], threshold: float = 0.03) -> DriftReport:
+    """Fit RPS, CPU frequency and temperature against run order.
+
+    RPS is normalized by each framework's mean first, so interleaving
+    different frameworks does not look like drift; what is left is the
+    session-wide trend (thermal throttling, turbo budget running out, ...).
+    `drifting` is set when that trend exceeds `threshold` of the mean.
+    """
+    means: dict[str, float] = {}
+    for framework in {run.framework for run in runs}:
+        means[framework] = statistics.fmean(r.rps for r in runs if r.framework == framework)
+
+    ordered = sorted(runs, key=lambda run: run.order)
+    xs = [float(run.order) for run in ordered]
+    normalized = [run.rps / means[run.framework] if means[run.framework] else 1.0 for run in ordered]
+    rps_change = fitted_change(xs, normalized)
+
+    def change(values: list[Optional[float]]) -> Optional[float]:
+        points = [(x, v) for x, v in zip(xs, values) if v is not None]
+        if len(points) < 2:
+            return None
+        return fitted_change([x for x, _ in points], [v for _, v in points])
+
+    return DriftReport(
+        runs=ordered,
+        rps_change=rps_change,
+        cpu_mhz_change=change([run.cpu_mhz for run in ordered]),
+        temp_c_change=change([run.temp_c for run in ordered]),
+        drifting=abs(rps_change) > threshold,
+    )
@@ -0,0 +1,47 @@
+"""
+Host state readings from /sys, taken around each benchmark run.
+
+All readers return None when the information is not exposed (containers,
+VMs, non-Linux hosts) rather than failing the run.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+CPU_DIR = Path("/sys/devices/system/cpu")
+THERMAL_DIR = Path("/sys/class/thermal")
+
+
+def read_cpu_freq_mhz() -> Optional[float]:
+    """Average current frequency across CPUs, in MHz."""
+    freqs = []
+    for path in CPU_DIR.glob("cpu[0-9]*/cpufreq/scaling_cur_freq"):
+        try:
+            freqs.append(int(path.read_text()) / 1000)  # kHz -> MHz
+        except (OSError, ValueError):
+            continue
+    if freqs:
+        return sum(freqs) / len(freqs)
+
+    # fall back to /proc/cpuinfo, which most VMs still fill in
+    try:
+        lines = Path("/proc/cpuinfo").read_text().splitlines()
+    except OSError:
+        return None
+    freqs = [float(line.split(":")[1]) for line in lines if line.startswith("cpu MHz")]
+    return sum(freqs) / len(freqs) if freqs else None
+
+
+def read_cpu_temp_c() -> Optional[float]:
+    """Hottest CPU-related thermal zone, in degrees Celsius."""
+    temps = []
+    for zone in THERMAL_DIR.glob("thermal_zone*"):
+        try:
+            kind = (zone / "type").read_text().strip().lower()
+            temp = int((zone / "temp").read_text()) / 1000  # millidegrees
+        except (OSError, ValueError):
+            continue
+        # skip batteries, wifi, ... when the zone type says what it is
+        if any(name in kind for name in ("cpu", "x86_pkg", "coretemp", "soc", "acpitz", "k10temp")):
+            temps.append(temp)
+    return max(temps) if temps else None
@@ -1,3 +1,18 @@
 wrk.method = "POST"
-wrk.body = '{"id":1,"name":"user","email":"user@email.com"}'
-wrk.headers["Content-Type"] = "application/json"
\ No newline at end of file
+wrk.body = [[{"id":1,"name":"user","email":"user@email.com"}]]
+wrk.headers["Content-Type"] = "application/json"
+
+done = function(summary, latency, requests)
+  local e = summary.errors
+  io.write(string.format(
+    '__WRK_SUMMARY__ {"requests":%d,"duration_us":%d,"bytes":%d,'
+    .. '"latency":{"min":%d,"max":%d,"mean":%.2f,"stdev":%.2f,'
+    .. '"p50":%d,"p75":%d,"p90":%d,"p99":%d,"p999":%d},'
+    .. '"errors":{"connect":%d,"read":%d,"write":%d,"timeout":%d,"status":%d}}\n',
+    summary.requests, summary.duration, summary.bytes,
+    latency.min, latency.max, latency.mean, latency.stdev,
+    latency:percentile(50), latency:percentile(75), latency:percentile(90),
+    latency:percentile(99), latency:percentile(99.9),
+    e.connect, e.read, e.write, e.timeout, e.status
+  ))
+end
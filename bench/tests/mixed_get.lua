@@ -0,0 +1,257 @@
+local requests = {}
+requests[1] = wrk.format("GET", [[/api/accounts/2]], {}, nil)
+requests[2] = wrk.format("GET", [[/api/addresses/7921]], {}, nil)
+requests[3] = wrk.format("GET", [[/api/alerts/15840]], {}, nil)
+requests[4] = wrk.format("GET", [[/api/articles/23759]], {}, nil)
+requests[5] = wrk.format("GET", [[/api/audits/31678]], {}, nil)
+requests[6] = wrk.format("GET", [[/api/carts/39597]], {}, nil)
+requests[7] = wrk.format("GET", [[/api/categories/47516]], {}, nil)
+requests[8] = wrk.format("GET", [[/api/comments/55435]], {}, nil)
+requests[9] = wrk.format("GET", [[/api/coupons/63354]], {}, nil)
+requests[10] = wrk.format("GET", [[/api/devices/71273]], {}, nil)
+requests[11] = wrk.format("GET", [[/api/events/79192]], {}, nil)
+requests[12] = wrk.format("GET", [[/api/files/87111]], {}, nil)
+requests[13] = wrk.format("GET", [[/api/groups/95030]], {}, nil)
+requests[14] = wrk.format("GET", [[/api/invoices/2949]], {}, nil)
+requests[15] = wrk.format("GET", [[/api/messages/10868]], {}, nil)
+requests[16] = wrk.format("GET", [[/api/notifications/18787]], {}, nil)
+requests[17] = wrk.format("GET", [[/api/payments/26706]], {}, nil)
+requests[18] = wrk.format("GET", [[/api/products/34625]], {}, nil)
+requests[19] = wrk.format("GET", [[/api/projects/42544]], {}, nil)
+requests[20] = wrk.format("GET", [[/api/reviews/50463]], {}, nil)
+requests[21] = wrk.format("GET", [[/api/sessions/58382]], {}, nil)
+requests[22] = wrk.format("GET", [[/api/shipments/66301]], {}, nil)
+requests[23] = wrk.format("GET", [[/api/subscriptions/74220]], {}, nil)
+requests[24] = wrk.format("GET", [[/api/tickets/82139]], {}, nil)
+requests[25] = wrk.format("GET", [[/api/webhooks/90058]], {}, nil)
+requests[26] = wrk.format("GET", [[/api/accounts/97977]], {}, nil)
+requests[27] = wrk.format("GET", [[/api/addresses/5896]], {}, nil)
+requests[28] = wrk.format("GET", [[/api/alerts/13815]], {}, nil)
+requests[29] = wrk.format("GET", [[/api/articles/21734]], {}, nil)
+requests[30] = wrk.format("GET", [[/api/audits/29653]], {}, nil)
+requests[31] = wrk.format("GET", [[/api/carts/37572]], {}, nil)
+requests[32] = wrk.format("GET", [[/api/categories/45491]], {}, nil)
+requests[33] = wrk.format("GET", [[/api/comments/53410]], {}, nil)
+requests[34] = wrk.format("GET", [[/api/coupons/61329]], {}, nil)
+requests[35] = wrk.format("GET", [[/api/devices/69248]], {}, nil)
+requests[36] = wrk.format("GET", [[/api/events/77167]], {}, nil)
+requests[37] = wrk.format("GET", [[/api/files/85086]], {}, nil)
+requests[38] = wrk.format("GET", [[/api/groups/93005]], {}, nil)
+requests[39] = wrk.format("GET", [[/api/invoices/924]], {}, nil)
+requests[40] = wrk.format("GET", [[/api/messages/8843]], {}, nil)
+requests[41] = wrk.format("GET", [[/api/notifications/16762]], {}, nil)
+requests[42] = wrk.format("GET", [[/api/payments/24681]], {}, nil)
+requests[43] = wrk.format("GET", [[/api/products/32600]], {}, nil)
+requests[44] = wrk.format("GET", [[/api/projects/40519]], {}, nil)
+requests[45] = wrk.format("GET", [[/api/reviews/48438]], {}, nil)
+requests[46] = wrk.format("GET", [[/api/sessions/56357]], {}, nil)
+requests[47] = wrk.format("GET", [[/api/shipments/64276]], {}, nil)
+requests[48] = wrk.format("GET", [[/api/subscriptions/72195]], {}, nil)
+requests[49] = wrk.format("GET", [[/api/tickets/80114]], {}, nil)
+requests[50] = wrk.format("GET", [[/api/webhooks/88033]], {}, nil)
+requests[51] = wrk.format("GET", [[/api/accounts/95952]], {}, nil)
+requests[52] = wrk.format("GET", [[/api/addresses/3871]], {}, nil)
+requests[53] = wrk.format("GET", [[/api/alerts/11790]], {}, nil)
+requests[54] = wrk.format("GET", [[/api/articles/19709]], {}, nil)
+requests[55] = wrk.format("GET", [[/api/audits/27628]], {}, nil)
+requests[56] = wrk.format("GET", [[/api/carts/35547]], {}, nil)
+requests[57] = wrk.format("GET", [[/api/categories/43466]], {}, nil)
+requests[58] = wrk.format("GET", [[/api/comments/51385]], {}, nil)
+requests[59] = wrk.format("GET", [[/api/coupons/59304]], {}, nil)
+requests[60] = wrk.format("GET", [[/api/devices/67223]], {}, nil)
+requests[61] = wrk.format("GET", [[/api/events/75142]], {}, nil)
+requests[62] = wrk.format("GET", [[/api/files/83061]], {}, nil)
+requests[63] = wrk.format("GET", [[/api/groups/90980]], {}, nil)
+requests[64] = wrk.format("GET", [[/api/invoices/98899]], {}, nil)
+requests[65] = wrk.format("GET", [[/api/messages/6818]], {}, nil)
+requests[66] = wrk.format("GET", [[/api/notifications/14737]], {}, nil)
+requests[67] = wrk.format("GET", [[/api/payments/22656]], {}, nil)
+requests[68] = wrk.format("GET", [[/api/products/30575]], {}, nil)
+requests[69] = wrk.format("GET", [[/api/projects/38494]], {}, nil)
+requests[70] = wrk.format("GET", [[/api/reviews/46413]], {}, nil)
+requests[71] = wrk.format("GET", [[/api/sessions/54332]], {}, nil)
+requests[72] = wrk.format("GET", [[/api/shipments/62251]], {}, nil)
+requests[73] = wrk.format("GET", [[/api/subscriptions/70170]], {}, nil)
+requests[74] = wrk.format("GET", [[/api/tickets/78089]], {}, nil)
+requests[75] = wrk.format("GET", [[/api/webhooks/86008]], {}, nil)
+requests[76] = wrk.format("GET", [[/api/accounts/93927]], {}, nil)
+requests[77] = wrk.format("GET", [[/api/addresses/1846]], {}, nil)
+requests[78] = wrk.format("GET", [[/api/alerts/9765]], {}, nil)
+requests[79] = wrk.format("GET", [[/api/articles/17684]], {}, nil)
+requests[80] = wrk.format("GET", [[/api/audits/25603]], {}, nil)
+requests[81] = wrk.format("GET", [[/api/carts/33522]], {}, nil)
+requests[82] = wrk.format("GET", [[/api/categories/41441]], {}, nil)
+requests[83] = wrk.format("GET", [[/api/comments/49360]], {}, nil)
+requests[84] = wrk.format("GET", [[/api/coupons/57279]], {}, nil)
+requests[85] = wrk.format("GET", [[/api/devices/65198]], {}, nil)
+requests[86] = wrk.format("GET", [[/api/events/73117]], {}, nil)
+requests[87] = wrk.format("GET", [[/api/files/81036]], {}, nil)
+requests[88] = wrk.format("GET", [[/api/groups/88955]], {}, nil)
+requests[89] = wrk.format("GET", [[/api/invoices/96874]], {}, nil)
+requests[90] = wrk.format("GET", [[/api/messages/4793]], {}, nil)
+requests[91] = wrk.format("GET", [[/api/notifications/12712]], {}, nil)
+requests[92] = wrk.format("GET", [[/api/payments/20631]], {}, nil)
+requests[93] = wrk.format("GET", [[/api/products/28550]], {}, nil)
+requests[94] = wrk.format("GET", [[/api/projects/36469]], {}, nil)
+requests[95] = wrk.format("GET", [[/api/reviews/44388]], {}, nil)
+requests[96] = wrk.format("GET", [[/api/sessions/52307]], {}, nil)
+requests[97] = wrk.format("GET", [[/api/shipments/60226]], {}, nil)
+requests[98] = wrk.format("GET", [[/api/subscriptions/68145]], {}, nil)
+requests[99] = wrk.format("GET", [[/api/tickets/76064]], {}, nil)
+requests[100] = wrk.format("GET", [[/api/webhooks/83983]], {}, nil)
+requests[101] = wrk.format("GET", [[/api/accounts?limit=10]], {}, nil)
+requests[102] = wrk.format("GET", [[/api/addresses?limit=5]], {}, nil)
+requests[103] = wrk.format("GET", [[/api/alerts?limit=50]], {}, nil)
+requests[104] = wrk.format("GET", [[/api/articles?limit=20]], {}, nil)
+requests[105] = wrk.format("GET", [[/api/audits?limit=10]], {}, nil)
+requests[106] = wrk.format("GET", [[/api/carts?limit=5]], {}, nil)
+requests[107] = wrk.format("GET", [[/api/categories?limit=50]], {}, nil)
+requests[108] = wrk.format("GET", [[/api/comments?limit=20]], {}, nil)
+requests[109] = wrk.format("GET", [[/api/coupons?limit=10]], {}, nil)
+requests[110] = wrk.format("GET", [[/api/devices?limit=5]], {}, nil)
+requests[111] = wrk.format("GET", [[/api/events?limit=50]], {}, nil)
+requests[112] = wrk.format("GET", [[/api/files?limit=20]], {}, nil)
+requests[113] = wrk.format("GET", [[/api/groups?limit=10]], {}, nil)
+requests[114] = wrk.format("GET", [[/api/invoices?limit=5]], {}, nil)
+requests[115] = wrk.format("GET", [[/api/messages?limit=50]], {}, nil)
+requests[116] = wrk.format("GET", [[/api/notifications?limit=20]], {}, nil)
+requests[117] = wrk.format("GET", [[/api/payments?limit=10]], {}, nil)
+requests[118] = wrk.format("GET", [[/api/products?limit=5]], {}, nil)
+requests[119] = wrk.format("GET", [[/api/projects?limit=50]], {}, nil)
+requests[120] = wrk.format("GET", [[/api/reviews?limit=20]], {}, nil)
+requests[121] = wrk.format("GET", [[/api/sessions?limit=10]], {}, nil)
+requests[122] = wrk.format("GET", [[/api/shipments?limit=5]], {}, nil)
+requests[123] = wrk.format("GET", [[/api/subscriptions?limit=50]], {}, nil)
+requests[124] = wrk.format("GET", [[/api/tickets?limit=20]], {}, nil)
+requests[125] = wrk.format("GET", [[/api/webhooks?limit=10]], {}, nil)
+requests[126] = wrk.format("GET", [[/api/accounts?limit=5]], {}, nil)
+requests[127] = wrk.format("GET", [[/api/addresses?limit=50]], {}, nil)
+requests[128] = wrk.format("GET", [[/api/alerts?limit=20]], {}, nil)
+requests[129] = wrk.format("GET", [[/api/articles?limit=10]], {}, nil)
+requests[130] = wrk.format("GET", [[/api/audits?limit=5]], {}, nil)
+requests[131] = wrk.format("GET", [[/api/carts?limit=50]], {}, nil)
+requests[132] = wrk.format("GET", [[/api/categories?limit=20]], {}, nil)
+requests[133] = wrk.format("GET", [[/api/comments?limit=10]], {}, nil)
+requests[134] = wrk.format("GET", [[/api/coupons?limit=5]], {}, nil)
+requests[135] = wrk.format("GET", [[/api/devices?limit=50]], {}, nil)
+requests[136] = wrk.format("GET", [[/api/events?limit=20]], {}, nil)
+requests[137] = wrk.format("GET", [[/api/files?limit=10]], {}, nil)
+requests[138] = wrk.format("GET", [[/api/groups?limit=5]], {}, nil)
+requests[139] = wrk.format("GET", [[/api/invoices?limit=50]], {}, nil)
+requests[140] = wrk.format("GET", [[/api/messages?limit=20]], {}, nil)
+requests[141] = wrk.format("GET", [[/api/notifications?limit=10]], {}, nil)
+requests[142] = wrk.format("GET", [[/api/payments?limit=5]], {}, nil)
+requests[143] = wrk.format("GET", [[/api/products?limit=50]], {}, nil)
+requests[144] = wrk.format("GET", [[/api/projects?limit=20]], {}, nil)
+requests[145] = wrk.format("GET", [[/api/reviews?limit=10]], {}, nil)
+requests[146] = wrk.format("GET", [[/api/sessions?limit=5]], {}, nil)
+requests[147] = wrk.format("GET", [[/api/shipments?limit=50]], {}, nil)
+requests[148] = wrk.format("GET", [[/api/subscriptions?limit=20]], {}, nil)
+requests[149] = wrk.format("GET", [[/api/tickets?limit=10]], {}, nil)
+requests[150] = wrk.format("GET", [[/api/webhooks?limit=5]], {}, nil)
+requests[151] = wrk.format("GET", [[/api/accounts/2/children]], {}, nil)
+requests[152] = wrk.format("GET", [[/api/addresses/7921/children]], {}, nil)
+requests[153] = wrk.format("GET", [[/api/alerts/15840/children]], {}, nil)
+requests[154] = wrk.format("GET", [[/api/articles/23759/children]], {}, nil)
+requests[155] = wrk.format("GET", [[/api/audits/31678/children]], {}, nil)
+requests[156] = wrk.format("GET", [[/api/carts/39597/children]], {}, nil)
+requests[157] = wrk.format("GET", [[/api/categories/47516/children]], {}, nil)
+requests[158] = wrk.format("GET", [[/api/comments/55435/children]], {}, nil)
+requests[159] = wrk.format("GET", [[/api/coupons/63354/children]], {}, nil)
+requests[160] = wrk.format("GET", [[/api/devices/71273/children]], {}, nil)
+requests[161] = wrk.format("GET", [[/api/events/79192/children]], {}, nil)
+requests[162] = wrk.format("GET", [[/api/files/87111/children]], {}, nil)
+requests[163] = wrk.format("GET", [[/api/groups/95030/children]], {}, nil)
+requests[164] = wrk.format("GET", [[/api/invoices/2949/children]], {}, nil)
+requests[165] = wrk.format("GET", [[/api/messages/10868/children]], {}, nil)
+requests[166] = wrk.format("GET", [[/api/notifications/18787/children]], {}, nil)
+requests[167] = wrk.format("GET", [[/api/payments/26706/children]], {}, nil)
+requests[168] = wrk.format("GET", [[/api/products/34625/children]], {}, nil)
+requests[169] = wrk.format("GET", [[/api/projects/42544/children]], {}, nil)
+requests[170] = wrk.format("GET", [[/api/reviews/50463/children]], {}, nil)
+requests[171] = wrk.format("GET", [[/api/sessions/58382/children]], {}, nil)
+requests[172] = wrk.format("GET", [[/api/shipments/66301/children]], {}, nil)
+requests[173] = wrk.format("GET", [[/api/subscriptions/74220/children]], {}, nil)
+requests[174] = wrk.format("GET", [[/api/tickets/82139/children]], {}, nil)
+requests[175] = wrk.format("GET", [[/api/webhooks/90058/children]], {}, nil)
+requests[176] = wrk.format("GET", [[/api/accounts/97977/children]], {}, nil)
+requests[177] = wrk.format("GET", [[/api/addresses/5896/children]], {}, nil)
+requests[178] = wrk.format("GET", [[/api/alerts/13815/children]], {}, nil)
+requests[179] = wrk.format("GET", [[/api/articles/21734/children]], {}, nil)
+requests[180] = wrk.format("GET", [[/api/audits/29653/children]], {}, nil)
+requests[181] = wrk.format("GET", [[/api/carts/37572/children]], {}, nil)
+requests[182] = wrk.format("GET", [[/api/categories/45491/children]], {}, nil)
+requests[183] = wrk.format("GET", [[/api/comments/53410/children]], {}, nil)
+requests[184] = wrk.format("GET", [[/api/coupons/61329/children]], {}, nil)
+requests[185] = wrk.format("GET", [[/api/devices/69248/children]], {}, nil)
+requests[186] = wrk.format("GET", [[/api/events/77167/children]], {}, nil)
+requests[187] = wrk.format("GET", [[/api/files/85086/children]], {}, nil)
+requests[188] = wrk.format("GET", [[/api/groups/93005/children]], {}, nil)
+requests[189] = wrk.format("GET", [[/api/invoices/924/children]], {}, nil)
+requests[190] = wrk.format("GET", [[/api/messages/8843/children]], {}, nil)
+requests[191] = wrk.format("GET", [[/api/notifications/16762/children]], {}, nil)
+requests[192] = wrk.format("GET", [[/api/payments/24681/children]], {}, nil)
+requests[193] = wrk.format("GET", [[/api/products/32600/children]], {}, nil)
+requests[194] = wrk.format("GET", [[/api/projects/40519/children]], {}, nil)
+requests[195] = wrk.format("GET", [[/api/reviews/48438/children]], {}, nil)
+requests[196] = wrk.format("GET", [[/api/sessions/56357/children]], {}, nil)
+requests[197] = wrk.format("GET", [[/api/shipments/64276/children]], {}, nil)
+requests[198] = wrk.format("GET", [[/api/subscriptions/72195/children]], {}, nil)
+requests[199] = wrk.format("GET", [[/api/tickets/80114/children]], {}, nil)
+requests[200] = wrk.format("GET", [[/api/webhooks/88033/children]], {}, nil)
+requests[201] = wrk.format("POST", [[/api/accounts]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[202] = wrk.format("POST", [[/api/addresses]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[203] = wrk.format("POST", [[/api/alerts]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[204] = wrk.format("POST", [[/api/articles]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[205] = wrk.format("POST", [[/api/audits]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[206] = wrk.format("POST", [[/api/carts]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[207] = wrk.format("POST", [[/api/categories]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[208] = wrk.format("POST", [[/api/comments]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[209] = wrk.format("POST", [[/api/coupons]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[210] = wrk.format("POST", [[/api/devices]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[211] = wrk.format("POST", [[/api/events]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[212] = wrk.format("POST", [[/api/files]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[213] = wrk.format("POST", [[/api/groups]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[214] = wrk.format("POST", [[/api/invoices]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[215] = wrk.format("POST", [[/api/messages]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[216] = wrk.format("POST", [[/api/notifications]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[217] = wrk.format("POST", [[/api/payments]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[218] = wrk.format("POST", [[/api/products]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[219] = wrk.format("POST", [[/api/projects]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[220] = wrk.format("POST", [[/api/reviews]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[221] = wrk.format("POST", [[/api/sessions]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[222] = wrk.format("POST", [[/api/shipments]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[223] = wrk.format("POST", [[/api/subscriptions]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[224] = wrk.format("POST", [[/api/tickets]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[225] = wrk.format("POST", [[/api/webhooks]], {["Content-Type"] = "application/json"}, [[{"name":"new","tags":["imported","bulk"]}]])
+requests[226] = wrk.format("GET", [[/scenario/users?n=1]], {}, nil)
+requests[227] = wrk.format("GET", [[/scenario/users?n=10]], {}, nil)
+requests[228] = wrk.format("GET", [[/scenario/users?n=25]], {}, nil)
+requests[229] = wrk.format("GET", [[/ping]], {}, nil)
+local cycle = {229, 226, 227, 228, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 229, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 226, 227, 228, 30, 31, 32, 33, 34, 35, 229, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 229, 57, 58, 226, 227, 228, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 229, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 226, 227, 228, 89, 90, 91, 229, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 229, 113, 114, 115, 116, 117, 226, 227, 228, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 229, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 226, 227, 228, 229, 148, 149, 150, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 229, 219, 220, 221, 222, 223, 224, 225, 226, 227, 228, 151, 152, 153, 154, 155, 156, 229, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 226, 227, 228, 174, 229, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 229, 195, 196, 197, 198, 199, 200, 226, 227, 228, 229, 1, 2, 3, 4, 5, 6, 226, 227, 228, 7, 8, 9, 10, 11, 12, 13, 229, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 229, 35, 226, 227, 228, 36, 37, 38, 225, 224, 39, 40, 41, 223, 222, 42, 221, 220, 43, 44, 45, 219, 229, 46, 218, 217, 47, 48, 49, 216, 215, 50, 214, 213, 51, 52, 226, 227, 228, 53, 212, 211, 54, 229, 210, 209, 55, 56, 208, 207, 57, 206, 205, 58, 204, 203, 202, 201, 59, 60, 61, 150, 149, 62, 148, 229, 63, 64, 65, 66, 226, 227, 228, 67, 68, 69, 147, 146, 70, 145, 144, 71, 72, 73, 143, 142, 141, 229, 140, 74, 75, 76, 139, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 226, 227, 228, 89, 229, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 229, 110, 111, 112, 113, 114, 115, 116, 117, 226, 227, 228, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 229, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 226, 227, 228, 229, 151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 229, 168, 169, 170, 171, 226, 227, 228, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 229, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 226, 227, 228, 229, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 229, 13, 226, 227, 228, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 229, 31, 32, 33, 34, 35, 36, 37, 38, 224, 225, 39, 40, 41, 226, 227, 228, 223, 222, 42, 138, 229, 136, 137, 220, 221, 135, 134, 132, 133, 43, 44, 45, 131, 130, 129, 219, 128, 127, 46, 126, 125, 124, 229, 217, 218, 123, 122, 226, 227, 228, 47, 48, 49, 121, 120, 119, 216, 118, 215, 50, 117, 116, 213, 214, 229, 115, 114, 113, 51, 52, 53, 112, 212, 111, 211, 54, 110, 210, 209, 55, 56, 226, 227, 228, 109, 208, 229, 108, 207, 57, 107, 206, 106, 205, 58, 104, 105, 203, 204, 102, 103, 201, 202, 59, 60, 61, 100, 229, 101, 149, 150, 62, 98, 99, 148, 226, 227, 228, 63, 64, 65, 96, 97, 66, 67, 68, 69, 94, 95, 229, 147, 70, 92, 93, 145, 146, 71, 72, 73, 90, 91, 143, 144, 89, 141, 142, 74, 75, 76, 226, 227, 228, 229, 139, 140, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 229, 226, 227, 228, 151, 152, 153, 154, 155, 156, 157, 229, 158, 159, 160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 226, 227, 228, 171, 172, 173, 174, 229, 175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 229, 196, 197, 198, 226, 227, 228, 199, 200, 1, 2, 3, 4, 5, 6, 7, 8, 229, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 226, 227, 228, 22, 23, 24, 25, 26, 229, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 224, 225, 39, 40, 41, 223, 87, 88, 229, 86, 222, 85, 42, 226, 227, 228, 83, 84, 82, 81, 79, 80, 78, 138, 139, 140, 77, 136, 76, 137, 229, 142, 220, 221, 75, 135, 141, 144, 74, 89, 134, 143, 91, 132, 133, 43, 44, 226, 227, 228, 45, 90, 229, 131, 73, 130, 72, 129, 146, 219, 71, 128, 145, 93, 92, 127, 147, 46, 70, 126, 95, 125, 69, 94, 229, 123, 124, 217, 218, 47, 48, 226, 227, 228, 49, 67, 68, 97, 121, 122, 65, 66, 96, 119, 120, 229, 216, 63, 64, 118, 215, 50, 148, 98, 99, 116, 117, 150, 213, 214, 62, 101, 114, 115, 149, 226, 227, 228, 229, 51, 52, 53, 100, 112, 113, 212, 54, 60, 61, 110, 111, 202, 210, 211, 55, 56, 59, 103, 109, 229, 201, 204, 208, 209, 57, 102, 105, 107, 108, 226, 227, 228, 203, 206, 207, 58, 104, 106, 205, 229, 226, 227, 228, 229, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 229, 226, 227, 228, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 205, 229, 106, 104, 207, 206, 58, 203, 36, 108, 107, 105, 209, 102, 226, 227, 228, 208, 57, 204, 201, 37, 109, 229, 103, 38, 59, 211, 56, 210, 55, 202, 111, 110, 61, 224, 212, 60, 54, 113, 100, 112, 225, 53, 229, 52, 51, 39, 226, 227, 228, 40, 149, 115, 41, 114, 101, 214, 62, 213, 150, 117, 116, 223, 87, 88, 229, 99, 148, 215, 50, 86, 98, 118, 222, 64, 85, 216, 42, 63, 83, 84, 226, 227, 228, 82, 120, 81, 229, 119, 79, 80, 96, 66, 78, 122, 138, 139, 140, 65, 77, 121, 97, 136, 68, 67, 76, 137, 142, 220, 229, 221, 49, 75, 135, 141, 144, 226, 227, 228, 74, 89, 134, 143, 43, 44, 45, 90, 91, 131, 132, 229, 133, 47, 48, 72, 73, 129, 130, 146, 217, 218, 219, 71, 93, 123, 124, 128, 145, 46, 70, 226, 227, 228, 229, 92, 94, 125, 126, 127, 147, 69, 95, 171, 172, 173, 165, 166, 167, 168, 229, 169, 170, 174, 175, 176, 177, 226, 227, 228, 178, 179, 180, 181, 182, 183, 185, 162, 163, 164, 184, 186, 229, 187, 188, 158, 159, 160, 161, 189, 190, 191, 193, 155, 156, 157, 192, 194, 195, 196, 226, 227, 228, 229, 151, 152, 153, 154, 197, 198, 199, 200, 229, 226, 227, 228, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 229, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 226, 227, 228, 27, 28, 29, 30, 31, 32, 229, 33, 34, 35, 205, 106, 104, 207, 206, 58, 203, 36, 108, 107, 105, 102, 209, 208, 57, 201, 204, 37, 229, 109, 38, 226, 227, 228, 103, 59, 56, 211, 210, 55, 202, 111, 110, 61, 212, 224, 60, 54, 113, 229, 95, 147, 69, 100, 127, 126, 112, 125, 225, 94, 53, 92, 52, 70, 145, 226, 227, 228, 46, 51, 128, 229, 124, 123, 40, 93, 149, 219, 39, 71, 115, 218, 41, 114, 217, 101, 146, 214, 62, 130, 213, 129, 150, 229, 73, 117, 72, 116, 223, 226, 227, 228, 48, 87, 88, 99, 133, 148, 215, 47, 50, 86, 64, 85, 98, 229, 118, 132, 216, 222, 42, 63, 82, 83, 84, 91, 120, 131, 45, 79, 80, 81, 90, 226, 227, 228, 229, 96, 119, 43, 44, 65, 66, 77, 78, 121, 122, 134, 138, 139, 140, 143, 68, 74, 89, 97, 136, 49, 229, 67, 75, 76, 135, 137, 141, 142, 144, 226, 227, 228, 220, 221, 229, 171, 172, 173, 165, 166, 167, 168, 169, 170, 174, 175, 176, 226, 227, 228, 177, 178, 179, 229, 180, 181, 182, 183, 185, 162, 163, 164, 184, 186, 187, 188, 158, 159, 160, 161, 189, 190, 191, 193, 229, 155, 156, 157, 192, 194, 226, 227, 228, 195, 196, 151, 152, 153, 154, 197, 198, 199, 200, 229, 1, 2, 3, 4, 226, 227, 228, 5, 6, 7, 8, 9, 10, 229, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 229, 32, 33, 226, 227, 228, 34, 35, 205, 106, 104, 207, 206, 58, 203, 36, 108, 107, 105, 102, 209, 229, 208, 57, 201, 204, 37, 109, 38, 103, 59, 221, 220, 56, 144, 211, 142, 226, 227, 228, 137, 141, 210, 229, 135, 55, 76, 75, 67, 202, 136, 49, 97, 111, 89, 74, 143, 68, 110, 140, 139, 61, 138, 134, 122, 229, 212, 224, 121, 60, 78, 226, 227, 228, 77, 54, 66, 113, 65, 95, 147, 44, 69, 100, 119, 127, 43, 229, 96, 126, 112, 125, 225, 94, 53, 92, 52, 90, 80, 81, 45, 46, 51, 70, 79, 226, 227, 228, 229, 120, 128, 131, 145, 84, 91, 123, 124, 39, 40, 71, 82, 83, 93, 115, 149, 218, 219, 41, 42, 63, 229, 101, 114, 146, 214, 216, 217, 222, 62, 226, 227, 228, 118, 129, 130, 132, 150, 213, 72, 73, 98, 116, 229, 117, 223, 47, 48, 50, 64, 85, 86, 87, 88, 99, 133, 148, 215, 226, 227, 228, 229, 171, 172, 173, 165, 166, 167, 168, 169, 229, 170, 174, 226, 227, 228, 175, 176, 177, 178, 179, 180, 181, 182, 183, 185, 162, 163, 164, 184, 186, 229, 187, 188, 158, 159, 160, 161, 189, 190, 191, 193, 155, 156, 157, 192, 226, 227, 228, 194, 195, 196, 151, 229, 152, 153, 154, 197, 198, 199, 200, 1, 2, 3, 4, 5, 6, 7, 8, 9, 229, 10, 226, 227, 228, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 229, 28, 29, 30, 31, 32, 33, 34, 35, 205, 106, 104, 207, 206, 226, 227, 228, 58, 203, 36, 108, 229, 107, 105, 102, 209, 208, 57, 204, 215, 148, 201, 133, 88, 99, 37, 87, 86, 64, 85, 50, 223, 48, 229, 109, 117, 47, 98, 226, 227, 228, 116, 73, 150, 213, 38, 72, 132, 130, 129, 118, 103, 222, 62, 217, 229, 59, 216, 221, 214, 220, 56, 146, 114, 101, 144, 211, 142, 63, 137, 141, 210, 42, 226, 227, 228, 41, 229, 55, 76, 135, 218, 219, 67, 75, 115, 149, 202, 49, 83, 93, 97, 111, 136, 71, 74, 82, 89, 229, 143, 39, 40, 68, 110, 123, 124, 139, 226, 227, 228, 140, 61, 84, 91, 131, 134, 138, 145, 120, 121, 229, 122, 128, 212, 224, 60, 77, 78, 54, 65, 66, 95, 113, 147, 43, 44, 69, 70, 79, 96, 100, 226, 227, 228, 229, 119, 126, 127, 46, 51, 81, 90, 92, 94, 112, 125, 225, 45, 52, 53, 80, 229, 226, 227, 228, 229, 1, 2, 3, 4, 5, 6, 7, 8, 9, 226, 227, 228, 10, 11, 12, 13, 14, 15, 16, 229, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 205, 106, 229, 104, 226, 227, 228, 207, 206, 58, 203, 36, 108, 80, 53, 107, 225, 52, 125, 45, 112, 94, 92, 90, 229, 105, 81, 127, 51, 126, 46, 119, 102, 100, 96, 79, 209, 70, 226, 227, 228, 69, 147, 44, 113, 229, 43, 95, 65, 66, 78, 208, 224, 54, 60, 77, 212, 128, 122, 121, 145, 57, 120, 138, 134, 131, 91, 229, 84, 140, 61, 204, 226, 227, 228, 215, 148, 201, 133, 88, 99, 139, 37, 87, 124, 86, 123, 64, 85, 229, 110, 50, 68, 223, 40, 48, 109, 117, 143, 39, 47, 89, 98, 116, 73, 82, 226, 227, 228, 150, 213, 229, 38, 72, 74, 132, 136, 71, 111, 130, 93, 97, 118, 129, 49, 83, 103, 149, 202, 62, 75, 115, 229, 217, 219, 222, 59, 67, 135, 214, 226, 227, 228, 216, 218, 220, 221, 55, 56, 76, 114, 146, 41, 101, 229, 142, 144, 211, 42, 63, 137, 141, 210, 162, 164, 177, 178, 226, 227, 228, 179, 229, 180, 181, 182, 183, 185, 186, 187, 163, 175, 176, 184, 188, 158, 159, 160, 161, 170, 174, 189, 190, 191, 229, 167, 168, 169, 172, 173, 193, 226, 227, 228, 155, 156, 157, 165, 166, 171, 192, 194, 195, 196, 151, 229, 152, 153, 154, 197, 198, 199, 200, 226, 227, 228, 229, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 229, 16, 226, 227, 228, 17, 18, 19}
+local position = 0
+
+init = function(args)
+  -- threads start at different offsets of the cycle
+  position = math.random(#cycle) - 1
+end
+
+request = function()
+  position = position % #cycle + 1
+  return requests[cycle[position]]
+end
+
+done = function(summary, latency, requests)
+  local e = summary.errors
+  io.write(string.format(
+    '__WRK_SUMMARY__ {"requests":%d,"duration_us":%d,"bytes":%d,'
+    .. '"latency":{"min":%d,"max":%d,"mean":%.2f,"stdev":%.2f,'
+    .. '"p50":%d,"p75":%d,"p90":%d,"p99":%d,"p999":%d},'
+    .. '"errors":{"connect":%d,"read":%d,"write":%d,"timeout":%d,"status":%d}}\n',
+    summary.requests, summary.duration, summary.bytes,
+    latency.min, latency.max, latency.mean, latency.stdev,
+    latency:percentile(50), latency:percentile(75), latency:percentile(90),
+    latency:percentile(99), latency:percentile(99.9),
+    e.connect, e.read, e.write, e.timeout, e.status
+  ))
+end
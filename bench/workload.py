@@ -0,0 +1,97 @@
+"""
+Mixed-traffic workload files: a weighted request mix over many routes.
+
+A workload is a JSONL file in `bench/tests/`, one request template per line:
+
+    {"method": "GET", "path": "/api/{resource}/{id}",
+     "params": {"resource": ["users", "orders"], "id": {"min": 1, "max": 10000}},
+     "query": {"fields": "{resource}"}, "weight": 40, "distinct": 50}
+
+`{name}` placeholders in `path` and in string `query` values are filled from
+`params`, a list of values or an inclusive integer range. Each template is
+expanded into `distinct` requests with different parameter values that share
+its `weight`, so the mix spreads over many routes and path parameters instead
+of one cached lookup. A test in `test.json` uses it with `"workload": "<file>"`
+and replays it through wrk's `request()` hook or the built-in generator.
+"""
+
+from typing import Any
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from msgspec import DecodeError, ValidationError
+from msgspec.json import decode
+
+from .data_manager import Base, RequestVariant
+
+
+class ParamRange(Base):
+    min: int
+    max: int  # inclusive
+
+
+class WorkloadEntry(Base):
+    method: str
+    path: str  # template, e.g. "/api/{resource}/{id}"
+    params: dict[str, list[Any] | ParamRange] = {}
+    query: dict[str, Any] = {}
+    body: Any = None  # JSON body, sent as is
+    weight: float = 1.0  # share of the mix, relative to the other entries
+    distinct: int = 1  # parameter combinations the weight is spread over
+
+
+def load_workload(path) -> list[WorkloadEntry]:
+    """Entries of a workload file, blank lines ignored."""
+    entries = []
+    with open(path, "rb") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(decode(line, type=WorkloadEntry))
+            except (DecodeError, ValidationError) as e:
+                raise ValueError(f"{path}:{lineno}: {e}") from e
+    return entries
+
+
+def param_value(spec: list[Any] | ParamRange, idx: int, salt: int) -> Any:
+    """Deterministic value number `idx` of a parameter.
+
+    Every parameter walks its values with a different stride (`salt`), so
+    combinations of several parameters do not repeat in lockstep.
+    """
+    if isinstance(spec, ParamRange):
+        span = spec.max - spec.min + 1
+        return spec.min + (idx * 7919 + salt) % span
+    return spec[(idx * (2 * salt + 1) + salt) % len(spec)]
+
+
+def expand_entry(entry: WorkloadEntry, base_url: str) -> list[RequestVariant]:
+    """`entry.distinct` concrete requests sharing the entry's weight."""
+    base = urlsplit(base_url)
+    variants = []
+    for idx in range(max(entry.distinct, 1)):
+        values = {
+            name: param_value(spec, idx, salt)
+            for salt, (name, spec) in enumerate(entry.params.items())
+        }
+        query = {
+            key: value.format_map(values) if isinstance(value, str) else value
+            for key, value in entry.query.items()
+        }
+        url = urlunsplit(
+            base._replace(path=entry.path.format_map(values), query=urlencode(query))
+        )
+        variants.append(
+            RequestVariant(
+                method=entry.method,
+                url=url,
+                data=entry.body,
+                weight=entry.weight / max(entry.distinct, 1),
+            )
+        )
+    return variants
+
+
+def workload_mix(entries: list[WorkloadEntry], base_url: str) -> list[RequestVariant]:
+    """The whole mix, on the host and port of `base_url`."""
+    return [variant for entry in entries for variant in expand_entry(entry, base_url)]
@@ -3,8 +3,8 @@ import matplotlib.pyplot as plt
 from pathlib import Path
 
 
-def load_results() -> dict[str, dict[str, float]]:
-    """Load benchmark results from JSON file."""
+def load_raw_results() -> dict[str, dict]:
+    """Load benchmark results from JSON file as stored by the runner."""
     results_path = Path("benchmark_results.json")
     if results_path.exists():
         with open(results_path, 'r') as f:
@@ -12,6 +12,20 @@ def load_results() -> dict[str, dict[str, float]]:
     return {}
 
 
+def load_results() -> dict[str, dict[str, float]]:
+    """Load benchmark results as `{benchmark: {framework: rps}}`."""
+    results = {}
+    for name, entry in load_raw_results().items():
+        if entry.get("sweep") or entry.get("matrix"):
+            continue
+        if "results" in entry:
+            # full results: list of framework results with latency/error details
+            results[name] = {r["framework"]: r["rps"] for r in entry["results"]}
+        else:
+            results[name] = entry
+    return results
+
+
 # Load results from JSON file
 results = load_results()
 COMPLEX_RESULT = results.get("complex", {})
@@ -20,18 +34,62 @@ PING_PONG_RESULT = results.get("ping_pong", {})
 # Sort frameworks by RPS descending
 
 
-def make_graph(result: dict[str, float], save_dir: str, graph_name: str):
+def load_trial_info(name: str) -> tuple[dict[str, tuple[float, float]], list[list[str]]]:
+    """Confidence intervals `{framework: (low, high)}` and tied pairs of a benchmark."""
+    entry = load_raw_results().get(name, {})
+    intervals = {
+        r["framework"]: (r["trials"]["ci_low"], r["trials"]["ci_high"])
+        for r in entry.get("results", [])
+        if r.get("trials")
+    }
+    return intervals, entry.get("ties") or []
+
+
+def make_graph(
+    result: dict[str, float],
+    save_dir: str,
+    graph_name: str,
+    intervals: dict[str, tuple[float, float]] | None = None,
+    ties: list[list[str]] | None = None,
+):
     # Create the bar chart
     sorted_frameworks, sorted_rps = zip(
         *dict(sorted(result.items(), key=lambda item: item[1], reverse=True)).items()
     )
 
+    # Confidence intervals as asymmetric error bars, when trials were run
+    yerr = None
+    if intervals:
+        lows, highs = zip(
+            *(intervals.get(fw, (rps, rps)) for fw, rps in zip(sorted_frameworks, sorted_rps))
+        )
+        yerr = [
+            [rps - low for rps, low in zip(sorted_rps, lows)],
+            [high - rps for rps, high in zip(sorted_rps, highs)],
+        ]
+
     plt.figure(figsize=(10, 6))
     bars = plt.bar(
         sorted_frameworks,
         sorted_rps,
+        yerr=yerr,
+        capsize=6 if yerr else 0,
     )
 
+    # Hatch frameworks that are statistically tied with a neighbour
+    tied = {framework for pair in ties or [] for framework in pair}
+    for bar, framework in zip(bars, sorted_frameworks):
+        if framework in tied:
+            bar.set_hatch("//")
+    if ties:
+        plt.figtext(
+            0.01,
+            0.01,
+            "Statistically tied (overlapping 95% CIs): "
+            + "; ".join(" ≈ ".join(pair) for pair in ties),
+            fontsize=8,
+        )
+
     # Add labels and title
     plt.xlabel("Framework (Sorted by RPS)")
     plt.ylabel("Requests per Second (RPS)")
@@ -53,6 +111,296 @@ def make_graph(result: dict[str, float], save_dir: str, graph_name: str):
     plt.close()
 
 
+# Scenario sweep panels shown when their field was recorded:
+# (point field, value of a point, y label, title)
+EXTRA_SWEEP_PANELS = [
+    (
+        "bytes_per_sec",
+        lambda point: point["bytes_per_sec"] / 1024 / 1024,
+        "Payload throughput (MB/s)",
+        "Payload throughput",
+    ),
+    ("ttfb", lambda point: point["ttfb"]["p50"] / 1000, "TTFB p50 (ms)", "Time to first byte"),
+    (
+        "resources",
+        lambda point: point["resources"]["peak_rss_mb"],
+        "Peak server RSS (MB)",
+        "Server memory",
+    ),
+    ("startup_ms", lambda point: point["startup_ms"], "Startup (ms)", "Server startup"),
+    (
+        "overhead_us",
+        lambda point: point["overhead_us"],
+        "Overhead (µs per request)",
+        "Per-request overhead",
+    ),
+]
+
+
+def make_sweep_graph(entry: dict, save_dir: str, graph_name: str):
+    """Plot RPS and p99 latency against the swept parameter, one line per framework.
+
+    Scenario sweeps add panels for payload throughput, time to first byte
+    and server memory, routing sweeps one for startup time, DI sweeps one
+    for per-request overhead, see `EXTRA_SWEEP_PANELS`. Results of one framework that differ by `variant`
+    (e.g. the position of the requested route) get a line each.
+    """
+    sweep = entry["sweep"]
+    points = [point for result in entry["results"] for point in result.get("curve") or []]
+    extra = [
+        panel for panel in EXTRA_SWEEP_PANELS
+        if any(point.get(panel[0]) is not None for point in points)
+    ]
+    fig, axes = plt.subplots(1, 2 + len(extra), figsize=(7 * (2 + len(extra)), 6))
+    rps_ax, p99_ax, *extra_axes = axes
+
+    for result in entry["results"]:
+        curve = sorted(result.get("curve") or [], key=lambda point: point["value"])
+        if not curve:
+            continue
+        values = [point["value"] for point in curve]
+        rps = [point["rps"] for point in curve]
+        label = result["framework"]
+        if result.get("variant"):
+            label += f" ({result['variant']})"
+        (line,) = rps_ax.plot(values, rps, marker="o", label=label)
+
+        latency_points = [p for p in curve if p.get("latency")]
+        p99_ax.plot(
+            [point["value"] for point in latency_points],
+            [point["latency"]["p99"] / 1000 for point in latency_points],
+            marker="o",
+            color=line.get_color(),
+            label=label,
+        )
+
+        for ax, (field, value, _, _) in zip(extra_axes, extra):
+            recorded = [p for p in curve if p.get(field) is not None]
+            ax.plot(
+                [point["value"] for point in recorded],
+                [value(point) for point in recorded],
+                marker="o",
+                color=line.get_color(),
+                label=label,
+            )
+
+        # Mark the saturation point on both curves
+        knee = result.get("knee")
+        if knee is not None:
+            rps_ax.axvline(knee, color=line.get_color(), linestyle=":", alpha=0.6)
+            p99_ax.axvline(knee, color=line.get_color(), linestyle=":", alpha=0.6)
+
+    for ax in axes:
+        if min((point["value"] for point in points), default=1) > 0:
+            ax.set_xscale("log", base=2)
+        else:
+            # sweeps starting at 0 (e.g. DI depth) stay linear around their baseline
+            ax.set_xscale("symlog", base=2, linthresh=1)
+        ax.set_xlabel(sweep.capitalize())
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+    rps_ax.set_ylabel("Requests per Second (RPS)")
+    rps_ax.set_title(f"RPS vs {sweep}")
+    p99_ax.set_ylabel("p99 latency (ms)")
+    p99_ax.set_yscale("log")
+    p99_ax.set_title(f"p99 latency vs {sweep}")
+    for ax, (_, _, ylabel, title) in zip(extra_axes, extra):
+        ax.set_ylabel(ylabel)
+        ax.set_title(f"{title} vs {sweep}")
+
+    plt.tight_layout()
+    plt.savefig(save_dir + f"/{graph_name}.png")
+    plt.close()
+
+
+def make_matrix_graph(entry: dict, save_dir: str, graph_name: str):
+    """Grouped bars: one group per framework, one bar per variant."""
+    frameworks: list[str] = []
+    variants: list[str] = []
+    rps: dict[tuple[str, str], float] = {}
+    for result in entry["results"]:
+        framework, variant = result["framework"], result.get("variant") or "-"
+        if framework not in frameworks:
+            frameworks.append(framework)
+        if variant not in variants:
+            variants.append(variant)
+        rps[(framework, variant)] = result["rps"]
+
+    width = 0.8 / len(variants)
+    plt.figure(figsize=(max(10, len(frameworks) * len(variants) * 0.8), 6))
+    for idx, variant in enumerate(variants):
+        xs = [i + (idx - (len(variants) - 1) / 2) * width for i in range(len(frameworks))]
+        values = [rps.get((framework, variant), 0) for framework in frameworks]
+        bars = plt.bar(xs, values, width, label=variant)
+        for bar, value in zip(bars, values):
+            if value:
+                plt.text(
+                    bar.get_x() + bar.get_width() / 2,
+                    value,
+                    f"{value:.0f}",
+                    ha="center",
+                    va="bottom",
+                    fontsize=8,
+                )
+
+    plt.xticks(range(len(frameworks)), frameworks)
+    plt.ylabel("Requests per Second (RPS)")
+    plt.title(f"RPS by {entry['matrix']} ({entry['benchmark_name']})")
+    plt.legend(fontsize=8)
+    plt.tight_layout()
+    plt.savefig(save_dir + f"/{graph_name}.png")
+    plt.close()
+
+
+def make_gc_graph(entry: dict, save_dir: str, graph_name: str):
+    """GC pause histograms: one row per framework, one column per generation,
+    one bar per variant in every pause bucket."""
+    results = [r for r in entry["results"] if r.get("gc")]
+    if not results:
+        return
+    frameworks = list(dict.fromkeys(r["framework"] for r in results))
+    variants = list(dict.fromkeys(r.get("variant") or "-" for r in results))
+    generations = len(results[0]["gc"]["generations"])
+    bounds = results[0]["gc"]["bounds_us"]
+    labels = [f"<={b / 1000:g}" for b in bounds] + [f">{bounds[-1] / 1000:g}"]
+
+    fig, axes = plt.subplots(
+        len(frameworks),
+        generations,
+        figsize=(6 * generations, 3.5 * len(frameworks)),
+        squeeze=False,
+    )
+    width = 0.8 / len(variants)
+    for row, framework in enumerate(frameworks):
+        for result in (r for r in results if r["framework"] == framework):
+            idx = variants.index(result.get("variant") or "-")
+            for generation in result["gc"]["generations"]:
+                ax = axes[row][generation["generation"]]
+                xs = [i + (idx - (len(variants) - 1) / 2) * width for i in range(len(labels))]
+                ax.bar(
+                    xs,
+                    generation["histogram"],
+                    width,
+                    label=result.get("variant"),
+                    color=plt.cm.tab10(idx),
+                )
+        for col in range(generations):
+            ax = axes[row][col]
+            ax.set_title(f"{framework} gen{col}", fontsize=10)
+            ax.set_xticks(range(len(labels)))
+            ax.set_xticklabels(labels, rotation=45, fontsize=7)
+            ax.set_xlabel("Pause (ms)")
+            ax.set_ylabel("Collections")
+    axes[0][0].legend(fontsize=8)
+    fig.suptitle(f"GC pauses by variant ({entry['benchmark_name']})")
+    fig.tight_layout()
+    fig.savefig(save_dir + f"/{graph_name}.png")
+    plt.close(fig)
+
+
+def make_stage_graph(entry: dict, save_dir: str, graph_name: str):
+    """Stacked bars: time per request of each stage, one bar per framework."""
+    results = [r for r in entry["results"] if r.get("stages")]
+    results.sort(key=lambda r: sum(s["mean_ns"] for s in r["stages"]["stages"]))
+    frameworks = [r["framework"] for r in results]
+    stages = [s["stage"] for s in results[0]["stages"]["stages"]]
+
+    plt.figure(figsize=(12, max(4, len(frameworks) * 0.8)))
+    left = [0.0] * len(results)
+    for idx, stage in enumerate(stages):
+        widths = [
+            next((s["mean_ns"] for s in r["stages"]["stages"] if s["stage"] == stage), 0) / 1000
+            for r in results
+        ]
+        plt.barh(frameworks, widths, left=left, label=stage, color=plt.cm.tab10(idx))
+        left = [l + w for l, w in zip(left, widths)]
+
+    for y, (total, result) in enumerate(zip(left, results)):
+        overhead = result["stages"].get("overhead_ns")
+        label = f"{total:.1f}us"
+        if overhead is not None:
+            label += f" (timers {overhead / 1000:+.1f}us)"
+        plt.text(total, y, " " + label, va="center", fontsize=8)
+
+    plt.xlabel("Time per request (us), stages timed in-process")
+    plt.title(f"Request stages ({entry['benchmark_name']})")
+    plt.legend(fontsize=8, loc="lower right")
+    plt.tight_layout()
+    plt.savefig(save_dir + f"/{graph_name}.png")
+    plt.close()
+
+
+def make_coldstart_graph(entry: dict, save_dir: str, graph_name: str):
+    """Stacked bars: median spawn-to-first-response time split into the
+    interpreter, imports, app construction and the rest, one bar per framework."""
+    results = [r for r in entry["results"] if r.get("coldstart")]
+    results.sort(key=lambda r: r["coldstart"]["ready_ms_p50"])
+    frameworks = [r["framework"] for r in results]
+    parts = {
+        "python": [r["coldstart"]["interpreter_ms"] for r in results],
+        "imports": [r["coldstart"]["import_ms"] for r in results],
+        "app": [r["coldstart"].get("app_ms") or 0.0 for r in results],
+    }
+    known = [sum(values) for values in zip(*parts.values())]
+    parts["server start + 1st request"] = [
+        max(r["coldstart"]["ready_ms_p50"] - k, 0.0) for r, k in zip(results, known)
+    ]
+
+    plt.figure(figsize=(12, max(4, len(frameworks) * 0.8)))
+    left = [0.0] * len(results)
+    for idx, (part, widths) in enumerate(parts.items()):
+        plt.barh(frameworks, widths, left=left, label=part, color=plt.cm.tab10(idx))
+        left = [l + w for l, w in zip(left, widths)]
+
+    for y, result in enumerate(results):
+        stats = result["coldstart"]
+        label = f" p50 {stats['ready_ms_p50']:.0f}ms, p95 {stats['ready_ms_p95']:.0f}ms"
+        plt.text(max(left[y], stats["ready_ms_p50"]), y, label, va="center", fontsize=8)
+
+    plt.xlabel("Spawn to first response (ms), median over fresh processes")
+    plt.title(f"Cold start ({entry['benchmark_name']})")
+    plt.legend(fontsize=8, loc="lower right")
+    plt.tight_layout()
+    plt.savefig(save_dir + f"/{graph_name}.png")
+    plt.close()
+
+
+def make_soak_graph(entry: dict, save_dir: str, graph_name: str):
+    """RSS, throughput and p99 latency over a soak run, one line per framework."""
+    results = [r for r in entry["results"] if r.get("soak")]
+    fig, (rss_ax, rps_ax, p99_ax) = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
+    for result in results:
+        report = result["soak"]
+        flags = [name for name in ("memory_growth", "fd_growth", "throughput_decay") if report[name]]
+        label = result["framework"] + (f" ({', '.join(flags)})" if flags else "")
+        rss_ax.plot(
+            [s["t"] / 3600 for s in report["resources"]],
+            [s["rss_mb"] for s in report["resources"]],
+            label=label,
+        )
+        # per-second values are noisy over hours, plot one-minute means of long runs
+        throughput = report["throughput"]
+        step = 60 if report["seconds"] > 1200 else 1
+        buckets: dict[int, list[dict]] = {}
+        for point in throughput:
+            buckets.setdefault(point["second"] // step, []).append(point)
+        hours = [bucket * step / 3600 for bucket in buckets]
+        rps_ax.plot(hours, [sum(p["requests"] for p in b) / len(b) for b in buckets.values()])
+        p99_ax.plot(hours, [sum(p["p99"] for p in b) / len(b) / 1000 for b in buckets.values()])
+
+    rss_ax.set_ylabel("RSS (MB)")
+    rps_ax.set_ylabel("RPS")
+    p99_ax.set_ylabel("p99 (ms)")
+    p99_ax.set_xlabel("Hours")
+    rss_ax.set_title(f"Soak ({entry['benchmark_name']})")
+    rss_ax.legend(fontsize=8)
+    for ax in (rss_ax, rps_ax, p99_ax):
+        ax.grid(alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(save_dir + f"/{graph_name}.png")
+    plt.close(fig)
+
+
 if __name__ == "__main__":
     # Reload results to ensure we have the latest data
     results = load_results()
@@ -60,6 +408,20 @@ if __name__ == "__main__":
     ping_pong_result = results.get("ping_pong", {})
     
     if complex_result:
-        make_graph(complex_result, "./assets", "bench_complex")
+        make_graph(complex_result, "./assets", "bench_complex", *load_trial_info("complex"))
     if ping_pong_result:
-        make_graph(ping_pong_result, "./assets", "bench_ping")
+        make_graph(ping_pong_result, "./assets", "bench_ping", *load_trial_info("ping_pong"))
+
+    for name, entry in load_raw_results().items():
+        if entry.get("sweep"):
+            make_sweep_graph(entry, "./assets", "bench_" + name.replace(":", "_"))
+        elif entry.get("matrix"):
+            make_matrix_graph(entry, "./assets", "bench_" + name.replace(":", "_"))
+            if entry["matrix"] == "gc":
+                make_gc_graph(entry, "./assets", "bench_" + name.replace(":", "_") + "_pauses")
+        elif any(r.get("stages") for r in entry.get("results", [])):
+            make_stage_graph(entry, "./assets", "bench_" + name.replace(":", "_"))
+        elif any(r.get("coldstart") for r in entry.get("results", [])):
+            make_coldstart_graph(entry, "./assets", "bench_" + name.replace(":", "_"))
+        elif any(r.get("soak") for r in entry.get("results", [])):
+            make_soak_graph(entry, "./assets", "bench_" + name.replace(":", "_"))